@@ -36,7 +36,10 @@ from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
 )
-from great_expectations.core.freshness_diagnostics import CheckpointFreshnessDiagnostics
+from great_expectations.core.freshness_diagnostics import (
+    CheckpointFreshnessDiagnostics,
+    freshness_cache,
+)
 from great_expectations.core.result_format import DEFAULT_RESULT_FORMAT, ResultFormatUnion
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.core.serdes import _IdentifierBundle
@@ -280,24 +283,27 @@ class Checkpoint(BaseModel):
         if not self.validation_definitions:
             raise CheckpointRunWithoutValidationDefinitionError()
 
-        diagnostics = self.is_fresh()
-        if not diagnostics.success:
-            # The checkpoint itself is not added but all children are - we can add it for the user
-            if not diagnostics.parent_added and diagnostics.children_added:
-                self._add_to_store()
-            else:
-                diagnostics.raise_for_error()
-
-        run_id = run_id or RunIdentifier(run_time=dt.datetime.now(dt.timezone.utc))
-        run_results = self._run_validation_definitions(
-            batch_parameters=batch_parameters,
-            expectation_parameters=expectation_parameters,
-            result_format=self.result_format,
-            run_id=run_id,
-        )
+        # Freshness is checked up front and again by each ValidationDefinition (and whenever
+        # this checkpoint is serialized); memoize so each resource is only fetched once per run.
+        with freshness_cache():
+            diagnostics = self.is_fresh()
+            if not diagnostics.success:
+                # The checkpoint itself is not added but all children are - add it for the user
+                if not diagnostics.parent_added and diagnostics.children_added:
+                    self._add_to_store()
+                else:
+                    diagnostics.raise_for_error()
+
+            run_id = run_id or RunIdentifier(run_time=dt.datetime.now(dt.timezone.utc))
+            run_results = self._run_validation_definitions(
+                batch_parameters=batch_parameters,
+                expectation_parameters=expectation_parameters,
+                result_format=self.result_format,
+                run_id=run_id,
+            )
 
-        checkpoint_result = self._construct_result(run_id=run_id, run_results=run_results)
-        self._run_actions(checkpoint_result=checkpoint_result)
+            checkpoint_result = self._construct_result(run_id=run_id, run_results=run_results)
+            self._run_actions(checkpoint_result=checkpoint_result)
 
         self._submit_analytics_event()
 
@@ -394,6 +400,10 @@ class Checkpoint(BaseModel):
         return priority_actions + secondary_actions
 
     def is_fresh(self) -> CheckpointFreshnessDiagnostics:
+        with freshness_cache():
+            return self._is_fresh()
+
+    def _is_fresh(self) -> CheckpointFreshnessDiagnostics:
         checkpoint_diagnostics = CheckpointFreshnessDiagnostics(
             errors=[] if self.id else [CheckpointNotAddedError(name=self.name)]
         )
@@ -406,6 +416,11 @@ class Checkpoint(BaseModel):
         store = project_manager.get_checkpoints_store()
         key = store.get_key(name=self.name, id=self.id)
 
+        # Avoid deserializing the persisted checkpoint (and re-fetching all of its
+        # validation definitions) when unchanged
+        if store.matches_persisted_value(key=key, value=self):
+            return CheckpointFreshnessDiagnostics(errors=[])
+
         try:
             checkpoint = store.get(key=key)
         except (
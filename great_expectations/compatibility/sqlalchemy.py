@@ -37,6 +37,11 @@ try:
 except (ImportError, AttributeError):
     sqlite = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
 
+try:
+    from sqlalchemy.dialects import postgresql
+except (ImportError, AttributeError):
+    postgresql = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
+
 try:
     from sqlalchemy.dialects import registry
 except (ImportError, AttributeError):
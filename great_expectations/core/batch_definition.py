@@ -9,6 +9,8 @@ from great_expectations.compatibility import pydantic
 # Partitioner class when we update forward refs, so we just import here.
 from great_expectations.core.freshness_diagnostics import (
     BatchDefinitionFreshnessDiagnostics,
+    content_hash,
+    get_or_check_freshness,
 )
 from great_expectations.core.partitioners import ColumnPartitioner, FileNamePartitioner
 from great_expectations.core.serdes import _EncodedValidationData, _IdentifierBundle
@@ -103,7 +105,10 @@ class BatchDefinition(pydantic.GenericModel, Generic[PartitionerT]):
         diagnostics = self._is_added()
         if not diagnostics.success:
             return diagnostics
-        return self._is_fresh()
+        return get_or_check_freshness(build_key=self._freshness_cache_key, check=self._is_fresh)
+
+    def _freshness_cache_key(self) -> tuple[str, ...]:
+        return type(self).__name__, str(self.id), content_hash(self.json(sort_keys=True))
 
     def _is_added(self) -> BatchDefinitionFreshnessDiagnostics:
         return BatchDefinitionFreshnessDiagnostics(
@@ -32,6 +32,8 @@ from great_expectations.compatibility.pydantic import ValidationError as Pydanti
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.freshness_diagnostics import (
     ExpectationSuiteFreshnessDiagnostics,
+    content_hash,
+    get_or_check_freshness,
 )
 from great_expectations.core.serdes import _IdentifierBundle
 from great_expectations.data_context.data_context.context_factory import project_manager
@@ -261,7 +263,11 @@ class ExpectationSuite(SerializableDictDot):
         diagnostics = self._is_added()
         if not diagnostics.success:
             return diagnostics
-        return self._is_fresh()
+        return get_or_check_freshness(build_key=self._freshness_cache_key, check=self._is_fresh)
+
+    def _freshness_cache_key(self) -> tuple[str, ...]:
+        payload = json.dumps(self.to_json_dict(), sort_keys=True)
+        return type(self).__name__, str(self.id), content_hash(payload)
 
     def _is_added(self) -> ExpectationSuiteFreshnessDiagnostics:
         return ExpectationSuiteFreshnessDiagnostics(
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import ClassVar, Tuple, Type
+from typing import (
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.exceptions import (
@@ -111,3 +124,62 @@ class CheckpointFreshnessDiagnostics(_ParentFreshnessDiagnostics):
     raise_for_error_class: ClassVar[Type[ResourceFreshnessAggregateError]] = (
         CheckpointRelatedResourcesFreshnessError
     )
+
+
+_FreshnessDiagnosticsT = TypeVar("_FreshnessDiagnosticsT", bound=FreshnessDiagnostics)
+
+_freshness_cache: ContextVar[Optional[Dict[Hashable, FreshnessDiagnostics]]] = ContextVar(
+    "_freshness_cache", default=None
+)
+
+
+@contextmanager
+def freshness_cache() -> Iterator[None]:
+    """
+    Memoize successful freshness checks for the duration of a single run.
+
+    Checking freshness requires a store round-trip per resource; a Checkpoint run checks
+    each of its ValidationDefinitions (and their suites and batch definitions) several times.
+    Within this context, each resource is only fetched once as long as its content is unchanged.
+
+    Nested scopes share the outermost cache.
+    """
+    if _freshness_cache.get() is not None:
+        yield
+        return
+
+    token = _freshness_cache.set({})
+    try:
+        yield
+    finally:
+        _freshness_cache.reset(token)
+
+
+def get_or_check_freshness(
+    build_key: Callable[[], Hashable], check: Callable[[], _FreshnessDiagnosticsT]
+) -> _FreshnessDiagnosticsT:
+    """
+    Return memoized diagnostics if a `freshness_cache` is active, running `check` otherwise.
+
+    `build_key` is only invoked when a cache is active and should fingerprint the resource's
+    content (see `content_hash`) so that in-memory modifications invalidate the cached result.
+
+    Only successful diagnostics are memoized; failures are always re-checked since callers
+    may resolve them (e.g. by adding the resource to its store) within the same run.
+    """
+    cache = _freshness_cache.get()
+    if cache is None:
+        return check()
+
+    key = build_key()
+    diagnostics = cache.get(key)
+    if diagnostics is None:
+        diagnostics = check()
+        if diagnostics.success:
+            cache[key] = diagnostics
+    return diagnostics  # type: ignore[return-value] # keys are namespaced per resource type
+
+
+def content_hash(payload: str) -> str:
+    """Fingerprint the serialized content of a resource for use in freshness cache keys."""
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -18,6 +18,8 @@ from great_expectations.core.expectation_suite import (
 )
 from great_expectations.core.freshness_diagnostics import (
     ValidationDefinitionFreshnessDiagnostics,
+    freshness_cache,
+    get_or_check_freshness,
 )
 from great_expectations.core.result_format import DEFAULT_RESULT_FORMAT
 from great_expectations.core.run_identifier import RunIdentifier
@@ -131,6 +133,19 @@ class ValidationDefinition(BaseModel):
         return project_manager.get_validation_results_store()
 
     def is_fresh(self) -> ValidationDefinitionFreshnessDiagnostics:
+        with freshness_cache():
+            return get_or_check_freshness(build_key=self._freshness_cache_key, check=self._is_fresh)
+
+    def _freshness_cache_key(self) -> tuple:
+        return (
+            type(self).__name__,
+            self.name,
+            str(self.id),
+            self.suite._freshness_cache_key(),
+            self.data._freshness_cache_key(),
+        )
+
+    def _is_fresh(self) -> ValidationDefinitionFreshnessDiagnostics:
         validation_definition_diagnostics = ValidationDefinitionFreshnessDiagnostics(
             errors=[] if self.id else [ValidationDefinitionNotAddedError(name=self.name)]
         )
@@ -144,6 +159,10 @@ class ValidationDefinition(BaseModel):
         store = project_manager.get_validation_definition_store()
         key = store.get_key(name=self.name, id=self.id)
 
+        # Avoid deserializing the persisted definition (and re-fetching its suite) when unchanged
+        if store.matches_persisted_value(key=key, value=self):
+            return ValidationDefinitionFreshnessDiagnostics(errors=[])
+
         try:
             validation_definition = store.get(key=key)
         except (
@@ -2205,6 +2205,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         | None = None,
         dry_run: bool = False,
         build_index: bool = True,
+        force_rebuild: bool = False,
     ) -> dict[str, str]:
         """Build Data Docs for your project.
 
@@ -2224,6 +2225,8 @@ class AbstractDataContext(ConfigPeer, ABC):
                 URLs of the sites that *would* be built, but it does not build
                 these sites.
             build_index: a flag if False, skips building the index page
+            force_rebuild: a flag if True, re-renders every page, even those whose source has not
+                changed since it was last rendered
 
         Returns:
             A dictionary with the names of the updated data documentation sites as keys and the location info
@@ -2237,6 +2240,7 @@ class AbstractDataContext(ConfigPeer, ABC):
             resource_identifiers=resource_identifiers,
             dry_run=dry_run,
             build_index=build_index,
+            force_rebuild=force_rebuild,
         )
 
     def _build_data_docs(
@@ -2245,6 +2249,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         resource_identifiers: list | None = None,
         dry_run: bool = False,
         build_index: bool = True,
+        force_rebuild: bool = False,
     ) -> dict:
         logger.debug("Starting DataContext.build_data_docs")
 
@@ -2280,6 +2285,7 @@ class AbstractDataContext(ConfigPeer, ABC):
                         index_page_resource_identifier_tuple = site_builder.build(
                             resource_identifiers,
                             build_index=build_index,
+                            force_rebuild=force_rebuild,
                         )
                         if index_page_resource_identifier_tuple:
                             index_page_locator_infos[site_name] = (
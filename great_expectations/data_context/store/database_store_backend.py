@@ -25,9 +25,12 @@ if sa:
 
 logger = logging.getLogger(__name__)
 
+# Connection pool settings used for engines built by the backend unless overridden in its kwargs
+DEFAULT_ENGINE_KWARGS: Dict[str, Any] = {"pool_pre_ping": True}
+
 
 class DatabaseStoreBackend(StoreBackend):
-    def __init__(  # noqa: C901, PLR0912, PLR0913
+    def __init__(  # noqa: C901, PLR0912, PLR0913, PLR0915
         self,
         table_name,
         key_columns,
@@ -70,13 +73,15 @@ class DatabaseStoreBackend(StoreBackend):
                 )
             self.engine = engine
         elif credentials is not None:
-            self.engine = self._build_engine(credentials=credentials, **kwargs)
+            self.engine = self._build_engine(
+                credentials=credentials, **{**DEFAULT_ENGINE_KWARGS, **kwargs}
+            )
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = sa.create_engine(connection_string, **{**DEFAULT_ENGINE_KWARGS, **kwargs})
         elif url is not None:
             parsed_url = make_url(url)
             self.drivername = parsed_url.drivername
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = sa.create_engine(url, **{**DEFAULT_ENGINE_KWARGS, **kwargs})
         else:
             raise gx_exceptions.InvalidConfigError(  # noqa: TRY003
                 "Credentials, url, connection_string, or an engine are required for a DatabaseStoreBackend."  # noqa: E501
@@ -114,6 +119,13 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Unable to connect to table {table_name} because of an error. It is possible your table needs to be migrated to a new schema.  SqlAlchemyError: {e!s}"  # noqa: E501
                 )
         self._table = table
+        # Native upserts need the key columns to be the table's primary key to detect conflicts
+        self._upsert_dialect = None
+        if {col.name for col in table.primary_key.columns} == set(key_columns):
+            self._upsert_dialect = {
+                "postgresql": sqlalchemy.postgresql,
+                "sqlite": sqlalchemy.sqlite,
+            }.get(self.engine.dialect.name)
         # Initialize with store_backend_id
         self._store_backend_id = None
         self._store_backend_id = self.store_backend_id
@@ -228,19 +240,16 @@ class DatabaseStoreBackend(StoreBackend):
             create_engine_kwargs,
         )
 
-    def _get(self, key):  # type: ignore[explicit-override] # FIXME
-        sel = (
-            sa.select(sa.column("value"))
-            .select_from(self._table)
-            .where(
-                sa.and_(
-                    *(
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    )
-                )
+    def _key_clause(self, key):
+        return sa.and_(
+            *(
+                getattr(self._table.columns, key_col) == val
+                for key_col, val in zip(self.key_columns, key)
             )
         )
+
+    def _get(self, key):  # type: ignore[explicit-override] # FIXME
+        sel = sa.select(sa.column("value")).select_from(self._table).where(self._key_clause(key))
         try:
             with self.engine.begin() as connection:
                 row = connection.execute(sel).fetchone()[0]
@@ -251,28 +260,29 @@ class DatabaseStoreBackend(StoreBackend):
 
     @override
     def _get_all(self) -> list[Any]:
-        raise NotImplementedError
+        sel = sa.select(self._table.columns.value)
+        with self.engine.connect() as connection:
+            return [row[0] for row in connection.execute(sel)]
 
     @override
     def _set(self, key, value, allow_update=True, **kwargs) -> None:
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
-
-        if allow_update:
-            if self.has_key(key):
-                ins = (
-                    self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
-                )
-            else:
-                ins = self._table.insert().values(**cols)  # type: ignore[assignment]
-        else:
-            ins = self._table.insert().values(**cols)  # type: ignore[assignment]
-
+        row = {**dict(zip(self.key_columns, key)), "value": value}
         try:
             with self.engine.begin() as connection:
-                connection.execute(ins)
+                if not allow_update:
+                    connection.execute(self._table.insert().values(**row))
+                elif self._upsert_dialect is not None:
+                    upsert = self._upsert_dialect.insert(self._table).values(**row)
+                    upsert = upsert.on_conflict_do_update(
+                        index_elements=self.key_columns,
+                        set_={"value": upsert.excluded.value},
+                    )
+                    connection.execute(upsert)
+                else:
+                    # No native upsert: update the key in place, or insert it if it is missing
+                    update = self._table.update().where(self._key_clause(key)).values(value=value)
+                    if connection.execute(update).rowcount == 0:
+                        connection.execute(self._table.insert().values(**row))
         except sqlalchemy.IntegrityError as e:
             if self._get(key) == value:
                 logger.info(f"Key {key!s} already exists with the same value.")
@@ -308,14 +318,7 @@ class DatabaseStoreBackend(StoreBackend):
         sel = (
             sa.select(sa.func.count(sa.column("value")))
             .select_from(self._table)
-            .where(
-                sa.and_(
-                    *(
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    )
-                )
-            )
+            .where(self._key_clause(key))
         )
         try:
             with self.engine.begin() as connection:
@@ -344,14 +347,7 @@ class DatabaseStoreBackend(StoreBackend):
         return [tuple(row) for row in row_list]
 
     def remove_key(self, key):  # type: ignore[explicit-override] # FIXME
-        delete_statement = self._table.delete().where(
-            sa.and_(
-                *(
-                    getattr(self._table.columns, key_col) == val
-                    for key_col, val in zip(self.key_columns, key)
-                )
-            )
-        )
+        delete_statement = self._table.delete().where(self._key_clause(key))
         try:
             with self.engine.begin() as connection:
                 return connection.execute(delete_statement)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+from contextlib import closing
+from typing import Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FilesystemKeyIndex:
+    """An on-disk index of the keys persisted by a TupleFilesystemStoreBackend.
+
+    Listing keys otherwise requires walking the whole store directory and parsing every filepath
+    back into a key. The index maps each (relative) filepath to its parsed key in a SQLite
+    database that lives alongside the stored objects, so that concurrent processes share it.
+
+    The index is only trusted once it has been fully built with the same key-parsing configuration
+    (captured by `fingerprint`). Until then, or after it has been invalidated, it reports no keys
+    and writes to it are skipped; the owning backend is then expected to `rebuild` it.
+    """
+
+    FILENAME = ".ge_store_key_index.sqlite3"
+
+    def __init__(self, base_directory: str, fingerprint: str) -> None:
+        self._base_directory = base_directory
+        self._path = os.path.join(base_directory, self.FILENAME)  # noqa: PTH118
+        self._fingerprint = fingerprint
+
+    @classmethod
+    def is_index_file(cls, filename: str) -> bool:
+        # Also matches SQLite's transient journal files
+        return filename.startswith(cls.FILENAME)
+
+    def list_keys(self, path_prefix: str = "") -> Optional[List[Tuple[str, ...]]]:
+        """Return the indexed keys stored under `path_prefix`, or None if the index is unusable."""
+        if not os.path.isfile(self._path):  # noqa: PTH113
+            return None
+
+        try:
+            with closing(self._connect()) as conn:
+                if not self._is_valid(conn):
+                    return None
+                if path_prefix:
+                    # Range scan over the primary key: every filepath within the prefix directory
+                    rows = conn.execute(
+                        "SELECT key FROM keys WHERE filepath >= ? AND filepath < ? "
+                        "ORDER BY filepath",
+                        (path_prefix + os.sep, path_prefix + chr(ord(os.sep) + 1)),
+                    ).fetchall()
+                else:
+                    rows = conn.execute("SELECT key FROM keys ORDER BY filepath").fetchall()
+        except sqlite3.DatabaseError as e:
+            self._discard(e)
+            return None
+
+        return [tuple(json.loads(key)) for (key,) in rows]
+
+    def rebuild(self, entries: Iterable[Tuple[str, Tuple[str, ...]]]) -> bool:
+        """Replace the contents of the index with `entries` of (filepath, key) pairs.
+
+        Returns:
+            Whether the index was successfully rebuilt.
+        """
+        try:
+            os.makedirs(self._base_directory, exist_ok=True)  # noqa: PTH103
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM meta")
+                conn.execute("DELETE FROM keys")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO keys (filepath, key) VALUES (?, ?)",
+                    ((filepath, json.dumps(key)) for filepath, key in entries),
+                )
+                conn.execute(
+                    "INSERT INTO meta (name, value) VALUES ('fingerprint', ?)",
+                    (self._fingerprint,),
+                )
+        except (sqlite3.DatabaseError, OSError) as e:
+            self._discard(e)
+            return False
+
+        return True
+
+    def add(self, filepath: str, key: Tuple[str, ...]) -> None:
+        self._execute_if_valid(
+            "INSERT OR REPLACE INTO keys (filepath, key) VALUES (?, ?)",
+            (filepath, json.dumps(key)),
+        )
+
+    def remove(self, filepath: str) -> None:
+        self._execute_if_valid("DELETE FROM keys WHERE filepath = ?", (filepath,))
+
+    def invalidate_if_indexed(self, filepath: str) -> None:
+        """Invalidate the index if it lists `filepath`, which is known to be missing on disk.
+
+        This means the directory was modified without going through the backend, so any other
+        entry may be stale as well.
+        """
+        if not os.path.isfile(self._path):  # noqa: PTH113
+            return
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute("SELECT 1 FROM keys WHERE filepath = ?", (filepath,)).fetchone()
+                if row is not None:
+                    logger.info(f"Key index {self._path} is out of date; it will be rebuilt.")
+                    conn.execute("DELETE FROM meta")
+        except sqlite3.DatabaseError as e:
+            self._discard(e)
+
+    def _execute_if_valid(self, sql: str, parameters: tuple) -> None:
+        if not os.path.isfile(self._path):  # noqa: PTH113
+            return
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                if self._is_valid(conn):
+                    conn.execute(sql, parameters)
+        except sqlite3.DatabaseError as e:
+            self._discard(e)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=30)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS keys (filepath TEXT PRIMARY KEY, key TEXT NOT NULL)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        return conn
+
+    def _is_valid(self, conn: sqlite3.Connection) -> bool:
+        row = conn.execute("SELECT value FROM meta WHERE name = 'fingerprint'").fetchone()
+        return row is not None and row[0] == self._fingerprint
+
+    def _discard(self, error: Exception) -> None:
+        logger.warning(f"Discarding unusable key index {self._path}: {error}")
+        try:
+            os.remove(self._path)  # noqa: PTH107
+        except OSError:
+            pass
@@ -24,7 +24,12 @@ from great_expectations.data_context.util import (
     instantiate_class_from_config,
     load_class,
 )
-from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    InvalidKeyError,
+    StoreBackendError,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -104,7 +109,13 @@ class HtmlSiteStore:
 
     _key_class = SiteSectionIdentifier
 
-    def __init__(  # noqa: C901 - 11
+    # Records what the index page links to, so that it can be updated without re-listing the site
+    INDEX_MANIFEST_FILENAME = ".ge_index_manifest.json"
+    # Appended to the filepath of a page to name the file recording a hash of the page's source,
+    # so that unchanged pages can be skipped
+    PAGE_HASH_FILEPATH_SUFFIX = ".sha256"
+
+    def __init__(  # noqa: C901, PLR0912, PLR0915
         self, store_backend=None, runtime_environment=None
     ) -> None:
         store_backend_module_name = store_backend.get(
@@ -203,6 +214,77 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        index_manifest_config_defaults = {
+            "module_name": module_name,
+            "filepath_template": self.INDEX_MANIFEST_FILENAME,
+            "suppress_store_backend_id": True,
+        }
+        if is_gx_cloud_store:
+            index_manifest_config_defaults = {
+                "module_name": module_name,
+                "suppress_store_backend_id": True,
+            }
+
+        index_manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults=index_manifest_config_defaults,
+        )
+        if not index_manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
+        expectation_page_hash_config_defaults = {
+            "module_name": module_name,
+            "filepath_prefix": "expectations",
+            "filepath_suffix": filepath_suffix + self.PAGE_HASH_FILEPATH_SUFFIX,
+            "suppress_store_backend_id": True,
+        }
+        if is_gx_cloud_store:
+            expectation_page_hash_config_defaults = {
+                "module_name": module_name,
+                "suppress_store_backend_id": True,
+            }
+
+        expectation_page_hash_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults=expectation_page_hash_config_defaults,
+        )
+        if not expectation_page_hash_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
+        validation_page_hash_config_defaults = {
+            "module_name": module_name,
+            "filepath_prefix": "validations",
+            "filepath_suffix": filepath_suffix + self.PAGE_HASH_FILEPATH_SUFFIX,
+            "suppress_store_backend_id": True,
+        }
+        if is_gx_cloud_store:
+            validation_page_hash_config_defaults = {
+                "module_name": module_name,
+                "suppress_store_backend_id": True,
+            }
+
+        validation_page_hash_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults=validation_page_hash_config_defaults,
+        )
+        if not validation_page_hash_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         static_assets_config_defaults = {
             "module_name": module_name,
             "filepath_template": None,
@@ -229,6 +311,9 @@ class HtmlSiteStore:
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
+            "index_manifest": index_manifest_obj,
+            "expectation_page_hashes": expectation_page_hash_obj,
+            "validation_page_hashes": validation_page_hash_obj,
             "static_assets": static_assets_obj,
         }
 
@@ -357,6 +442,56 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def get_index_manifest(self) -> Optional[str]:
+        """Return the serialized index manifest, or None if the site does not have one."""
+        try:
+            return self.store_backends["index_manifest"].get(())
+        except (InvalidKeyError, StoreBackendError) as e:
+            logger.debug(f"No data docs index manifest could be read: {e!s}")
+            return None
+
+    def set_index_manifest(self, manifest: str) -> None:
+        self.store_backends["index_manifest"].set(
+            (),
+            manifest,
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
+    def remove_index_manifest(self) -> None:
+        self.store_backends["index_manifest"].remove_key(())
+
+    def get_page_hash(self, resource_identifier) -> Optional[str]:
+        """Return the hash of the source the page of a resource was rendered from, if recorded."""
+        store_backend = self._get_page_hash_store_backend(resource_identifier)
+        try:
+            if not store_backend.has_key(resource_identifier.to_tuple()):
+                return None
+            return store_backend.get(resource_identifier.to_tuple())
+        except (InvalidKeyError, StoreBackendError) as e:
+            logger.debug(f"No data docs page hash could be read for {resource_identifier!s}: {e!s}")
+            return None
+
+    def set_page_hash(self, resource_identifier, page_hash: str) -> None:
+        self._get_page_hash_store_backend(resource_identifier).set(
+            resource_identifier.to_tuple(),
+            page_hash,
+            content_encoding="utf-8",
+            content_type="text/plain; charset=utf-8",
+        )
+
+    def remove_page_hash(self, resource_identifier) -> None:
+        store_backend = self._get_page_hash_store_backend(resource_identifier)
+        if store_backend.has_key(resource_identifier.to_tuple()):
+            store_backend.remove_key(resource_identifier.to_tuple())
+
+    def _get_page_hash_store_backend(self, resource_identifier):
+        if isinstance(resource_identifier, ExpectationSuiteIdentifier):
+            return self.store_backends["expectation_page_hashes"]
+        if isinstance(resource_identifier, ValidationResultIdentifier):
+            return self.store_backends["validation_page_hashes"]
+        raise ValueError(f"Cannot record a page hash for resource {resource_identifier!s:s}")  # noqa: TRY003
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
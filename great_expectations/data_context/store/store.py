@@ -247,6 +247,25 @@ class Store:
 
         return None
 
+    def matches_persisted_value(self, key: DataContextKey, value: Any) -> bool:
+        """Check whether `value` serializes to exactly the payload persisted under `key`.
+
+        This is a cheap alternative to `get` followed by an equality check, as it neither
+        deserializes the persisted payload nor resolves any of its references.
+        A False result is inconclusive; callers should fall back to a full comparison.
+        """
+        if self.cloud_mode:
+            # Cloud responses are enriched by the backend and never match byte-for-byte
+            return False
+
+        self._validate_key(key)
+        try:
+            persisted_value = self._store_backend.get(self.key_to_tuple(key))
+        except (StoreBackendError, gx_exceptions.InvalidKeyError):
+            return False
+
+        return persisted_value == self.serialize(value)
+
     def get_all(self) -> list[Any]:
         objs = self._store_backend.get_all()
         if self.cloud_mode:
@@ -8,17 +8,25 @@ import pathlib
 import random
 import re
 import shutil
+import threading
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 from great_expectations.compatibility import aws
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.data_context.store.filesystem_key_index import FilesystemKeyIndex
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
 from great_expectations.util import filter_properties_dict
 
 logger = logging.getLogger(__name__)
 
+_ObjectKeyT = TypeVar("_ObjectKeyT")
+
+# Upper bound on the number of objects remote backends download at once in `get_all`
+DEFAULT_GET_ALL_MAX_WORKERS = 16
+
 
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     r"""
@@ -213,6 +221,24 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     def config(self) -> dict:
         return self._config  # type: ignore[attr-defined]
 
+    @staticmethod
+    def _get_all_concurrently(
+        get_value: Callable[[_ObjectKeyT], Any],
+        object_keys: Iterable[_ObjectKeyT],
+        max_workers: int,
+    ) -> list[Any]:
+        """Download objects using a bounded pool of worker threads.
+
+        Downloads from remote backends are I/O bound, so fetching them one at a time leaves
+        most of the time spent waiting on the network. Values are returned in key order.
+        """
+        object_keys = list(object_keys)
+        if max_workers <= 1 or len(object_keys) <= 1:
+            return [get_value(key) for key in object_keys]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(object_keys))) as executor:
+            return list(executor.map(get_value, object_keys))
+
 
 class TupleFilesystemStoreBackend(TupleStoreBackend):
     """Uses a local filepath as a store.
@@ -220,6 +246,10 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    If use_key_index is set, the keys in the store are tracked in an on-disk index that is kept up
+    to date by this backend, so that list_keys does not need to walk the directory. Files added to
+    the directory by other means are only picked up once rebuild_key_index is called.
     """  # noqa: E501
 
     def __init__(  # noqa: PLR0913
@@ -236,6 +266,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        use_key_index: bool = False,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -269,6 +300,17 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             str(os.path.dirname(self.full_base_directory)),  # noqa: PTH120
             exist_ok=True,
         )
+
+        self._key_index: Optional[FilesystemKeyIndex] = None
+        if use_key_index:
+            # Keys are parsed from filepaths, so an index built with different settings is stale
+            fingerprint = repr(
+                (filepath_template, filepath_prefix, filepath_suffix, platform_specific_separator)
+            )
+            self._key_index = FilesystemKeyIndex(
+                base_directory=self.full_base_directory, fingerprint=fingerprint
+            )
+
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -288,6 +330,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "use_key_index": use_key_index,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -301,6 +344,9 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             with open(filepath) as infile:
                 contents: str = infile.read().rstrip("\n")
         except FileNotFoundError as e:
+            if self._key_index:
+                # A listed key that no longer exists means the index has gone stale
+                self._key_index.invalidate_if_indexed(self._get_index_filepath(key))
             raise InvalidKeyError(  # noqa: TRY003
                 f"Unable to retrieve object from TupleFilesystemStoreBackend with the following Key: {filepath!s}"  # noqa: E501
             ) from e
@@ -326,6 +372,13 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                 outfile.write(value.encode("utf-8"))
             else:
                 outfile.write(value)
+
+        if self._key_index:
+            index_filepath = self._get_index_filepath(key)
+            index_key = self._convert_index_filepath_to_key(index_filepath)
+            if index_key:
+                self._key_index.add(index_filepath, index_key)
+
         return filepath
 
     def _move(self, source_key, dest_key, **kwargs):  # type: ignore[explicit-override] # FIXME
@@ -341,13 +394,42 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         if os.path.exists(source_path):  # noqa: PTH110
             os.makedirs(dest_dir, exist_ok=True)  # noqa: PTH103
             shutil.move(source_path, dest_path)
+
+            if self._key_index:
+                self._key_index.remove(self._get_index_filepath(source_key))
+                index_filepath = self._get_index_filepath(dest_key)
+                index_key = self._convert_index_filepath_to_key(index_filepath)
+                if index_key:
+                    self._key_index.add(index_filepath, index_key)
+
             return dest_key
 
         return False
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        key_list = []
+        if self._key_index:
+            path_prefix = os.path.join(*prefix) if prefix else ""  # noqa: PTH118
+            key_list = self._key_index.list_keys(path_prefix=path_prefix)
+            if key_list is None and self.rebuild_key_index():
+                key_list = self._key_index.list_keys(path_prefix=path_prefix)
+            if key_list is not None:
+                return key_list
+
+        return [key for _, key in self._walk_keys(prefix=prefix)]
+
+    def rebuild_key_index(self) -> bool:
+        """Rebuild the key index from the contents of the store directory.
+
+        Returns:
+            Whether the index was rebuilt; False if the backend does not use a key index.
+        """
+        if not self._key_index:
+            return False
+
+        return self._key_index.rebuild(entries=self._walk_keys())
+
+    def _walk_keys(self, prefix: Tuple = ()) -> Iterator[Tuple[str, Tuple]]:
         for root, dirs, files in os.walk(
             os.path.join(self.full_base_directory, *prefix)  # noqa: PTH118
         ):
@@ -360,21 +442,31 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                     self.full_base_directory,
                 )
                 if relative_path == ".":
+                    if FilesystemKeyIndex.is_index_file(file_name):
+                        continue
                     filepath = file_name
                 else:
                     filepath = os.path.join(relative_path, file_name)  # noqa: PTH118
 
-                if self._is_missing_prefix_or_suffix(
-                    filepath_prefix=self.filepath_prefix,
-                    filepath_suffix=self.filepath_suffix,
-                    key=filepath,
-                ):
-                    continue
-                key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
-                    key_list.append(key)
+                key = self._convert_index_filepath_to_key(filepath)
+                if key:
+                    yield filepath, key
 
-        return key_list
+    def _convert_index_filepath_to_key(self, filepath: str) -> Optional[Tuple]:
+        """Parse a filepath relative to the base directory into a key, if it is one list_keys returns."""  # noqa: E501
+        if self._is_missing_prefix_or_suffix(
+            filepath_prefix=self.filepath_prefix,
+            filepath_suffix=self.filepath_suffix,
+            key=filepath,
+        ):
+            return None
+        key = self._convert_filepath_to_key(filepath)
+        if key and not self.is_ignored_key(key):
+            return key
+        return None
+
+    def _get_index_filepath(self, key) -> str:
+        return os.path.normpath(self._convert_key_to_filepath(key))
 
     def rrmdir(self, mroot, curpath) -> None:
         """
@@ -404,6 +496,8 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             d_path = os.path.dirname(filepath)  # noqa: PTH120
             os.remove(filepath)  # noqa: PTH107
             self.rrmdir(self.full_base_directory, d_path)
+            if self._key_index:
+                self._key_index.remove(self._get_index_filepath(key))
             return True
         return False
 
@@ -468,6 +562,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        get_all_max_workers: int = DEFAULT_GET_ALL_MAX_WORKERS,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -497,6 +592,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             s3_put_options = {}
         self.s3_put_options = s3_put_options
         self.endpoint_url = endpoint_url
+        self.get_all_max_workers = get_all_max_workers
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -519,6 +615,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "get_all_max_workers": get_all_max_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -547,7 +644,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
     @override
     def _get_all(self) -> list[Any]:
         """Get all objects from the store.
-        NOTE: This is non-performant because we download each object separately.
+        NOTE: S3 has no batch GET, so each object is downloaded separately; downloads are issued
+        concurrently (up to `get_all_max_workers` at once) through a single, thread-safe client.
         See https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/bucket/objects.html#objects
         for the docs.
         """
@@ -555,7 +653,11 @@ class TupleS3StoreBackend(TupleStoreBackend):
         keys = self.list_keys()
         keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
         s3_object_keys = [self._build_s3_object_key(key) for key in keys]
-        return [self._get_by_s3_object_key(client, key) for key in s3_object_keys]
+        return self._get_all_concurrently(
+            get_value=functools.partial(self._get_by_s3_object_key, client),
+            object_keys=s3_object_keys,
+            max_workers=self.get_all_max_workers,
+        )
 
     def _get_by_s3_object_key(self, s3_client, s3_object_key):
         try:
@@ -769,6 +871,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        get_all_max_workers: int = DEFAULT_GET_ALL_MAX_WORKERS,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -786,6 +889,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        self.get_all_max_workers = get_all_max_workers
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -807,6 +911,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             "public_urls": public_urls,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "get_all_max_workers": get_all_max_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -838,13 +943,24 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     def _get_all(self) -> list[Any]:
         from great_expectations.compatibility import google
 
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
+        # GCS clients are not guaranteed to be thread-safe, so each worker reuses its own
+        thread_local = threading.local()
+
+        def _get_by_key(key):
+            bucket = getattr(thread_local, "bucket", None)
+            if bucket is None:
+                gcs = google.storage.Client(project=self.project)
+                bucket = thread_local.bucket = gcs.bucket(self.bucket)
+            return self._get_by_gcs_object_key(bucket, key)
 
         keys = self.list_keys()
         keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
 
-        return [self._get_by_gcs_object_key(bucket, key) for key in keys]
+        return self._get_all_concurrently(
+            get_value=_get_by_key,
+            object_keys=keys,
+            max_workers=self.get_all_max_workers,
+        )
 
     def _get_by_gcs_object_key(self, bucket, key):
         gcs_object_key = self._build_gcs_object_key(key)
@@ -1005,6 +1121,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        get_all_max_workers: int = DEFAULT_GET_ALL_MAX_WORKERS,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -1028,6 +1145,30 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         self.account_url = account_url or os.environ.get(  # noqa: TID251
             "AZURE_STORAGE_ACCOUNT_URL"
         )
+        self.get_all_max_workers = get_all_max_workers
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter  # noqa: E501
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.  # noqa: E501
+        self._config = {
+            "container": container,
+            "connection_string": connection_string,
+            "credential": credential,
+            "account_url": account_url,
+            "prefix": prefix,
+            "filepath_template": filepath_template,
+            "filepath_prefix": filepath_prefix,
+            "filepath_suffix": filepath_suffix,
+            "forbidden_substrings": forbidden_substrings,
+            "platform_specific_separator": platform_specific_separator,
+            "fixed_length_key": fixed_length_key,
+            "suppress_store_backend_id": suppress_store_backend_id,
+            "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
+            "store_name": store_name,
+            "get_all_max_workers": get_all_max_workers,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
     @property
     @functools.lru_cache  # noqa: B019 # lru_cache on method
@@ -1074,8 +1215,13 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
 
     @override
     def _get_all(self) -> list[Any]:
+        # The container client is thread-safe and shared by all workers
         keys = self.list_keys()
-        return [self._get(key) for key in keys]
+        return self._get_all_concurrently(
+            get_value=self._get,
+            object_keys=keys,
+            max_workers=self.get_all_max_workers,
+        )
 
     def _set(self, key, value, content_encoding="utf-8", **kwargs):  # type: ignore[explicit-override] # FIXME
         from great_expectations.compatibility.azure import ContentSettings
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Dict, Optional, Type
+import base64
+import gzip
+from typing import TYPE_CHECKING, ClassVar, Dict, Literal, Optional, Type
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.expectation_validation_result import (
@@ -18,6 +20,7 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import load_class
+from great_expectations.exceptions import StoreConfigurationError
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -94,11 +97,37 @@ class ValidationResultsStore(Store):
             bug_risk: Moderate
 
     --ge-feature-maturity-info--
+
+    By default results are persisted as indented JSON. Setting serialization_format to "gzip"
+    persists them as gzip-compressed compact JSON instead, which is much smaller for results with
+    long unexpected value lists. Results written in either format can always be read back.
+
+    Gzip payloads are base64 text starting with "gx-gzip-base64:", not JSON. Tuple store backends
+    (filesystem, S3, GCS, Azure) still default to the ".json" filepath_suffix in that mode, because
+    keys are listed by suffix: a store switched to "gzip" must keep listing the results it already
+    holds. Set filepath_suffix explicitly (e.g. ".json.gz.b64") for a new store whose files should
+    not be mistaken for JSON by other tools.
     """  # noqa: E501
 
     _key_class: ClassVar[Type] = ValidationResultIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None, store_name=None) -> None:
+    SERIALIZATION_FORMATS: ClassVar[tuple] = ("json", "gzip")
+    # Marks gzip payloads, base64-encoded so that every store backend can carry them as text
+    GZIP_PAYLOAD_PREFIX: ClassVar[str] = "gx-gzip-base64:"
+
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        serialization_format: Literal["json", "gzip"] = "json",
+    ) -> None:
+        if serialization_format not in self.SERIALIZATION_FORMATS:
+            raise StoreConfigurationError(  # noqa: TRY003
+                f"Unsupported serialization_format {serialization_format!r} for "
+                f"{self.__class__.__name__}; expected one of {self.SERIALIZATION_FORMATS}."
+            )
+        self._serialization_format = serialization_format
         self._expectationSuiteValidationResultSchema = ExpectationSuiteValidationResultSchema()
 
         if store_backend is not None:
@@ -111,7 +140,8 @@ class ValidationResultsStore(Store):
 
             # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
             if issubclass(store_backend_class, TupleStoreBackend):
-                # Provide defaults for this common case
+                # Provide defaults for this common case; gzip payloads keep the ".json" suffix so
+                # that results written before switching formats are still listed (see docstring).
                 store_backend["filepath_suffix"] = store_backend.get("filepath_suffix", ".json")
             elif issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
@@ -139,6 +169,7 @@ class ValidationResultsStore(Store):
             "store_backend": store_backend,
             "runtime_environment": runtime_environment,
             "store_name": store_name,
+            "serialization_format": serialization_format,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -160,6 +191,13 @@ class ValidationResultsStore(Store):
     def serialize(self, value):  # type: ignore[explicit-override] # FIXME
         if self.cloud_mode:
             return value.to_json_dict()
+        if self._serialization_format == "gzip":
+            payload = self._expectationSuiteValidationResultSchema.dumps(
+                value.to_json_dict(), separators=(",", ":"), sort_keys=True
+            )
+            # mtime is fixed so that identical results produce identical payloads
+            compressed = gzip.compress(payload.encode("utf-8"), mtime=0)
+            return self.GZIP_PAYLOAD_PREFIX + base64.b64encode(compressed).decode("ascii")
         return self._expectationSuiteValidationResultSchema.dumps(
             value.to_json_dict(), indent=2, sort_keys=True
         )
@@ -167,8 +205,12 @@ class ValidationResultsStore(Store):
     def deserialize(self, value):  # type: ignore[explicit-override] # FIXME
         if isinstance(value, dict):
             return self._expectationSuiteValidationResultSchema.load(value)
-        else:
-            return self._expectationSuiteValidationResultSchema.loads(value)
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        if value.startswith(self.GZIP_PAYLOAD_PREFIX):
+            compressed = base64.b64decode(value[len(self.GZIP_PAYLOAD_PREFIX) :])
+            value = gzip.decompress(compressed).decode("utf-8")
+        return self._expectationSuiteValidationResultSchema.loads(value)
 
     @property
     @override
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -35,6 +36,10 @@ if TYPE_CHECKING:
     MappingIntStrAny = Mapping[Union[int, str], Any]
     AbstractSetIntStr = AbstractSet[Union[int, str]]
 
+# dict() and schema_json() temporarily patch the shared model fields and config, so they
+# must not interleave across threads
+_MODEL_PATCH_LOCK = threading.RLock()
+
 
 # BatchParameters is a dict that is composed into a BatchRequest that specifies the
 # Batches one wants as returned. The keys represent dimensions one can filter the data along
@@ -186,31 +191,32 @@ class BatchRequest(pydantic.GenericModel, Generic[PartitionerT]):
         Generate a dictionary representation of the BatchRequest, optionally specifying which
         fields to include or exclude.
         """
-        # batch_slice is only a property/pydantic setter, so we need to add a field
-        # if we want it to show up in dict() with the _batch_request_input
-        self.__fields__["batch_slice"] = pydantic.fields.ModelField(
-            name="batch_slice",
-            type_=Optional[BatchSlice],  # type: ignore[arg-type]
-            required=False,
-            default=None,
-            model_config=self.__config__,
-            class_validators=None,
-        )
-        property_set_methods = self.__config__.property_set_methods  # type: ignore[attr-defined]
-        self.__config__.property_set_methods = {}  # type: ignore[attr-defined]
-        self.__setattr__("batch_slice", self._batch_slice_input)
-        result = super().dict(
-            include=include,
-            exclude=exclude,
-            by_alias=by_alias,
-            exclude_unset=exclude_unset,
-            exclude_defaults=exclude_defaults,
-            exclude_none=exclude_none,
-            skip_defaults=skip_defaults,
-        )
-        # revert model changes
-        self.__config__.property_set_methods = property_set_methods  # type: ignore[attr-defined]
-        self.__fields__.pop("batch_slice")
+        with _MODEL_PATCH_LOCK:
+            # batch_slice is only a property/pydantic setter, so we need to add a field
+            # if we want it to show up in dict() with the _batch_request_input
+            self.__fields__["batch_slice"] = pydantic.fields.ModelField(
+                name="batch_slice",
+                type_=Optional[BatchSlice],  # type: ignore[arg-type]
+                required=False,
+                default=None,
+                model_config=self.__config__,
+                class_validators=None,
+            )
+            property_set_methods = self.__config__.property_set_methods  # type: ignore[attr-defined]
+            self.__config__.property_set_methods = {}  # type: ignore[attr-defined]
+            self.__setattr__("batch_slice", self._batch_slice_input)
+            result = super().dict(
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                skip_defaults=skip_defaults,
+            )
+            # revert model changes
+            self.__config__.property_set_methods = property_set_methods  # type: ignore[attr-defined]
+            self.__fields__.pop("batch_slice")
         return result
 
     @classmethod
@@ -222,21 +228,22 @@ class BatchRequest(pydantic.GenericModel, Generic[PartitionerT]):
         ref_template: str = pydantic_schema.default_ref_template,
         **dumps_kwargs: Any,
     ) -> str:
-        # batch_slice is only a property/pydantic setter, so we need to add a field
-        # if we want its definition to show up in schema_json()
-        cls.__fields__["batch_slice"] = pydantic.fields.ModelField(
-            name="batch_slice",
-            type_=Optional[BatchSlice],  # type: ignore[arg-type]
-            required=False,
-            default=None,
-            model_config=cls.__config__,
-            class_validators=None,
-        )
-        result = cls.__config__.json_dumps(
-            cls.schema(by_alias=by_alias, ref_template=ref_template),
-            default=pydantic_json.pydantic_encoder,
-            **dumps_kwargs,
-        )
-        # revert model changes
-        cls.__fields__.pop("batch_slice")
+        with _MODEL_PATCH_LOCK:
+            # batch_slice is only a property/pydantic setter, so we need to add a field
+            # if we want its definition to show up in schema_json()
+            cls.__fields__["batch_slice"] = pydantic.fields.ModelField(
+                name="batch_slice",
+                type_=Optional[BatchSlice],  # type: ignore[arg-type]
+                required=False,
+                default=None,
+                model_config=cls.__config__,
+                class_validators=None,
+            )
+            result = cls.__config__.json_dumps(
+                cls.schema(by_alias=by_alias, ref_template=ref_template),
+                default=pydantic_json.pydantic_encoder,
+                **dumps_kwargs,
+            )
+            # revert model changes
+            cls.__fields__.pop("batch_slice")
         return result
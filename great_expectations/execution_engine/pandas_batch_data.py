@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
 from great_expectations.core.batch import BatchData
 
@@ -12,7 +12,13 @@ class PandasBatchData(BatchData):
     def __init__(self, execution_engine, dataframe: pd.DataFrame) -> None:
         super().__init__(execution_engine=execution_engine)
         self._dataframe = dataframe
+        # Null masks and counts shared by the column map metrics of this Batch, keyed by Domain.
+        self._null_statistics: Dict[Tuple[Any, ...], Any] = {}
 
     @property
     def dataframe(self):
         return self._dataframe
+
+    @property
+    def null_statistics(self) -> Dict[Tuple[Any, ...], Any]:
+        return self._null_statistics
@@ -502,24 +502,7 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                 "PandasExecutionEngine does not currently support multiple named tables."
             )
 
-        batch_id = domain_kwargs.get("batch_id")
-        if batch_id is None:
-            # We allow no batch id specified if there is only one batch
-            if self.batch_manager.active_batch_data_id is not None:
-                data = cast(PandasBatchData, self.batch_manager.active_batch_data).dataframe
-            else:
-                raise gx_exceptions.ValidationError(  # noqa: TRY003
-                    "No batch is specified, but could not identify a loaded batch."
-                )
-        else:  # noqa: PLR5501
-            if batch_id in self.batch_manager.batch_data_cache:
-                data = cast(
-                    PandasBatchData, self.batch_manager.batch_data_cache[batch_id]
-                ).dataframe
-            else:
-                raise gx_exceptions.ValidationError(  # noqa: TRY003
-                    f"Unable to find batch with batch_id {batch_id}"
-                )
+        data = self._get_batch_data(batch_id=domain_kwargs.get("batch_id")).dataframe
 
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
@@ -589,6 +572,86 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
 
         return data
 
+    def get_column_null_mask(self, domain_kwargs: dict) -> pd.Series:
+        """Returns the boolean Series marking the null values of the column of the given Domain.
+
+        The mask is computed once per column of every Batch (and row_condition) and shared by all column map metrics,
+        which select the non-null values of their column with it, rather than each copying the filtered records.
+
+        Args:
+            domain_kwargs (dict): the Domain kwargs (including "column") specifying which data to obtain
+
+        Returns:
+            A boolean Series aligned with the Domain records, True where the column value is null
+        """  # noqa: E501
+        column_name = domain_kwargs["column"]
+        return self._get_null_statistic(
+            domain_kwargs=domain_kwargs,
+            statistic_key=("null_mask", column_name),
+            statistic_fn=lambda data: data[column_name].isna(),
+        )
+
+    def get_column_null_counts(self, domain_kwargs: dict) -> pd.Series:
+        """Returns the null count of every column of the given Domain, computed in a single pass.
+
+        Args:
+            domain_kwargs (dict): the Domain kwargs specifying which data to obtain
+
+        Returns:
+            A Series holding the null count of every column, indexed by column name
+        """
+        return self._get_null_statistic(
+            domain_kwargs=domain_kwargs,
+            statistic_key=("null_counts",),
+            statistic_fn=lambda data: data.isna().sum(),
+        )
+
+    def _get_null_statistic(
+        self,
+        domain_kwargs: dict,
+        statistic_key: Tuple[Any, ...],
+        statistic_fn: Callable[[pd.DataFrame], Any],
+    ) -> Any:
+        records_domain_kwargs = {
+            key: domain_kwargs[key]
+            for key in ("batch_id", "row_condition", "condition_parser")
+            if key in domain_kwargs
+        }
+        # Statistics are kept with the Batch, so they are released (or recomputed, for a Batch
+        # reloaded under the same batch_id) together with its DataFrame.
+        null_statistics = self._get_batch_data(
+            batch_id=domain_kwargs.get("batch_id")
+        ).null_statistics
+        cache_key = (
+            *((key, value) for key, value in records_domain_kwargs.items() if key != "batch_id"),
+            *statistic_key,
+        )
+        if cache_key in null_statistics:
+            return null_statistics[cache_key]
+
+        statistic = statistic_fn(self.get_domain_records(domain_kwargs=records_domain_kwargs))
+        if self._caching:
+            null_statistics[cache_key] = statistic
+
+        return statistic
+
+    def _get_batch_data(self, batch_id: Optional[str]) -> PandasBatchData:
+        if batch_id is None:
+            # We allow no batch id specified if there is only one batch
+            if self.batch_manager.active_batch_data_id is not None:
+                return cast(PandasBatchData, self.batch_manager.active_batch_data)
+
+            raise gx_exceptions.ValidationError(  # noqa: TRY003
+                "No batch is specified, but could not identify a loaded batch."
+            )
+
+        if batch_id in self.batch_manager.batch_data_cache:
+            return cast(PandasBatchData, self.batch_manager.batch_data_cache[batch_id])
+
+        raise gx_exceptions.ValidationError(  # noqa: TRY003
+            f"Unable to find batch with batch_id {batch_id}"
+        )
+
     @override
     def get_compute_domain(
         self,
@@ -77,6 +77,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Column that tags each row with the Batch it belongs to when metrics for several Batches are
+# computed in a single "groupBy" job.
+BATCH_INDEX_COLUMN_NAME = "__gx_batch_index"
+
 
 def apply_dateutil_parse(column):
     assert len(column.columns) == 1, "Expected DataFrame with 1 column"
@@ -888,6 +892,9 @@ illegal.  Please check your config."""  # noqa: E501
             aggregates[domain_id]["column_aggregates"].append(metric_fn)
             aggregates[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
+        # Same-shaped metrics over several Batches with a common schema are computed in one job.
+        resolved_metrics.update(self._resolve_multi_batch_aggregates(aggregates=aggregates))
+
         for aggregate in aggregates.values():
             domain_kwargs: dict = aggregate["domain_kwargs"]
             df: pyspark.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
@@ -914,6 +921,92 @@ illegal.  Please check your config."""  # noqa: E501
 
         return resolved_metrics
 
+    def _resolve_multi_batch_aggregates(  # noqa: C901 - too complex
+        self, aggregates: Dict[Tuple[str, str, str], dict]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes bundled aggregates that differ only by the Batch they run on in a single job.
+
+        Aggregates whose Domain is an entire Batch, and whose column expressions are identical,
+        are grouped; the Batches are unioned with a column identifying each Batch, and the
+        aggregates are computed with "groupBy" on that column.  Aggregates resolved this way are
+        removed from "aggregates"; all others are left for per-Domain execution.
+
+        Args:
+            aggregates: per-Domain column aggregates, as assembled by "resolve_metric_bundle".
+
+        Returns:
+            A dictionary of "MetricConfiguration" IDs and their corresponding resolved values.
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        groups: Dict[Tuple[str, ...], List[Tuple[str, str, str]]] = {}
+
+        domain_id: Tuple[str, str, str]
+        aggregate: dict
+        for domain_id, aggregate in aggregates.items():
+            domain_kwargs: dict = aggregate["domain_kwargs"]
+            if domain_kwargs.get("batch_id") is None or any(
+                value is not None for key, value in domain_kwargs.items() if key != "batch_id"
+            ):
+                continue
+
+            signature: Tuple[str, ...] = tuple(
+                str(column_aggregate) for column_aggregate in aggregate["column_aggregates"]
+            )
+            groups.setdefault(signature, []).append(domain_id)
+
+        domain_ids: List[Tuple[str, str, str]]
+        for domain_ids in groups.values():
+            if len(domain_ids) < 2:  # noqa: PLR2004
+                continue
+
+            dfs: List[pyspark.DataFrame] = [
+                self.get_domain_records(domain_kwargs=aggregates[domain_id]["domain_kwargs"])
+                for domain_id in domain_ids
+            ]
+            if any(df.schema != dfs[0].schema for df in dfs[1:]):
+                continue
+
+            df: pyspark.DataFrame = reduce(
+                lambda left, right: left.unionByName(right),
+                [
+                    df.withColumn(BATCH_INDEX_COLUMN_NAME, F.lit(batch_index))
+                    for batch_index, df in enumerate(dfs)
+                ],
+            )
+            try:
+                res: List[pyspark.Row] = (
+                    df.groupBy(BATCH_INDEX_COLUMN_NAME)
+                    .agg(*aggregates[domain_ids[0]]["column_aggregates"])
+                    .collect()
+                )
+            except pyspark.AnalysisException as e:
+                logger.debug(
+                    f"""Multi-Batch aggregation failed ({type(e).__name__}: "{e!s}"); computing \
+metrics for each Batch separately."""
+                )
+                continue
+
+            row: pyspark.Row
+            for row in res:
+                # Batches without rows yield no group; they are left for per-Domain execution,
+                # which reports the aggregates of an empty selection.
+                aggregate = aggregates.pop(domain_ids[row[0]])
+                assert (
+                    len(aggregate["metric_ids"]) == len(row) - 1
+                ), "unexpected number of metrics returned"
+
+                idx: int
+                metric_id: Tuple[str, str, str]
+                for idx, metric_id in enumerate(aggregate["metric_ids"]):
+                    resolved_metrics[metric_id] = convert_to_json_serializable(data=row[idx + 1])
+
+            logger.debug(
+                f"SparkDFExecutionEngine computed metrics for {len(res)} Batches in a single job"
+            )
+
+        return resolved_metrics
+
     def head(self, n=5):
         """Returns dataframe head. Default is 5"""
         return self.dataframe.limit(n).toPandas()
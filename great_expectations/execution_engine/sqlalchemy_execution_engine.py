@@ -3,12 +3,14 @@ from __future__ import annotations
 import copy
 import datetime
 import hashlib
+import json
 import logging
 import math
 import os
 import random
 import re
 import string
+import time
 import traceback
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -17,11 +19,13 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Collection,
     Dict,
     Iterable,
     List,
     MutableMapping,
     Optional,
+    Sequence,
     Tuple,
     Union,
     cast,
@@ -87,6 +91,7 @@ from great_expectations.expectations.row_conditions import (
 )
 from great_expectations.util import (
     filter_properties_dict,
+    generate_temporary_table_name,
     get_sqlalchemy_selectable,
     get_sqlalchemy_url,
     import_library_module,
@@ -98,6 +103,19 @@ from great_expectations.validator.metric_configuration import (
 
 logger = logging.getLogger(__name__)
 
+# Column that tags each row of a partitioned table with the Batch (partition) it belongs to when
+# metrics for several Batches are computed in a single "GROUP BY" query.
+PARTITION_BATCH_INDEX_COLUMN_NAME = "__gx_batch_index"
+PARTITION_SOURCE_ALIAS = "gx_partitions"
+
+# Value sets larger than this are loaded into a temporary table and matched with a semi-join,
+# rather than being inlined as literals (e.g., in "column IN (...)").
+DEFAULT_VALUE_SET_JOIN_THRESHOLD = 10000
+VALUE_SET_COLUMN_NAME = "value"
+VALUE_SET_INSERT_CHUNK_SIZE = 10000
+
+# Reflected column metadata is reused for this long (e.g., across the partitions of a table).
+DEFAULT_SCHEMA_CACHE_TTL_SECONDS = 300.0
 
 if sa:
     make_url = import_make_url()
@@ -208,6 +226,20 @@ _PERSISTED_CONNECTION_DIALECTS = (
     GXSqlDialect.BIGQUERY,
 )
 
+# Dialects whose session-scoped temporary tables may be referenced repeatedly within one query.
+# Value set tables are cached across queries, so the queries must run on the connection that
+# created them: dialects not in "_PERSISTED_CONNECTION_DIALECTS" keep that connection (rather than
+# pooled ones) for as long as they hold value set tables.  BigQuery is not listed, since its
+# temporary tables require a session; "sqlalchemy-bigquery" already binds the values of "IN" as a
+# single array parameter ("IN UNNEST(@values)"), which does not grow the statement text.
+_VALUE_SET_TEMP_TABLE_DIALECTS = (
+    GXSqlDialect.SQLITE,
+    GXSqlDialect.MSSQL,
+    GXSqlDialect.POSTGRESQL,
+    GXSqlDialect.REDSHIFT,
+    GXSqlDialect.SNOWFLAKE,
+)
+
 
 def _dialect_requires_persisted_connection(
     connection_string: str | None = None,
@@ -275,6 +307,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
+        value_set_join_threshold (int): Value sets (e.g., of "expect_column_values_to_be_in_set") with more values \
+            than this are loaded into a temporary table and matched with a semi-join instead of being inlined as \
+            literals; None always inlines them.
+        schema_cache_ttl_seconds (float): How long the reflected columns of a table (or query) are reused \
+            before being reflected again; 0 disables the cache.
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -294,6 +331,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
+        value_set_join_threshold: Optional[int] = DEFAULT_VALUE_SET_JOIN_THRESHOLD,
+        schema_cache_ttl_seconds: float = DEFAULT_SCHEMA_CACHE_TTL_SECONDS,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine  # noqa: E501
         **kwargs,
     ) -> None:
@@ -304,6 +343,16 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._value_set_join_threshold = value_set_join_threshold
+        # Temporary tables holding large value sets, keyed by column type and values.
+        self._value_set_tables: Dict[Tuple[str, frozenset], sqlalchemy.Table] = {}
+        # Connection on which the value set tables were created; they do not outlive it.
+        self._value_set_tables_connection: sqlalchemy.Connection | None = None
+        self._schema_cache_ttl_seconds = schema_cache_ttl_seconds
+        # Column metadata, keyed by schema and table name (or query hash), with the time it expires.
+        self._schema_cache: Dict[
+            Tuple[Optional[str], str], Tuple[float, Sequence[Dict[str, Any]]]
+        ] = {}
         os.environ["SF_PARTNER"] = "great_expectations_oss"  # noqa: TID251
 
         # sqlite/mssql temp tables only persist within a connection, so we need to keep the connection alive by  # noqa: E501
@@ -481,6 +530,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
             )
 
+    @property
+    def value_set_join_threshold(self) -> Optional[int]:
+        return self._value_set_join_threshold
+
+    @property
+    def schema_cache_ttl_seconds(self) -> float:
+        return self._schema_cache_ttl_seconds
+
     @property
     def credentials(self) -> Optional[dict]:
         return self._credentials
@@ -1006,6 +1063,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
+        # Same-shaped metrics over several partitions of one table are computed in a single pass.
+        resolved_metrics.update(self._resolve_partitioned_batch_queries(queries=queries))
+
         for query in queries.values():
             domain_kwargs: dict = query["domain_kwargs"]
             selectable: sqlalchemy.Selectable = self.get_domain_records(domain_kwargs=domain_kwargs)
@@ -1057,6 +1117,181 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    def _resolve_partitioned_batch_queries(  # noqa: C901 - too complex
+        self, queries: Dict[Tuple[str, str, str], dict]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes bundled metric queries that differ only by the table partition they run on.
+
+        Queries whose Domain is an entire Batch carved out of a table by a partitioner, and whose
+        metric expressions are identical, are grouped and executed as one query that tags every row
+        with the Batch it belongs to and aggregates with "GROUP BY" on that tag.  Queries resolved
+        this way are removed from "queries"; all others are left for per-Domain execution.
+
+        Args:
+            queries: per-Domain metric queries, as assembled by "resolve_metric_bundle".
+
+        Returns:
+            A dictionary of "MetricConfiguration" IDs and their corresponding resolved values.
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        groups: Dict[tuple, List[Tuple[Tuple[str, str, str], BatchSpec]]] = {}
+
+        domain_id: Tuple[str, str, str]
+        query: dict
+        for domain_id, query in queries.items():
+            batch_spec: Optional[BatchSpec] = self._get_partitioned_table_batch_spec(
+                domain_kwargs=query["domain_kwargs"]
+            )
+            if batch_spec is None:
+                continue
+
+            select_signature: Optional[str] = self._get_select_signature(select=query["select"])
+            if select_signature is None:
+                continue
+
+            group_key: tuple = (
+                batch_spec["table_name"],
+                batch_spec.get("schema_name"),
+                batch_spec["partitioner_method"],
+                json.dumps(batch_spec["partitioner_kwargs"], sort_keys=True, default=str),
+                select_signature,
+            )
+            groups.setdefault(group_key, []).append((domain_id, batch_spec))
+
+        members: List[Tuple[Tuple[str, str, str], BatchSpec]]
+        for members in groups.values():
+            batch_identifiers: set = {
+                json.dumps(batch_spec["batch_identifiers"], sort_keys=True, default=str)
+                for _, batch_spec in members
+            }
+            if len(members) < 2 or len(batch_identifiers) < len(members):  # noqa: PLR2004
+                continue
+
+            rows_by_batch_index: Optional[Dict[int, tuple]] = self._execute_partitioned_query(
+                select=queries[members[0][0]]["select"],
+                batch_specs=[batch_spec for _, batch_spec in members],
+            )
+            if rows_by_batch_index is None:
+                continue
+
+            batch_index: int
+            for batch_index, (domain_id, _) in enumerate(members):
+                # A partition without rows yields no group; it is left for per-Domain execution,
+                # which reports the aggregates of an empty selection.
+                if batch_index not in rows_by_batch_index:
+                    continue
+
+                query = queries.pop(domain_id)
+                row: tuple = rows_by_batch_index[batch_index]
+                assert len(query["metric_ids"]) == len(row), "unexpected number of metrics returned"
+
+                idx: int
+                metric_id: Tuple[str, str, str]
+                for idx, metric_id in enumerate(query["metric_ids"]):
+                    resolved_metrics[metric_id] = convert_to_json_serializable(data=row[idx])
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed metrics for {len(rows_by_batch_index)} \
+partitions of table "{members[0][1]["table_name"]}" in a single query"""
+            )
+
+        return resolved_metrics
+
+    def _get_partitioned_table_batch_spec(self, domain_kwargs: dict) -> Optional[BatchSpec]:
+        """Returns the BatchSpec of the Batch that is the entire Domain, if it is a table partition.
+
+        Only Batches selected from a table by a partitioner, without sampling and without a
+        temporary table, are rebuilt from their BatchSpec; anything else returns None.
+        """
+        if any(value is not None for key, value in domain_kwargs.items() if key != "batch_id"):
+            return None
+
+        batch = self.batch_manager.batch_cache.get(domain_kwargs.get("batch_id"))  # type: ignore[arg-type]
+        if batch is None:
+            return None
+
+        batch_spec: BatchSpec = batch.batch_spec
+        if not (
+            isinstance(batch_spec, SqlAlchemyDatasourceBatchSpec)
+            and batch_spec.get("table_name")
+            and batch_spec.get("query") is None
+            and batch_spec.get("sampling_method") is None
+            and batch_spec.get("partitioner_method") is not None
+            and not batch_spec.get("create_temp_table", self._create_temp_table)
+        ):
+            return None
+
+        return batch_spec
+
+    def _get_select_signature(self, select: List[sqlalchemy.Label]) -> Optional[str]:
+        """Renders metric expressions, with literal values, for comparison across Domains.
+
+        Returns None if the expressions refer to their own tables or cannot be rendered.
+        """
+        sa_query_object: sqlalchemy.Select = sa.select(*select)
+        if sa_query_object.get_final_froms():
+            return None
+
+        try:
+            return str(
+                sa_query_object.compile(
+                    dialect=self.engine.dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+        except (sqlalchemy.SQLAlchemyError, NotImplementedError, TypeError, ValueError):
+            return None
+
+    def _execute_partitioned_query(
+        self, select: List[sqlalchemy.Label], batch_specs: List[BatchSpec]
+    ) -> Optional[Dict[int, tuple]]:
+        """Computes "select" for every partition in "batch_specs" with a single "GROUP BY" query.
+
+        Returns:
+            Metric values keyed by the position of the partition in "batch_specs" (partitions
+            without rows are absent), or None if the query could not be executed.
+        """
+        partitioner_fn: Callable = self._get_partitioner_method(
+            partitioner_method_name=batch_specs[0]["partitioner_method"]
+        )
+        partition_clauses: list = [
+            partitioner_fn(
+                batch_identifiers=batch_spec["batch_identifiers"],
+                **batch_spec["partitioner_kwargs"],
+            )
+            for batch_spec in batch_specs
+        ]
+
+        source = self._subselectable(batch_specs[0]).alias(PARTITION_SOURCE_ALIAS)  # type: ignore[attr-defined]
+        batch_index = sa.case(
+            *[(partition_clause, index) for index, partition_clause in enumerate(partition_clauses)]
+        ).label(PARTITION_BATCH_INDEX_COLUMN_NAME)
+        partitions = (
+            sa.select(sa.literal_column(f"{PARTITION_SOURCE_ALIAS}.*"), batch_index)
+            .select_from(source)
+            .where(sa.or_(*partition_clauses))
+            .subquery()
+        )
+        batch_index_column = partitions.c[PARTITION_BATCH_INDEX_COLUMN_NAME]
+        sa_query_object = (
+            sa.select(batch_index_column, *select)
+            .select_from(partitions)
+            .group_by(batch_index_column)
+        )
+
+        try:
+            logger.debug(f"Attempting query {sa_query_object!s}")
+            res = self.execute_query(sa_query_object).fetchall()
+        except sqlalchemy.SQLAlchemyError as e:
+            logger.debug(
+                f"""Partitioned metric query failed ({type(e).__name__}: "{e!s}"); computing \
+metrics for each partition separately."""
+            )
+            return None
+
+        return {row[0]: tuple(row[1:]) for row in res}
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1075,6 +1310,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """  # noqa: E501
+        self._clear_value_set_tables()
         if self._engine_backup:
             if self._connection:
                 self._connection.close()
@@ -1082,6 +1318,213 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         else:
             self.engine.dispose()
 
+    def get_value_set_selectable(
+        self, value_set: Collection[Any], column_type: Any
+    ) -> Optional[sqlalchemy.Select]:
+        """Returns a selectable of the values in "value_set", for membership tests as semi-joins.
+
+        Inlining a large value set as literals produces statements that are slow to compile,
+        transfer, and parse, and that may exceed the statement size limits of the database.  Value
+        sets with more than "value_set_join_threshold" values are instead loaded into a temporary
+        table, with a column of "column_type", once per distinct value set.  Temporary tables are
+        only used by dialects in "_VALUE_SET_TEMP_TABLE_DIALECTS"; on other dialects (e.g., MySQL),
+        large value sets are still inlined.
+
+        Args:
+            value_set: values to be matched.
+            column_type: SQLAlchemy type of the column that the values are matched against.
+
+        Returns:
+            A "SELECT" of the loaded values, or None if the values should be inlined.
+        """
+        if (
+            self._value_set_join_threshold is None
+            or len(value_set) <= self._value_set_join_threshold
+            or self.dialect_name not in _VALUE_SET_TEMP_TABLE_DIALECTS
+            or not isinstance(column_type, sqlalchemy.TypeEngine)
+            or isinstance(column_type, sa.types.NullType)
+        ):
+            return None
+
+        try:
+            key: Tuple[str, frozenset] = (repr(column_type), frozenset(value_set))
+        except TypeError:
+            return None
+
+        if not self._value_set_tables_connection_is_current():
+            self._clear_value_set_tables()
+
+        if key not in self._value_set_tables:
+            try:
+                self._value_set_tables[key] = self._create_value_set_table(
+                    values=list(key[1]), column_type=column_type
+                )
+            except sqlalchemy.SQLAlchemyError as e:
+                logger.warning(
+                    f"""Unable to load value set into a temporary table \
+({type(e).__name__}: "{e!s}"); the values will be inlined in the query."""
+                )
+                return None
+
+        value_set_table: sqlalchemy.Table = self._value_set_tables[key]
+        return sa.select(value_set_table.c[VALUE_SET_COLUMN_NAME])
+
+    def _value_set_tables_connection_is_current(self) -> bool:
+        """Whether the cached value set tables are still visible to the queries of this engine.
+
+        Temporary tables are dropped with the connection that created them, so they are gone once
+        the persisted connection has been closed, invalidated, or replaced by a new one.
+        """
+        connection: sqlalchemy.Connection | None = self._value_set_tables_connection
+        return (
+            connection is not None
+            and connection is self._connection
+            and not connection.closed
+            and not connection.invalidated
+        )
+
+    def _clear_value_set_tables(self) -> None:
+        self._value_set_tables.clear()
+        self._value_set_tables_connection = None
+        if self.dialect_name not in _PERSISTED_CONNECTION_DIALECTS and self._connection:
+            # Return the connection kept for the value set tables to the pool.
+            self._connection.close()
+            self._connection = None
+
+    def _create_value_set_table(self, values: List[Any], column_type: Any) -> sqlalchemy.Table:
+        if self.dialect_name not in _PERSISTED_CONNECTION_DIALECTS and not self._connection:
+            # Pooled connections cannot see the temporary tables of this one, so queries run on it
+            # from now on (see "get_connection()").
+            self._connection = self.engine.connect()
+
+        temp_table_name: str = generate_temporary_table_name()
+        prefixes: List[str] = ["TEMPORARY"]
+        # mssql expects all temporary table names to have a prefix '#'
+        if self.dialect_name == GXSqlDialect.MSSQL:
+            temp_table_name = f"#{temp_table_name}"
+            prefixes = []
+
+        value_set_table = sa.Table(
+            temp_table_name,
+            sa.MetaData(),
+            sa.Column(VALUE_SET_COLUMN_NAME, column_type),
+            prefixes=prefixes,
+        )
+
+        def _load_values(connection: sqlalchemy.Connection) -> None:
+            value_set_table.create(bind=connection)
+            for start in range(0, len(values), VALUE_SET_INSERT_CHUNK_SIZE):
+                connection.execute(
+                    value_set_table.insert(),
+                    [
+                        {VALUE_SET_COLUMN_NAME: value}
+                        for value in values[start : start + VALUE_SET_INSERT_CHUNK_SIZE]
+                    ],
+                )
+
+        with self.get_connection() as connection:
+            if (
+                is_version_greater_or_equal(sqlalchemy.sqlalchemy.__version__, "2.0.0")
+                and not connection.closed
+            ):
+                _load_values(connection=connection)
+                connection.commit()
+            else:
+                with connection.begin():
+                    _load_values(connection=connection)
+
+        self._value_set_tables_connection = connection
+        return value_set_table
+
+    def get_cached_column_metadata(
+        self,
+        table_selectable: Union[str, sqlalchemy.TextClause, sqlalchemy.Select],
+        schema_name: Optional[str] = None,
+    ) -> Optional[Sequence[Dict[str, Any]]]:
+        """Returns the column metadata cached for a table (or query), unless it has expired.
+
+        Args:
+            table_selectable: name of the table, or the text of a custom query.
+            schema_name: schema of the table.
+
+        Returns:
+            The cached column metadata, or None if it has to be reflected (again).
+        """
+        key = self._get_schema_cache_key(table_selectable=table_selectable, schema_name=schema_name)
+        entry = self._schema_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, columns = entry
+        if time.monotonic() >= expires_at:
+            # The inspector caches reflected tables too, so it is reset to reflect them again.
+            self._schema_cache.pop(key, None)
+            self._inspector = None
+            return None
+
+        return columns
+
+    def cache_column_metadata(
+        self,
+        table_selectable: Union[str, sqlalchemy.TextClause, sqlalchemy.Select],
+        columns: Sequence[Dict[str, Any]],
+        schema_name: Optional[str] = None,
+    ) -> None:
+        """Caches the column metadata of a table (or query) for "schema_cache_ttl_seconds".
+
+        Expired entries, e.g., of temporary tables that are never looked up again, are pruned.
+
+        Args:
+            table_selectable: name of the table, or the text of a custom query.
+            columns: reflected column metadata.
+            schema_name: schema of the table.
+        """
+        if self._schema_cache_ttl_seconds <= 0:
+            return
+
+        now: float = time.monotonic()
+        expired_keys = [
+            key for key, (expires_at, _) in self._schema_cache.items() if now >= expires_at
+        ]
+        for key in expired_keys:
+            del self._schema_cache[key]
+
+        key = self._get_schema_cache_key(table_selectable=table_selectable, schema_name=schema_name)
+        self._schema_cache[key] = (now + self._schema_cache_ttl_seconds, columns)
+
+    def invalidate_schema_cache(
+        self, table_name: Optional[str] = None, schema_name: Optional[str] = None
+    ) -> None:
+        """Forgets cached column metadata, e.g., after the schema of a table has been altered.
+
+        Args:
+            table_name: table to forget; if None, all tables (of "schema_name", if given).
+            schema_name: schema of the tables to forget.
+        """
+        if table_name is not None:
+            self._schema_cache.pop(
+                self._get_schema_cache_key(table_selectable=table_name, schema_name=schema_name),
+                None,
+            )
+        elif schema_name is not None:
+            for key in [key for key in self._schema_cache if key[0] == schema_name]:
+                del self._schema_cache[key]
+        else:
+            self._schema_cache.clear()
+
+        self._inspector = None
+
+    @staticmethod
+    def _get_schema_cache_key(
+        table_selectable: Union[str, sqlalchemy.TextClause, sqlalchemy.Select],
+        schema_name: Optional[str],
+    ) -> Tuple[Optional[str], str]:
+        if sqlalchemy.TextClause and isinstance(table_selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
+            query_hash = hashlib.sha256(str(table_selectable).encode("utf-8")).hexdigest()
+            return schema_name, f"query:{query_hash}"
+
+        return schema_name, str(table_selectable)
+
     def _get_partitioner_method(self, partitioner_method_name: str) -> Callable:
         """Get the appropriate partitioner method from the method name.
 
@@ -1304,6 +1747,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 # Temp tables only persist within a connection for some dialects,
                 # so we need to keep the connection alive.
                 pass
+        elif self._connection:
+            # The connection holding the temporary tables of large value sets.
+            try:
+                yield self._connection
+            except Exception:
+                # A failed statement aborts the open transaction (e.g., on PostgreSQL), which would
+                # fail every later query on this connection; the value set tables were committed.
+                transaction = self._connection.get_transaction()
+                if transaction is not None:
+                    transaction.rollback()
+                raise
         else:
             with self.engine.connect() as connection:
                 yield connection
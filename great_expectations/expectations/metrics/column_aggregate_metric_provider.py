@@ -85,12 +85,15 @@ def column_aggregate_value(
 
                 column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
 
+                column = df[column_name]
                 if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                    column = column[
+                        ~execution_engine.get_column_null_mask(domain_kwargs=metric_domain_kwargs)
+                    ]
 
                 return metric_fn(
                     cls,
-                    column=df[column_name],
+                    column=column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
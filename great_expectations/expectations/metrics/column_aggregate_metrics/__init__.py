@@ -1,6 +1,7 @@
 from .column_distinct_values import (
     ColumnDistinctValues,
     ColumnDistinctValuesCount,
+    ColumnDistinctValuesCountApprox,
     ColumnDistinctValuesCountUnderThreshold,
 )
 from .column_histogram import ColumnHistogram
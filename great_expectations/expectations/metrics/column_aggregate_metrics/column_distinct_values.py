@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
+import numpy as np
+import pandas as pd
+
 from great_expectations.compatibility.pyspark import (
     functions as F,
 )
@@ -14,6 +17,7 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
@@ -23,8 +27,6 @@ from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
-    import pandas as pd
-
     from great_expectations.compatibility import pyspark, sqlalchemy
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
@@ -186,3 +188,100 @@ class ColumnDistinctValuesCountUnderThreshold(ColumnAggregateMetricProvider):
                 metric_value_kwargs=None,
             )
         return dependencies
+
+
+# Leading hash bits that address HyperLogLog registers (2**14 registers, ~0.8% standard error).
+HYPERLOGLOG_PRECISION = 14
+
+# Relative standard deviation requested from Spark "approx_count_distinct()".
+SPARK_APPROX_COUNT_DISTINCT_RSD = 0.01
+
+# Native approximate distinct count functions; other dialects compute the exact count.
+SQL_APPROX_COUNT_DISTINCT_FUNCTION_NAMES: Dict[GXSqlDialect, str] = {
+    GXSqlDialect.AWSATHENA: "approx_distinct",
+    GXSqlDialect.BIGQUERY: "approx_count_distinct",
+    GXSqlDialect.CLICKHOUSE: "uniq",
+    GXSqlDialect.DATABRICKS: "approx_count_distinct",
+    GXSqlDialect.ORACLE: "approx_count_distinct",
+    GXSqlDialect.SNOWFLAKE: "approx_count_distinct",
+    GXSqlDialect.TRINO: "approx_distinct",
+    GXSqlDialect.VERTICA: "approximate_count_distinct",
+}
+
+
+def hyperloglog_registers(column: pd.Series, precision: int = HYPERLOGLOG_PRECISION) -> np.ndarray:
+    """Builds the HyperLogLog sketch of the non-null values in "column".
+
+    Sketches built with the same precision are merged by taking their element-wise maximum.
+    """
+    hashes: np.ndarray = pd.util.hash_pandas_object(column.dropna(), index=False).to_numpy(
+        dtype=np.uint64
+    )
+    registers: np.ndarray = np.zeros(1 << precision, dtype=np.uint8)
+    if hashes.size == 0:
+        return registers
+
+    register_indices: np.ndarray = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+    # The top 53 remaining bits convert to float64 exactly, so "frexp()" yields their bit length.
+    remaining_bits: np.ndarray = ((hashes << np.uint64(precision)) >> np.uint64(11)).astype(
+        np.float64
+    )
+    _, bit_lengths = np.frexp(remaining_bits)
+    ranks: np.ndarray = np.where(remaining_bits > 0, 54 - bit_lengths, 64 - precision + 1).astype(
+        np.uint8
+    )
+    np.maximum.at(registers, register_indices, ranks)
+    return registers
+
+
+def hyperloglog_estimate(registers: np.ndarray) -> int:
+    """Estimates the number of distinct values summarized by HyperLogLog "registers"."""
+    num_registers: int = registers.size
+    alpha: float = 0.7213 / (1.0 + 1.079 / num_registers)
+    estimate: float = alpha * num_registers**2 / np.sum(np.exp2(-registers.astype(np.float64)))
+    num_empty_registers: int = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * num_registers and num_empty_registers > 0:
+        # Linear counting is more accurate for small cardinalities.
+        estimate = num_registers * np.log(num_registers / num_empty_registers)
+
+    return int(round(estimate))
+
+
+class ColumnDistinctValuesCountApprox(ColumnAggregateMetricProvider):
+    """Estimated number of distinct non-null values, for cardinality checks on wide or large tables.
+
+    Pandas uses a HyperLogLog sketch; Spark and SQL dialects with a native approximate distinct
+    count function use it, and other SQL dialects compute the exact count.
+    """
+
+    metric_name = "column.distinct_values.count.approx"
+
+    @column_aggregate_value(engine=PandasExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _pandas(cls, column: pd.Series, **kwargs) -> int:
+        return hyperloglog_estimate(registers=hyperloglog_registers(column=column))
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _sqlalchemy(
+        cls,
+        column: sqlalchemy.ColumnClause,
+        _dialect: sqlalchemy.Dialect,
+        **kwargs,
+    ) -> sqlalchemy.Selectable:
+        try:
+            dialect = GXSqlDialect(_dialect.name.lower())
+        except ValueError:
+            dialect = GXSqlDialect.OTHER
+
+        function_name: Optional[str] = SQL_APPROX_COUNT_DISTINCT_FUNCTION_NAMES.get(dialect)
+        if function_name is None:
+            return sa.func.count(sa.distinct(column))
+
+        return getattr(sa.func, function_name)(column)
+
+    @column_aggregate_partial(engine=SparkDFExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _spark(
+        cls,
+        column: pyspark.Column,
+        **kwargs,
+    ) -> pyspark.Column:
+        return F.approx_count_distinct(column, rsd=SPARK_APPROX_COUNT_DISTINCT_RSD)
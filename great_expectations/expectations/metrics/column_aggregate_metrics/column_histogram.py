@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import copy
 import logging
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Final, List
 
 import numpy as np
 
@@ -18,6 +18,7 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
 )
@@ -29,6 +30,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# SQL Server allows "CASE" expressions to be nested at most 10 levels deep.
+MAX_BIN_INDEX_CASE_DEPTH: Final[int] = 10
+
 
 class ColumnHistogram(ColumnAggregateMetricProvider):
     metric_name = "column.histogram"
@@ -80,42 +84,23 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
         else:
             bins = list(bins)
 
-        case_conditions = []
-        if len(bins) == 1 and not (
-            (
-                bins[0]
-                == get_sql_dialect_floating_point_infinity_value(schema="api_np", negative=True)
-            )
-            or (
-                bins[0]
-                == get_sql_dialect_floating_point_infinity_value(schema="api_cast", negative=True)
-            )
-            or (
-                bins[0]
-                == get_sql_dialect_floating_point_infinity_value(schema="api_np", negative=False)
-            )
-            or (
-                bins[0]
-                == get_sql_dialect_floating_point_infinity_value(schema="api_cast", negative=False)
-            )
-        ):
+        if len(bins) == 1 and not _is_infinity(bins[0]):
             # Single-valued column data are modeled using "impulse" (or "sample") distributions (on open interval).  # noqa: E501
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        (
-                            sa.and_(
-                                float(bins[0] - np.finfo(float).eps) < sa.column(column),
-                                sa.column(column) < float(bins[0] + np.finfo(float).eps),
-                            ),
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label("bin_0")
-            )
             query = (
-                sa.select(*case_conditions)
+                sa.select(
+                    sa.func.sum(
+                        sa.case(
+                            (
+                                sa.and_(
+                                    float(bins[0] - np.finfo(float).eps) < sa.column(column),
+                                    sa.column(column) < float(bins[0] + np.finfo(float).eps),
+                                ),
+                                1,
+                            ),
+                            else_=0,
+                        )
+                    ).label("bin_0")
+                )
                 .where(
                     sa.column(column) != None,  # noqa: E711
                 )
@@ -127,85 +112,41 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
                 list(execution_engine.execute_query(query).fetchone())  # type: ignore[arg-type]
             )
 
-        idx = 0
-
-        # If we have an infinite lower bound, don't express that in sql
-        if (
-            bins[0] == get_sql_dialect_floating_point_infinity_value(schema="api_np", negative=True)
-        ) or (
-            bins[0]
-            == get_sql_dialect_floating_point_infinity_value(schema="api_cast", negative=True)
-        ):
-            case_conditions.append(
-                sa.func.sum(sa.case((sa.column(column) < bins[idx + 1], 1), else_=0)).label(
-                    f"bin_{idx!s}"
-                )
-            )
-            idx += 1
-
-        negative_boundary: float
-        positive_boundary: float
-        for idx in range(  # noqa: B020 # loop-variable-overrides-iterator
-            idx, len(bins) - 2
-        ):
-            negative_boundary = float(bins[idx])
-            positive_boundary = float(bins[idx + 1])
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        (
-                            sa.and_(
-                                negative_boundary <= sa.column(column),
-                                sa.column(column) < positive_boundary,
-                            ),
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label(f"bin_{idx!s}")
-            )
-
-        if (
-            bins[-1]
-            == get_sql_dialect_floating_point_infinity_value(schema="api_np", negative=False)
-        ) or (
-            bins[-1]
-            == get_sql_dialect_floating_point_infinity_value(schema="api_cast", negative=False)
-        ):
-            negative_boundary = float(bins[-2])
-            case_conditions.append(
-                sa.func.sum(sa.case((negative_boundary <= sa.column(column), 1), else_=0)).label(
-                    f"bin_{len(bins) - 1!s}"
-                )
-            )
-        else:
-            negative_boundary = float(bins[-2])
-            positive_boundary = float(bins[-1])
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        (
-                            sa.and_(
-                                negative_boundary <= sa.column(column),
-                                sa.column(column) <= positive_boundary,
-                            ),
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label(f"bin_{len(bins) - 1!s}")
-            )
-
-        query = (
-            sa.select(*case_conditions)
-            .where(
-                sa.column(column) != None,  # noqa: E711
+        # Bins are closed on the left and open on the right, except for the last one, which is
+        # closed on both sides (like in "numpy.histogram").  Hence, the bin of a value is given by
+        # the number of interior bin edges not greater than it, and one "GROUP BY" counts all bins.
+        # (The bins themselves come from "column.partition", whose min/max or quantile metrics
+        # are still computed by separate queries, so a column takes more than this one query.)
+        interior_edges = [float(edge) for edge in bins[1:-1]]
+        conditions = [sa.column(column) != None]  # noqa: E711
+        # If we have an infinite bound, don't express that in sql
+        if not _is_infinity(bins[0]):
+            conditions.append(float(bins[0]) <= sa.column(column))
+        if not _is_infinity(bins[-1]):
+            conditions.append(sa.column(column) <= float(bins[-1]))
+
+        bin_index_query = (
+            sa.select(
+                _get_sqlalchemy_bin_index(
+                    column=sa.column(column),
+                    interior_edges=interior_edges,
+                    dialect_name=execution_engine.dialect_name,
+                ).label("bin_index")
             )
+            .where(sa.and_(*conditions))
             .select_from(selectable)  # type: ignore[arg-type]
+            .subquery()
+        )
+        query = sa.select(bin_index_query.c.bin_index, sa.func.count()).group_by(
+            bin_index_query.c.bin_index
         )
 
-        # Run the data through convert_to_json_serializable to ensure we do not have Decimal types
-        return convert_to_json_serializable(list(execution_engine.execute_query(query).fetchone()))  # type: ignore[arg-type]
+        # Only the bins holding values are returned by the query.
+        hist = [0] * (len(bins) - 1)
+        for bin_index, count in execution_engine.execute_query(query).fetchall():
+            hist[int(bin_index)] = int(count)
+
+        return hist
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(  # noqa: C901
@@ -279,3 +220,69 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
                 logger.warning("Discarding histogram values above highest bin.")
 
         return hist
+
+
+def _is_infinity(value: Any) -> bool:
+    return value in (
+        get_sql_dialect_floating_point_infinity_value(schema="api_np", negative=True),
+        get_sql_dialect_floating_point_infinity_value(schema="api_cast", negative=True),
+        get_sql_dialect_floating_point_infinity_value(schema="api_np", negative=False),
+        get_sql_dialect_floating_point_infinity_value(schema="api_cast", negative=False),
+    )
+
+
+def _get_sqlalchemy_bin_index(
+    column: sa.ColumnClause, interior_edges: List[float], dialect_name: str
+) -> sa.ColumnElement:
+    """Returns the SQL expression counting the (sorted) interior bin edges not greater than the column value."""  # noqa: E501
+    if not interior_edges:
+        return sa.literal(0)
+
+    if dialect_name == GXSqlDialect.POSTGRESQL:
+        # The native "WIDTH_BUCKET(operand, thresholds)" searches the thresholds array for the bin.
+        return sa.func.width_bucket(
+            sa.cast(column, sa.Float),
+            sa.cast(sa.literal(interior_edges, type_=sa.ARRAY(sa.Float)), sa.ARRAY(sa.Float)),
+        )
+
+    # Elsewhere, nested "CASE" expressions perform a binary search, so that every value is
+    # compared with (logarithmically) few edges, rather than every bin aggregating all rows.  The
+    # search is at most "MAX_BIN_INDEX_CASE_DEPTH" levels deep; beyond 2**9 - 1 edges, the
+    # innermost levels compare values with several edges each.
+    return _get_sqlalchemy_bin_index_case(column=column, interior_edges=interior_edges, offset=0)
+
+
+def _get_sqlalchemy_bin_index_case(
+    column: sa.ColumnClause,
+    interior_edges: List[float],
+    offset: int,
+    depth: int = MAX_BIN_INDEX_CASE_DEPTH,
+) -> sa.ColumnElement:
+    if not interior_edges:
+        return sa.literal(offset)
+
+    if depth <= 1:
+        # The innermost "CASE" scans its remaining edges in order, rather than nesting further.
+        return sa.case(
+            *[(column < edge, offset + index) for index, edge in enumerate(interior_edges)],
+            else_=offset + len(interior_edges),
+        )
+
+    middle = len(interior_edges) // 2
+    return sa.case(
+        (
+            column < interior_edges[middle],
+            _get_sqlalchemy_bin_index_case(
+                column=column,
+                interior_edges=interior_edges[:middle],
+                offset=offset,
+                depth=depth - 1,
+            ),
+        ),
+        else_=_get_sqlalchemy_bin_index_case(
+            column=column,
+            interior_edges=interior_edges[middle + 1 :],
+            offset=offset + middle + 1,
+            depth=depth - 1,
+        ),
+    )
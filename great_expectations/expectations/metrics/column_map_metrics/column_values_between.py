@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import datetime
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import pandas as pd
 from dateutil.parser import parse
@@ -59,6 +59,12 @@ class ColumnValuesBetween(ColumnMapMetricProvider):
                 max_value = parse(max_value)
 
             return cls._pandas_vectorized(temp_column, min_value, max_value, strict_min, strict_max)
+        elif pd.api.types.is_object_dtype(column.dtype):
+            result = cls._pandas_object_vectorized(
+                temp_column, min_value, max_value, strict_min, strict_max
+            )
+            if result is not None:
+                return result
 
         def is_between(val):  # noqa: C901, PLR0911, PLR0912
             # TODO Might be worth explicitly defining comparisons between types (for example, between strings and ints).  # noqa: E501
@@ -153,6 +159,36 @@ class ColumnValuesBetween(ColumnMapMetricProvider):
         else:
             return (min_value <= column) & (column <= max_value)
 
+    @classmethod
+    def _pandas_object_vectorized(
+        cls,
+        column: pd.Series,
+        min_value: Any,
+        max_value: Any,
+        strict_min: bool,
+        strict_max: bool,
+    ) -> Optional[pd.Series]:
+        """Compares object columns holding one type of value (e.g., strings or dates) at once.
+
+        The type of the values is inferred once, to check that strings are only compared with
+        strings; the values are then compared by pandas over the whole column.  Returns None for
+        columns with mixed types of values (including None), which are compared row by row.
+        """
+        if column.empty:
+            return None
+
+        inferred_type: str = pd.api.types.infer_dtype(column, skipna=False)
+        if inferred_type.startswith("mixed") and inferred_type != "mixed-integer-float":
+            return None
+
+        bounds = [value for value in (min_value, max_value) if value is not None]
+        if (inferred_type == "string") != all(isinstance(value, str) for value in bounds):
+            raise TypeError(  # noqa: TRY003
+                "Column values, min_value, and max_value must either be None or of the same type."
+            )
+
+        return cls._pandas_vectorized(column, min_value, max_value, strict_min, strict_max)
+
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(  # noqa: C901, PLR0911
         cls,
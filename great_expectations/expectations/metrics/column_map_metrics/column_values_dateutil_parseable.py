@@ -7,6 +7,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_pandas_distinct_values
 
 
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
@@ -27,4 +28,4 @@ class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
             except (ValueError, OverflowError):
                 return False
 
-        return column.map(is_parseable)
+        return map_pandas_distinct_values(column=column, func=is_parseable)
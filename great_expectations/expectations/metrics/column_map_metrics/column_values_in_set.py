@@ -14,6 +14,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import get_sqlalchemy_value_set_selectable
 
 try:
     import sqlalchemy as sa  # noqa: TID251
@@ -72,6 +73,16 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
                     and isinstance(column_info["type"], sa.Boolean)
                 ):
                     return sa.or_(*[column == value for value in value_set])
+
+        value_set_selectable = get_sqlalchemy_value_set_selectable(
+            column=column,
+            value_set=value_set,
+            execution_engine=kwargs.get("_execution_engine"),
+            metrics=kwargs.get("_metrics"),
+        )
+        if value_set_selectable is not None:
+            return column.in_(value_set_selectable)
+
         return column.in_(value_set)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
@@ -12,6 +12,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import json_loads, map_pandas_distinct_values
 
 
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
@@ -21,12 +22,12 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
     def _pandas(cls, column, **kwargs):
         def is_json(val):
             try:
-                json.loads(val)
+                json_loads(val)
                 return True
             except Exception:
                 return False
 
-        return column.map(is_json)
+        return map_pandas_distinct_values(column=column, func=is_json)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, **kwargs):
@@ -14,6 +14,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import json_loads, map_pandas_distinct_values
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 
@@ -23,21 +24,15 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, json_schema, **kwargs):
+        # The schema is checked, and its validator built, once rather than for every value.
+        validator_class = jsonschema.validators.validator_for(json_schema)
+        validator_class.check_schema(json_schema)
+        validator = validator_class(json_schema)
+
         def matches_json_schema(val):
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
+            return validator.is_valid(json_loads(val))
 
-        return column.map(matches_json_schema)
+        return map_pandas_distinct_values(column=column, func=matches_json_schema)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, json_schema, **kwargs):
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import logging
-
-import pandas as pd
+from functools import reduce
 
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine import (
@@ -14,7 +13,11 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import get_dialect_regex_expression
+from great_expectations.expectations.metrics.util import (
+    combine_regex_list,
+    get_dialect_regex_expression,
+    match_pandas_regex_list,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,19 +32,7 @@ class ColumnValuesMatchRegexList(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex_list, match_on, **kwargs):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
-        if match_on == "any":
-            result = regex_match_df.any(axis="columns")
-        elif match_on == "all":
-            result = regex_match_df.all(axis="columns")
-        else:
-            raise ValueError("match_on must be either 'any' or 'all'")  # noqa: TRY003
-
-        return result
+        return match_pandas_regex_list(column=column, regex_list=regex_list, match_on=match_on)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, regex_list, match_on, _dialect, **kwargs):
@@ -57,6 +48,10 @@ class ColumnValuesMatchRegexList(ColumnMapMetricProvider):
             raise NotImplementedError
 
         if match_on == "any":
+            combined_regex = combine_regex_list(regex_list=regex_list, capturing=True)
+            if combined_regex is not None:
+                return get_dialect_regex_expression(column, combined_regex, _dialect)
+
             condition = sa.or_(
                 *(get_dialect_regex_expression(column, regex, _dialect) for regex in regex_list)
             )
@@ -69,7 +64,11 @@ class ColumnValuesMatchRegexList(ColumnMapMetricProvider):
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, regex_list, match_on, **kwargs):
         if match_on == "any":
-            return column.rlike("|".join(regex_list))
+            combined_regex = combine_regex_list(regex_list=regex_list)
+            if combined_regex is not None:
+                return column.rlike(combined_regex)
+
+            return reduce(lambda a, b: a | b, (column.rlike(regex) for regex in regex_list))
         elif match_on == "all":
             formatted_regex_list = [f"(?={regex})" for regex in regex_list]
             return column.rlike("".join(formatted_regex_list))
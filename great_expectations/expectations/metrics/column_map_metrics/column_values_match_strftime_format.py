@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Final, Tuple
+
+import pandas as pd
 
 from great_expectations.compatibility import pyspark
 from great_expectations.compatibility.pyspark import functions as F
@@ -12,6 +15,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_pandas_distinct_values
+
+# pandas parses these literals as the current time, whatever the format.
+_PANDAS_DATETIME_LITERALS: Final[Tuple[str, ...]] = ("now", "today")
 
 
 class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
@@ -31,7 +38,30 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
             except ValueError:
                 return False
 
-        return column.map(is_parseable_by_format)
+        # pandas reads up to nine fractional digits for "%f", where strptime reads at most six.
+        if pd.api.types.infer_dtype(column, skipna=False) != "string" or "%f" in strftime_format:
+            return map_pandas_distinct_values(column=column, func=is_parseable_by_format)
+
+        try:
+            # With "utc", values with differing "%z" offsets are parsed into a single time zone.
+            is_parsed = (
+                pd.to_datetime(column, format=strftime_format, errors="coerce", utc=True)
+                .notna()
+                .to_numpy(dtype=bool)
+            )
+        except (ValueError, TypeError, OverflowError):
+            return map_pandas_distinct_values(column=column, func=is_parseable_by_format)
+
+        is_parsed &= ~column.isin(_PANDAS_DATETIME_LITERALS).to_numpy(dtype=bool)
+
+        # Values that pandas could not parse (e.g., out of bounds dates) or parsed as the current
+        # time are checked with strptime.
+        if not is_parsed.all():
+            is_parsed[~is_parsed] = map_pandas_distinct_values(
+                column=column[~is_parsed], func=is_parseable_by_format
+            ).to_numpy()
+
+        return pd.Series(is_parsed, index=column.index)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, strftime_format, **kwargs):
@@ -20,6 +20,9 @@ from great_expectations.expectations.metrics.metric_provider import (
     MetricProvider,
     metric_value,
 )
+from great_expectations.expectations.metrics.util import (
+    get_dbms_compatible_metric_domain_kwargs,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
@@ -44,6 +47,19 @@ class ColumnValuesNonNull(ColumnMapMetricProvider):
     def _spark(cls, column, **kwargs):
         return column.isNotNull()
 
+    @metric_value(
+        engine=PandasExecutionEngine,
+        metric_name_suffix=f".{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+    )
+    def _pandas_unexpected_count(*, execution_engine, metric_domain_kwargs, metrics, **kwargs):
+        """Reads the null count of the column from the counts computed for all columns at once."""
+        metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+            metric_domain_kwargs=metric_domain_kwargs,
+            batch_columns_list=metrics["table.columns"],
+        )
+        null_counts = execution_engine.get_column_null_counts(domain_kwargs=metric_domain_kwargs)
+        return int(null_counts[metric_domain_kwargs["column"]])
+
 
 class ColumnValuesNonNullCount(MetricProvider):
     """A convenience class to provide an alias for easier access to the null count in a column."""
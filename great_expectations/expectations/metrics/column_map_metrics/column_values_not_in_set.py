@@ -12,7 +12,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import parse_value_set
+from great_expectations.expectations.metrics.util import (
+    get_sqlalchemy_value_set_selectable,
+    parse_value_set,
+)
 
 
 class ColumnValuesNotInSet(ColumnMapMetricProvider):
@@ -46,6 +49,15 @@ class ColumnValuesNotInSet(ColumnMapMetricProvider):
         if value_set is None or len(value_set) == 0:
             return True
 
+        value_set_selectable = get_sqlalchemy_value_set_selectable(
+            column=column,
+            value_set=value_set,
+            execution_engine=kwargs.get("_execution_engine"),
+            metrics=kwargs.get("_metrics"),
+        )
+        if value_set_selectable is not None:
+            return column.notin_(value_set_selectable)
+
         return column.notin_(tuple(value_set))
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import logging
 
-import pandas as pd
-
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -14,7 +12,11 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import get_dialect_regex_expression
+from great_expectations.expectations.metrics.util import (
+    combine_regex_list,
+    get_dialect_regex_expression,
+    match_pandas_regex_list,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +27,7 @@ class ColumnValuesNotMatchRegexList(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex_list, **kwargs):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
-        return ~regex_match_df.any(axis="columns")
+        return ~match_pandas_regex_list(column=column, regex_list=regex_list, match_on="any")
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, regex_list, _dialect, **kwargs):
@@ -44,6 +41,10 @@ class ColumnValuesNotMatchRegexList(ColumnMapMetricProvider):
             logger.warning(f"Regex is not supported for dialect {_dialect!s}")
             raise NotImplementedError
 
+        combined_regex = combine_regex_list(regex_list=regex_list, capturing=True)
+        if combined_regex is not None:
+            return get_dialect_regex_expression(column, combined_regex, _dialect, positive=False)
+
         return sa.and_(
             *(
                 get_dialect_regex_expression(column, regex, _dialect, positive=False)
@@ -53,6 +54,10 @@ class ColumnValuesNotMatchRegexList(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, regex_list, **kwargs):
+        combined_regex = combine_regex_list(regex_list=regex_list)
+        if combined_regex is not None:
+            return ~column.rlike(combined_regex)
+
         compound = None
         for regex in regex_list:
             if compound is None:
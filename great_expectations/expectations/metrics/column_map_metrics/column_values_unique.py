@@ -5,7 +5,11 @@ from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
-from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypes,
+    SummarizationMetricNameSuffixes,
+)
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -15,7 +19,11 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.util import generate_temporary_table_name
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import (
+    get_dbms_compatible_metric_domain_kwargs,
+)
+from great_expectations.util import generate_temporary_table_name, get_sqlalchemy_selectable
 
 
 class ColumnValuesUnique(ColumnMapMetricProvider):
@@ -48,6 +56,7 @@ class ColumnValuesUnique(ColumnMapMetricProvider):
         # This is a special case that needs to be handled for mysql, where you cannot refer to a temp_table  # noqa: E501
         # more than once in the same query. So instead of passing dup_query as-is, a second temp_table is created with  # noqa: E501
         # the column we will be performing the expectation on, and the query is performed against it.  # noqa: E501
+        # Only the duplicated values are materialized, so the temp_table holds a single aggregation result.  # noqa: E501
         dialect = kwargs.get("_dialect")
         sql_engine = kwargs.get("_sqlalchemy_engine")
         execution_engine = kwargs.get("_execution_engine")
@@ -60,14 +69,9 @@ class ColumnValuesUnique(ColumnMapMetricProvider):
                 dialect_name = ""
         if sql_engine and dialect and dialect_name == "mysql":
             temp_table_name = generate_temporary_table_name()
-            temp_table_stmt = f"CREATE TEMPORARY TABLE {temp_table_name} AS SELECT tmp.{column.name} FROM {_table} tmp"  # noqa: E501
+            temp_table_stmt = f"CREATE TEMPORARY TABLE {temp_table_name} AS SELECT tmp.{column.name} FROM {_table} tmp GROUP BY tmp.{column.name} HAVING COUNT(tmp.{column.name}) > 1"  # noqa: E501
             execution_engine.execute_query_in_transaction(sa.text(temp_table_stmt))
-            dup_query = (
-                sa.select(column)
-                .select_from(sa.text(temp_table_name))
-                .group_by(column)
-                .having(sa.func.count(column) > 1)
-            )
+            dup_query = sa.select(column).select_from(sa.text(temp_table_name))
         else:
             dup_query = (
                 sa.select(column)
@@ -83,3 +87,58 @@ class ColumnValuesUnique(ColumnMapMetricProvider):
     )
     def _spark(cls, column, **kwargs):
         return F.count(F.lit(1)).over(pyspark.Window.partitionBy(column)) <= 1
+
+    @metric_value(
+        engine=SqlAlchemyExecutionEngine,
+        metric_name_suffix=f".{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+    )
+    def _sqlalchemy_unexpected_count(*, execution_engine, metric_domain_kwargs, metrics, **kwargs):
+        """Counts the rows holding duplicated values with a single GROUP BY ... HAVING query.
+
+        The row-wise condition above (and, on MySQL, its temporary table) is only evaluated when
+        unexpected rows or values are requested.
+        """
+        metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+            metric_domain_kwargs=metric_domain_kwargs,
+            batch_columns_list=metrics["table.columns"],
+        )
+        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column = sa.column(accessor_domain_kwargs["column"])
+
+        duplicate_counts = (
+            sa.select(sa.func.count(column).label("_num_rows"))
+            .select_from(get_sqlalchemy_selectable(selectable))
+            .group_by(column)
+            .having(sa.func.count(column) > 1)
+            .subquery()
+        )
+        unexpected_count = execution_engine.execute_query(
+            sa.select(sa.func.sum(duplicate_counts.c._num_rows))
+        ).scalar()
+        return int(unexpected_count or 0)
+
+    @metric_value(
+        engine=SparkDFExecutionEngine,
+        metric_name_suffix=f".{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+    )
+    def _spark_unexpected_count(*, execution_engine, metric_domain_kwargs, metrics, **kwargs):
+        """Counts the rows holding duplicated values with one aggregation instead of a window."""
+        metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+            metric_domain_kwargs=metric_domain_kwargs,
+            batch_columns_list=metrics["table.columns"],
+        )
+        _, compute_domain_kwargs, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column_name = accessor_domain_kwargs["column"]
+        # Null values are not unexpected, just as for the row-wise condition above.
+        compute_domain_kwargs = execution_engine.add_column_row_condition(
+            compute_domain_kwargs, column_name=column_name
+        )
+        df = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+
+        duplicate_counts = df.groupBy(F.col(column_name)).count().filter(F.col("count") > 1)
+        unexpected_count = duplicate_counts.agg(F.sum("count")).collect()[0][0]
+        return int(unexpected_count or 0)
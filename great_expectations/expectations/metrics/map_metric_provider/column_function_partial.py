@@ -101,12 +101,15 @@ def column_function_partial(  # noqa: C901, PLR0915
                 filter_column_isnull = kwargs.get(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
                 )
+                column = df[column_name]
                 if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                    column = column[
+                        ~execution_engine.get_column_null_mask(domain_kwargs=metric_domain_kwargs)
+                    ]
 
                 values = metric_fn(
                     cls,
-                    df[column_name],
+                    column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -14,6 +14,7 @@ import great_expectations.exceptions as gx_exceptions
 from great_expectations.expectations.metrics.util import (
     MAX_RESULT_RECORDS,
     get_dbms_compatible_metric_domain_kwargs,
+    get_unexpected_values_limit,
 )
 
 if TYPE_CHECKING:
@@ -25,7 +26,6 @@ if TYPE_CHECKING:
 
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
-from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (  # noqa: E501
     _is_sqlalchemy_metric_selectable,
 )
@@ -78,10 +78,13 @@ def _pandas_column_map_condition_values(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
     domain_values = df[column_name]
+    if filter_column_isnull:
+        domain_values = domain_values[
+            ~execution_engine.get_column_null_mask(
+                domain_kwargs=dict(**compute_domain_kwargs, **accessor_domain_kwargs)
+            )
+        ]
 
     domain_values = domain_values[
         boolean_mapped_unexpected_values == True  # noqa: E712
@@ -135,10 +138,13 @@ def _pandas_column_map_condition_value_counts(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
     domain_values = df[column_name]
+    if filter_column_isnull:
+        domain_values = domain_values[
+            ~execution_engine.get_column_null_mask(
+                domain_kwargs=dict(**compute_domain_kwargs, **accessor_domain_kwargs)
+            )
+        ]
 
     result_format = metric_value_kwargs["result_format"]
     value_counts = None
@@ -152,13 +158,14 @@ def _pandas_column_map_condition_value_counts(
         except ValueError:
             pass
 
-    if not value_counts:
+    if value_counts is None:
         raise gx_exceptions.MetricComputationError("Unable to compute value counts")  # noqa: TRY003
 
     if result_format["result_format"] == "COMPLETE":
         return value_counts
 
-    return value_counts[result_format["partial_unexpected_count"]]
+    # value_counts() sorts by descending count
+    return value_counts.iloc[: result_format["partial_unexpected_count"]]
 
 
 def _sqlalchemy_column_map_condition_values(
@@ -201,23 +208,9 @@ def _sqlalchemy_column_map_condition_values(
             query = query.select_from(selectable)  # type: ignore[arg-type]
 
     result_format = metric_value_kwargs["result_format"]
+    query = query.limit(get_unexpected_values_limit(result_format=result_format))
 
-    if result_format["result_format"] != "COMPLETE":
-        query = query.limit(result_format["partial_unexpected_count"])
-    elif (
-        result_format["result_format"] == "COMPLETE"
-        and execution_engine.engine.dialect.name.lower() == GXSqlDialect.BIGQUERY
-    ):
-        logger.warning(
-            "BigQuery imposes a limit of 10000 parameters on individual queries; "
-            "if your data contains more than 10000 columns your results will be truncated."
-        )
-        query = query.limit(10000)  # BigQuery upper bound on query parameters
-
-    return [
-        val.unexpected_values
-        for val in execution_engine.execute_query(query).fetchmany(MAX_RESULT_RECORDS)
-    ]
+    return [val.unexpected_values for val in execution_engine.execute_query(query).fetchall()]
 
 
 def _sqlalchemy_column_map_condition_value_counts(
@@ -258,6 +251,13 @@ def _sqlalchemy_column_map_condition_value_counts(
     if not _is_sqlalchemy_metric_selectable(map_metric_provider=cls):
         query = query.select_from(selectable)  # type: ignore[arg-type]
 
+    result_format = metric_value_kwargs["result_format"]
+    if result_format["result_format"] != "COMPLETE":
+        # Only the most frequent unexpected values are fetched.
+        query = query.order_by(sa.func.count(column).desc()).limit(
+            result_format["partial_unexpected_count"]
+        )
+
     return execution_engine.execute_query(query).fetchall()
 
 
@@ -301,11 +301,9 @@ def _spark_column_map_condition_values(
     # note that without an explicit column alias,
     # spark will use only the final portion
     # of a nested column as the column name
-    if result_format["result_format"] == "COMPLETE":
-        query = filtered.select(F.col(column_name).alias(column_name)).limit(MAX_RESULT_RECORDS)
-    else:
-        limit = min(result_format["partial_unexpected_count"], MAX_RESULT_RECORDS)
-        query = filtered.select(F.col(column_name).alias(column_name)).limit(limit)
+    query = filtered.select(F.col(column_name).alias(column_name)).limit(
+        get_unexpected_values_limit(result_format=result_format)
+    )
     return [row[column_name] for row in query.collect()]
 
 
@@ -346,8 +344,10 @@ def _spark_column_map_condition_value_counts(
     result_format = metric_value_kwargs["result_format"]
 
     value_counts = filtered.groupBy(F.col(column_name).alias(column_name)).count()
-    if result_format["result_format"] == "COMPLETE":
-        rows = value_counts.collect()
-    else:
-        rows = value_counts.collect()[: result_format["partial_unexpected_count"]]
-    return rows
+    if result_format["result_format"] != "COMPLETE":
+        # Only the most frequent unexpected values are collected to the driver.
+        value_counts = value_counts.orderBy(F.desc("count")).limit(
+            result_format["partial_unexpected_count"]
+        )
+
+    return value_counts.collect()
@@ -17,6 +17,7 @@ from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_m
 from great_expectations.expectations.metrics.util import (
     MAX_RESULT_RECORDS,
     get_dbms_compatible_metric_domain_kwargs,
+    get_unexpected_values_limit,
 )
 from great_expectations.util import (
     get_sqlalchemy_selectable,
@@ -173,9 +174,7 @@ def _sqlalchemy_column_pair_map_condition_values(
         query = query.select_from(selectable)  # type: ignore[arg-type]
 
     result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] != "COMPLETE":
-        limit = min(result_format["partial_unexpected_count"], MAX_RESULT_RECORDS)
-        query = query.limit(limit)
+    query = query.limit(get_unexpected_values_limit(result_format=result_format))
 
     unexpected_list = [
         (val.unexpected_values_A, val.unexpected_values_B)
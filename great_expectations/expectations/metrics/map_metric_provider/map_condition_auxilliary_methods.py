@@ -32,6 +32,7 @@ from great_expectations.expectations.metrics.util import (
     compute_unexpected_pandas_indices,
     get_dbms_compatible_metric_domain_kwargs,
     get_sqlalchemy_source_table_and_schema,
+    get_unexpected_values_limit,
     sql_statement_with_post_compile_to_string,
 )
 from great_expectations.util import (
@@ -106,7 +107,9 @@ def _pandas_map_condition_index(
             "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
         )
         if filter_column_isnull:
-            domain_records_df = domain_records_df[domain_records_df[column_name].notnull()]
+            domain_records_df = domain_records_df[
+                ~execution_engine.get_column_null_mask(domain_kwargs=domain_kwargs)
+            ]
 
         domain_column_name_list.append(column_name)
 
@@ -124,6 +127,9 @@ def _pandas_map_condition_index(
 
     result_format = metric_value_kwargs["result_format"]
     domain_records_df = domain_records_df[boolean_mapped_unexpected_values]
+    # Only the rows that are reported are materialized.
+    if result_format["result_format"] != "COMPLETE":
+        domain_records_df = domain_records_df.iloc[: result_format["partial_unexpected_count"]]
 
     unexpected_index_list: Union[List[int], List[Dict[str, Any]]] = (
         compute_unexpected_pandas_indices(
@@ -134,9 +140,7 @@ def _pandas_map_condition_index(
             expectation_domain_column_list=domain_column_name_list,
         )
     )
-    if result_format["result_format"] == "COMPLETE":
-        return unexpected_index_list
-    return unexpected_index_list[: result_format["partial_unexpected_count"]]
+    return unexpected_index_list
 
 
 def _pandas_map_condition_query(
@@ -184,13 +188,13 @@ def _pandas_map_condition_query(
     )
 
     if "column" in accessor_domain_kwargs:
-        column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
-
         filter_column_isnull = kwargs.get(
             "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
         )
         if filter_column_isnull:
-            domain_records_df = domain_records_df[domain_records_df[column_name].notnull()]
+            domain_records_df = domain_records_df[
+                ~execution_engine.get_column_null_mask(domain_kwargs=domain_kwargs)
+            ]
 
     domain_values_df_filtered = domain_records_df[boolean_mapped_unexpected_values]
     index_list = domain_values_df_filtered.index.to_list()
@@ -225,8 +229,6 @@ def _pandas_map_condition_rows(
     df = execution_engine.get_domain_records(domain_kwargs=domain_kwargs)
 
     if "column" in accessor_domain_kwargs:
-        column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
-
         ###
         # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
         # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -236,7 +238,7 @@ def _pandas_map_condition_rows(
             "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
         )
         if filter_column_isnull:
-            df = df[df[column_name].notnull()]
+            df = df[~execution_engine.get_column_null_mask(domain_kwargs=domain_kwargs)]
 
     result_format = metric_value_kwargs["result_format"]
 
@@ -394,9 +396,7 @@ def _sqlalchemy_map_condition_rows(
         query = query.select_from(selectable)  # type: ignore[arg-type]
 
     result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] != "COMPLETE":
-        limit = min(result_format["partial_unexpected_count"], MAX_RESULT_RECORDS)
-        query = query.limit(limit)
+    query = query.limit(get_unexpected_values_limit(result_format=result_format))
     try:
         return execution_engine.execute_query(query).fetchmany(MAX_RESULT_RECORDS)
     except sqlalchemy.OperationalError as oe:
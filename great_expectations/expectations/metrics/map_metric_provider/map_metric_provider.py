@@ -107,6 +107,15 @@ class MapMetricProvider(MetricProvider):
         if not (hasattr(cls, "function_metric_name") or hasattr(cls, "condition_metric_name")):
             return
 
+        # A provider may replace the generic, row-by-row "unexpected_count" computation of an engine
+        # by declaring a "metric_value" function with ".unexpected_count" as "metric_name_suffix"
+        # (e.g., in order to count unexpected rows with a single aggregation query).
+        unexpected_count_value_providers: dict = {
+            candidate_metric_fn.metric_engine: candidate_metric_fn
+            for _, candidate_metric_fn in inspect.getmembers(cls)
+            if _is_unexpected_count_value_provider(candidate_metric_fn)
+        }
+
         for attr, candidate_metric_fn in inspect.getmembers(cls):
             if not hasattr(candidate_metric_fn, "metric_engine"):
                 # This is not a metric.
@@ -163,7 +172,9 @@ class MapMetricProvider(MetricProvider):
                         metric_value_keys=metric_value_keys,
                         execution_engine=engine,
                         metric_class=cls,
-                        metric_provider=_pandas_map_condition_unexpected_count,
+                        metric_provider=unexpected_count_value_providers.get(
+                            engine, _pandas_map_condition_unexpected_count
+                        ),
                         metric_fn_type=MetricFunctionTypes.VALUE,
                     )
                     register_metric(
@@ -315,7 +326,9 @@ class MapMetricProvider(MetricProvider):
                                 metric_value_keys=metric_value_keys,
                                 execution_engine=engine,
                                 metric_class=cls,
-                                metric_provider=_sqlalchemy_map_condition_unexpected_count_value,
+                                metric_provider=unexpected_count_value_providers.get(
+                                    engine, _sqlalchemy_map_condition_unexpected_count_value
+                                ),
                                 metric_fn_type=MetricFunctionTypes.VALUE,
                             )
                     elif metric_fn_type == MetricPartialFunctionTypes.WINDOW_CONDITION_FN:
@@ -325,7 +338,9 @@ class MapMetricProvider(MetricProvider):
                             metric_value_keys=metric_value_keys,
                             execution_engine=engine,
                             metric_class=cls,
-                            metric_provider=_sqlalchemy_map_condition_unexpected_count_value,
+                            metric_provider=unexpected_count_value_providers.get(
+                                engine, _sqlalchemy_map_condition_unexpected_count_value
+                            ),
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     if domain_type == MetricDomainTypes.COLUMN:
@@ -450,7 +465,9 @@ class MapMetricProvider(MetricProvider):
                                 metric_value_keys=metric_value_keys,
                                 execution_engine=engine,
                                 metric_class=cls,
-                                metric_provider=_spark_map_condition_unexpected_count_value,
+                                metric_provider=unexpected_count_value_providers.get(
+                                    engine, _spark_map_condition_unexpected_count_value
+                                ),
                                 metric_fn_type=MetricFunctionTypes.VALUE,
                             )
                     elif metric_fn_type == MetricPartialFunctionTypes.WINDOW_CONDITION_FN:
@@ -460,7 +477,9 @@ class MapMetricProvider(MetricProvider):
                             metric_value_keys=metric_value_keys,
                             execution_engine=engine,
                             metric_class=cls,
-                            metric_provider=_spark_map_condition_unexpected_count_value,
+                            metric_provider=unexpected_count_value_providers.get(
+                                engine, _spark_map_condition_unexpected_count_value
+                            ),
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     if domain_type == MetricDomainTypes.COLUMN:
@@ -568,6 +587,7 @@ class MapMetricProvider(MetricProvider):
         # Documentation in "MetricProvider._register_metric_functions()" explains registration/dependency protocol.  # noqa: E501
         if metric_name.endswith(metric_suffix):
             has_aggregate_fn: bool = False
+            has_unexpected_count_value_provider: bool = False
 
             if execution_engine is not None:
                 try:
@@ -579,13 +599,18 @@ class MapMetricProvider(MetricProvider):
                 except gx_exceptions.MetricProviderError:
                     pass
 
+                has_unexpected_count_value_provider = _has_unexpected_count_value_provider(
+                    metric_name=metric_name, execution_engine=execution_engine
+                )
+
             if has_aggregate_fn:
                 dependencies["metric_partial_fn"] = MetricConfiguration(
                     metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
                     metric_domain_kwargs=metric.metric_domain_kwargs,
                     metric_value_kwargs=base_metric_value_kwargs,
                 )
-            else:
+            elif not has_unexpected_count_value_provider:
+                # Providers that count unexpected rows themselves do not evaluate the row-wise condition.  # noqa: E501
                 dependencies["unexpected_condition"] = MetricConfiguration(
                     metric_name=f"{metric_name[:-len(metric_suffix)]}.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
                     metric_domain_kwargs=metric.metric_domain_kwargs,
@@ -630,3 +655,23 @@ class MapMetricProvider(MetricProvider):
         )
 
         return _is_sqlalchemy_metric_selectable(map_metric_provider)
+
+
+def _is_unexpected_count_value_provider(metric_fn) -> bool:
+    """Whether "metric_fn" is a provider's own "metric_value" function for "unexpected_count"."""
+    return (
+        getattr(metric_fn, "metric_fn_type", None) == MetricFunctionTypes.VALUE
+        and getattr(metric_fn, "metric_definition_kwargs", {}).get("metric_name_suffix")
+        == f".{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
+    )
+
+
+def _has_unexpected_count_value_provider(
+    metric_name: str, execution_engine: ExecutionEngine
+) -> bool:
+    try:
+        _, metric_fn = get_metric_provider(metric_name, execution_engine)
+    except gx_exceptions.MetricProviderError:
+        return False
+
+    return _is_unexpected_count_value_provider(metric_fn)
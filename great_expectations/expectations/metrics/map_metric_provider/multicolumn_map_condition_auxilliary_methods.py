@@ -17,6 +17,7 @@ from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_m
 from great_expectations.expectations.metrics.util import (
     MAX_RESULT_RECORDS,
     get_dbms_compatible_metric_domain_kwargs,
+    get_unexpected_values_limit,
 )
 from great_expectations.util import (
     get_sqlalchemy_selectable,
@@ -161,9 +162,7 @@ def _sqlalchemy_multicolumn_map_condition_values(
         query = query.select_from(selectable)  # type: ignore[arg-type]
 
     result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] != "COMPLETE":
-        limit = min(result_format["partial_unexpected_count"], MAX_RESULT_RECORDS)
-        query = query.limit(limit)
+    query = query.limit(get_unexpected_values_limit(result_format=result_format))
 
     return [
         val._asdict() for val in execution_engine.execute_query(query).fetchmany(MAX_RESULT_RECORDS)
@@ -8,6 +8,7 @@ from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypeSuffixes,
+    SummarizationMetricNameSuffixes,
 )
 from great_expectations.execution_engine import (
     ExecutionEngine,
@@ -24,6 +25,11 @@ from great_expectations.expectations.metrics.map_metric_provider.multicolumn_con
 from great_expectations.expectations.metrics.map_metric_provider.multicolumn_function_partial import (  # noqa: E501
     multicolumn_function_partial,
 )
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import (
+    get_dbms_compatible_metric_domain_kwargs,
+)
+from great_expectations.util import get_sqlalchemy_selectable
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 if TYPE_CHECKING:
@@ -76,6 +82,7 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
             3 2 3 1
 
         The fourth column, "_num_rows", holds the value of the "map" function -- the number of rows the group occurs in.
+        Only duplicated groups are counted, so "_num_rows" is NULL for the rows whose group occurs exactly once.
         """  # noqa: E501
 
         # Needed as keys (hence, string valued) to access "ColumnElement" objects contained within the "FROM" clauses.  # noqa: E501
@@ -94,6 +101,7 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
         # for a sub query. We can do this by using the window function count, to get the number of duplicate  # noqa: E501
         # rows by over partition by the compound unique columns. This will give a table which has the same  # noqa: E501
         # number of rows as the original table, but with an additional column _num_rows column.
+        # Rows with a NULL in any of the "compound" columns are not counted, just as they are not joined below.  # noqa: E501
         dialect = kwargs.get("_dialect")
         try:
             dialect_name = dialect.dialect.name
@@ -104,11 +112,12 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
                 dialect_name = ""
         if dialect and dialect_name == "mysql":
             table_columns_selector = [sa.column(column_name) for column_name in table_columns]
-            partition_by_columns = (
-                sa.func.count()
-                .over(partition_by=[sa.column(column) for column in column_names])
-                .label("_num_rows")
-            )
+            partition_by_columns = sa.case(
+                (sa.or_(*(sa.column(column).is_(None) for column in column_names)), sa.null()),
+                else_=sa.func.count().over(
+                    partition_by=[sa.column(column) for column in column_names]
+                ),
+            ).label("_num_rows")
             count_selector = table_columns_selector + [partition_by_columns]
             original_table_clause = (
                 sa.select(*count_selector).select_from(table).alias("original_table_clause")
@@ -125,20 +134,21 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
 
         # Step-2: "SELECT FROM" the original table, represented by the "FromClause" object, querying all columns of the  # noqa: E501
         # table and the count of occurrences of distinct "compound" (i.e., group, as specified by "column_list") values.  # noqa: E501
-        # Give this aggregated group count a distinctive label.
+        # Give this aggregated group count a distinctive label and only keep the groups that occur more than once.  # noqa: E501
         # Give the resulting sub-query a unique alias in order to disambiguate column names in subsequent queries.  # noqa: E501
         count_selector = column_list + [sa.func.count().label("_num_rows")]
         group_count_query = (
             sa.select(*count_selector)
             .group_by(*column_list)
+            .having(sa.func.count() > 1)
             .select_from(original_table_clause)
             .alias("group_counts_subquery")
         )
 
-        # The above "group_count_query", if executed, will produce the result set containing the number of rows that  # noqa: E501
-        # equals the number of distinct values of the group -- unique grouping (e.g., as in a multi-column primary key).  # noqa: E501
-        # Hence, in order for the "_num_rows" column values to provide an entry for each row of the original table, the  # noqa: E501
-        # "SELECT FROM" of "group_count_query" must undergo an "INNER JOIN" operation with the "original_table_clause"  # noqa: E501
+        # The above "group_count_query", if executed, will produce the result set containing the duplicated groups only  # noqa: E501
+        # (typically, a small fraction of the distinct values of the group, as in a multi-column primary key).  Hence,  # noqa: E501
+        # in order for the "_num_rows" column values to provide an entry for each row of the original table, the  # noqa: E501
+        # "SELECT FROM" of "group_count_query" must undergo a "LEFT OUTER JOIN" operation with the "original_table_clause"  # noqa: E501
         # object, whereby all table columns in the two "FromClause" objects must match, respectively, as the conditions.  # noqa: E501
         conditions = sa.and_(
             *(group_count_query.c[name] == original_table_clause.c[name] for name in column_names)
@@ -151,7 +161,7 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
             )
             .select_from(
                 original_table_clause.join(
-                    right=group_count_query, onclause=conditions, isouter=False
+                    right=group_count_query, onclause=conditions, isouter=True
                 )
             )
             .alias("records_with_grouped_column_counts_subquery")
@@ -180,7 +190,9 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
         ]
 
         # noinspection PyProtectedMember
-        row_wise_cond = compound_columns_count_query.c._num_rows < 2  # noqa: PLR2004
+        num_rows = compound_columns_count_query.c._num_rows
+        # Only duplicated groups (without NULL values) are counted; "_num_rows" is NULL for all other rows.  # noqa: E501
+        row_wise_cond = sa.or_(num_rows.is_(None), num_rows < 2)  # noqa: PLR2004
 
         return row_wise_cond
 
@@ -192,6 +204,59 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
         )
         return row_wise_cond
 
+    @metric_value(
+        engine=SqlAlchemyExecutionEngine,
+        metric_name_suffix=f".{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+    )
+    def _sqlalchemy_unexpected_count(*, execution_engine, metric_domain_kwargs, metrics, **kwargs):
+        """Counts the rows belonging to duplicated groups with a single GROUP BY ... HAVING query.
+
+        Rows with a NULL in any of the "compound" columns are left out, just as they are by the "map" part.
+        """  # noqa: E501
+        metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+            metric_domain_kwargs=metric_domain_kwargs,
+            batch_columns_list=metrics["table.columns"],
+        )
+        column_list = [
+            sa.column(column_name) for column_name in metric_domain_kwargs["column_list"]
+        ]
+        # All "domain_kwargs" keys are supplied in order to invoke the "ignore_row_if" filtering.
+        selectable = execution_engine.get_domain_records(domain_kwargs=metric_domain_kwargs)
+
+        duplicate_counts = (
+            sa.select(sa.func.count().label("_num_rows"))
+            .select_from(get_sqlalchemy_selectable(selectable))
+            .where(sa.and_(*(column.isnot(None) for column in column_list)))
+            .group_by(*column_list)
+            .having(sa.func.count() > 1)
+            .subquery()
+        )
+        unexpected_count = execution_engine.execute_query(
+            sa.select(sa.func.sum(duplicate_counts.c._num_rows))
+        ).scalar()
+        return int(unexpected_count or 0)
+
+    @metric_value(
+        engine=SparkDFExecutionEngine,
+        metric_name_suffix=f".{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+    )
+    def _spark_unexpected_count(*, execution_engine, metric_domain_kwargs, metrics, **kwargs):
+        """Counts the rows of duplicated groups with one aggregation instead of a window."""
+        metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+            metric_domain_kwargs=metric_domain_kwargs,
+            batch_columns_list=metrics["table.columns"],
+        )
+        # All "domain_kwargs" keys are supplied in order to invoke the "ignore_row_if" filtering.
+        df = execution_engine.get_domain_records(domain_kwargs=metric_domain_kwargs)
+
+        duplicate_counts = (
+            df.groupBy(F.struct(*metric_domain_kwargs["column_list"]))
+            .count()
+            .filter(F.col("count") > 1)
+        )
+        unexpected_count = duplicate_counts.agg(F.sum("count")).collect()[0][0]
+        return int(unexpected_count or 0)
+
     @classmethod
     @override
     def _get_evaluation_dependencies(
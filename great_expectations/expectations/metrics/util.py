@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import json
 import logging
 import re
+import warnings
 from collections import UserDict
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Collection,
     Dict,
     Final,
     Iterable,
@@ -20,6 +24,7 @@ from typing import (
 )
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 from packaging import version
 
@@ -78,7 +83,6 @@ from great_expectations.compatibility import bigquery as sqla_bigquery
 from great_expectations.compatibility.bigquery import bigquery_types_tuple
 
 if TYPE_CHECKING:
-    import pandas as pd
     from typing_extensions import TypeAlias
 
 try:
@@ -88,9 +92,19 @@ except ImportError:
     teradatasqlalchemy = None
     teradatatypes = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 MAX_RESULT_RECORDS: Final[int] = 200
 
+# Backreferences and leading global flags change meaning once a regex is joined into an alternation.
+_UNCOMBINABLE_REGEX_PATTERN: Final[re.Pattern] = re.compile(r"\\[1-9]|\(\?P=|^\(\?[aiLmsux]+\)")
+# Named groups, in Python ("(?P<name>...)") and Java/ICU/PCRE ("(?<name>...)") syntax.
+_NAMED_GROUP_PATTERN: Final[re.Pattern] = re.compile(r"\(\?P?<([A-Za-z_]\w*)>")
+
 UnexpectedIndexList: TypeAlias = List[Dict[str, Any]]
 
 
@@ -112,6 +126,91 @@ def _is_databricks_dialect(dialect: ModuleType | sa.Dialect | Type[sa.Dialect])
     return False
 
 
+def combine_regex_list(regex_list: Sequence[str], capturing: bool = False) -> Optional[str]:
+    """Joins "regex_list" into a single regex matching wherever any of its regexes matches.
+
+    Args:
+        regex_list: regexes to be combined.
+        capturing: whether to group each regex with "(...)" (understood by POSIX-flavored engines)
+            instead of the non-capturing "(?:...)".
+
+    Returns:
+        The combined regex, or None if the regexes cannot be combined without changing meaning.
+    """
+    if len(regex_list) == 1:
+        return regex_list[0]
+
+    if any(_UNCOMBINABLE_REGEX_PATTERN.search(regex) for regex in regex_list):
+        return None
+
+    # Regex engines reject a group name that is defined more than once.
+    group_names: List[str] = [
+        group_name
+        for regex in regex_list
+        for group_name in set(_NAMED_GROUP_PATTERN.findall(regex))
+    ]
+    if len(group_names) != len(set(group_names)):
+        return None
+
+    group: str = "({})" if capturing else "(?:{})"
+    return "|".join(group.format(regex) for regex in regex_list)
+
+
+def _combine_python_regex_list(regex_list: Sequence[str]) -> Optional[str]:
+    combined_regex: Optional[str] = combine_regex_list(regex_list=regex_list)
+    if combined_regex is None:
+        return None
+
+    try:
+        re.compile(combined_regex)
+    except re.error:
+        return None
+
+    return combined_regex
+
+
+def match_pandas_regex_list(
+    column: pd.Series, regex_list: Sequence[str], match_on: str = "any"
+) -> pd.Series:
+    """Returns whether the values of "column" match any (or all) of the regexes in "regex_list".
+
+    The column is cast to str once.  For "any", the regexes are searched for in a single pass as one
+    alternation, where possible; otherwise, each regex is only searched for in the values that the
+    regexes before it have not already decided.
+    """
+    if match_on not in ["any", "all"]:
+        raise ValueError("match_on must be either 'any' or 'all'")  # noqa: TRY003
+
+    if len(regex_list) == 0:
+        raise ValueError("At least one regex must be supplied in the regex_list.")  # noqa: TRY003
+
+    values: pd.Series = column.astype(str)
+
+    if match_on == "any":
+        combined_regex: Optional[str] = _combine_python_regex_list(regex_list=regex_list)
+        if combined_regex is not None:
+            return values.str.contains(combined_regex)
+
+    decided_value: bool = match_on == "any"
+    result: np.ndarray = np.full(len(values), not decided_value)
+    for regex in regex_list:
+        undecided: np.ndarray = result != decided_value
+        if not undecided.any():
+            break
+
+        with warnings.catch_warnings():
+            # Only whether the regex matches is needed, so its (backreference) groups are moot.
+            warnings.filterwarnings(
+                action="ignore",
+                message="This pattern is interpreted as a regular expression, and has match groups",
+                category=UserWarning,
+            )
+            matched: pd.Series = values[undecided].str.contains(regex)
+        result[undecided] = matched.to_numpy(dtype=bool)
+
+    return pd.Series(result, index=column.index)
+
+
 def get_dialect_regex_expression(  # noqa: C901, PLR0911, PLR0912, PLR0915
     column: sa.Column,
     regex: str,
@@ -414,49 +513,19 @@ def get_sqlalchemy_column_metadata(
     try:
         columns: Sequence[Dict[str, Any]]
 
-        engine = execution_engine.engine
-        inspector = execution_engine.get_inspector()
-        try:
-            # if a custom query was passed
-            if sqlalchemy.TextClause and isinstance(table_selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
-                if hasattr(table_selectable, "selected_columns"):
-                    # New in version 1.4.
-                    columns = table_selectable.selected_columns.columns
-                else:
-                    # Implicit subquery for columns().column was deprecated in SQLAlchemy 1.4
-                    # We must explicitly create a subquery
-                    columns = table_selectable.columns().subquery().columns
-            else:
-                # TODO: remove cast to a string once [this](https://github.com/snowflakedb/snowflake-sqlalchemy/issues/157) issue is resovled  # noqa: E501
-                table_name = str(table_selectable)
-                if execution_engine.dialect_name == GXSqlDialect.SNOWFLAKE:
-                    table_name = table_name.lower()
-                columns = inspector.get_columns(  # type: ignore[assignment]
-                    table_name=table_name,
-                    schema=schema_name,
-                )
-        except (
-            KeyError,
-            AttributeError,
-            sa.exc.NoSuchTableError,
-            sa.exc.ProgrammingError,
-        ) as exc:
-            logger.debug(f"{type(exc).__name__} while introspecting columns", exc_info=exc)
-            logger.info(f"While introspecting columns {exc!r}; attempting reflection fallback")
-            # we will get a KeyError for temporary tables, since
-            # reflection will not find the temporary schema
-            columns = column_reflection_fallback(
-                selectable=table_selectable,
-                dialect=engine.dialect,
-                sqlalchemy_engine=engine,
+        cached_columns = execution_engine.get_cached_column_metadata(
+            table_selectable=table_selectable, schema_name=schema_name
+        )
+        if cached_columns is not None:
+            columns = cached_columns
+        else:
+            columns = _reflect_sqlalchemy_column_metadata(
+                execution_engine=execution_engine,
+                table_selectable=table_selectable,
+                schema_name=schema_name,
             )
-
-        # Use fallback because for mssql and trino reflection mechanisms do not throw an error but return an empty list  # noqa: E501
-        if len(columns) == 0:
-            columns = column_reflection_fallback(
-                selectable=table_selectable,
-                dialect=engine.dialect,
-                sqlalchemy_engine=engine,
+            execution_engine.cache_column_metadata(
+                table_selectable=table_selectable, columns=columns, schema_name=schema_name
             )
 
         dialect_name = execution_engine.dialect.name
@@ -473,6 +542,61 @@ def get_sqlalchemy_column_metadata(
         return None
 
 
+def _reflect_sqlalchemy_column_metadata(
+    execution_engine: SqlAlchemyExecutionEngine,
+    table_selectable: sqlalchemy.Select,
+    schema_name: Optional[str] = None,
+) -> Sequence[Dict[str, Any]]:
+    columns: Sequence[Dict[str, Any]]
+
+    engine = execution_engine.engine
+    inspector = execution_engine.get_inspector()
+    try:
+        # if a custom query was passed
+        if sqlalchemy.TextClause and isinstance(table_selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
+            if hasattr(table_selectable, "selected_columns"):
+                # New in version 1.4.
+                columns = table_selectable.selected_columns.columns
+            else:
+                # Implicit subquery for columns().column was deprecated in SQLAlchemy 1.4
+                # We must explicitly create a subquery
+                columns = table_selectable.columns().subquery().columns
+        else:
+            # TODO: remove cast to a string once [this](https://github.com/snowflakedb/snowflake-sqlalchemy/issues/157) issue is resovled  # noqa: E501
+            table_name = str(table_selectable)
+            if execution_engine.dialect_name == GXSqlDialect.SNOWFLAKE:
+                table_name = table_name.lower()
+            columns = inspector.get_columns(  # type: ignore[assignment]
+                table_name=table_name,
+                schema=schema_name,
+            )
+    except (
+        KeyError,
+        AttributeError,
+        sa.exc.NoSuchTableError,
+        sa.exc.ProgrammingError,
+    ) as exc:
+        logger.debug(f"{type(exc).__name__} while introspecting columns", exc_info=exc)
+        logger.info(f"While introspecting columns {exc!r}; attempting reflection fallback")
+        # we will get a KeyError for temporary tables, since
+        # reflection will not find the temporary schema
+        columns = column_reflection_fallback(
+            selectable=table_selectable,
+            dialect=engine.dialect,
+            sqlalchemy_engine=engine,
+        )
+
+    # Use fallback because for mssql and trino reflection mechanisms do not throw an error but return an empty list  # noqa: E501
+    if len(columns) == 0:
+        columns = column_reflection_fallback(
+            selectable=table_selectable,
+            dialect=engine.dialect,
+            sqlalchemy_engine=engine,
+        )
+
+    return columns
+
+
 def column_reflection_fallback(  # noqa: C901, PLR0912, PLR0915
     selectable: sqlalchemy.Select,
     dialect: sqlalchemy.Dialect,
@@ -881,11 +1005,85 @@ def _verify_column_names_exist_and_get_normalized_typed_column_names_map(  # noq
     return None if verify_only else normalized_batch_columns_mappings
 
 
+def get_unexpected_values_limit(result_format: Dict[str, Any]) -> int:
+    """Returns how many unexpected values (or rows) "result_format" needs to be fetched.
+
+    Every format is capped at MAX_RESULT_RECORDS, which is applied in the query itself, rather than
+    when fetching its results.
+    """
+    if result_format["result_format"] == "COMPLETE":
+        return MAX_RESULT_RECORDS
+
+    return min(result_format["partial_unexpected_count"], MAX_RESULT_RECORDS)
+
+
+def json_loads(value: Any) -> Any:
+    """Deserializes a JSON document, with the faster (and stricter) orjson parser if installed.
+
+    Documents rejected by orjson (e.g., containing "NaN" or integers over 64 bits) are deserialized
+    by the json module, so that the same documents are accepted either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(value)
+
+
+def map_pandas_distinct_values(column: pd.Series, func: Callable[[Any], bool]) -> pd.Series:
+    """Applies the row-wise condition "func" once per distinct value of "column".
+
+    Values are most often repeated (e.g., JSON documents or date strings), so the results of the
+    distinct values are broadcast back to the rows.  Unhashable values are mapped row by row.
+    """
+    try:
+        codes, uniques = pd.factorize(column)
+    except TypeError:
+        return column.map(func)
+
+    distinct_results = np.array([func(value) for value in uniques], dtype=bool)
+    results = np.empty(len(codes), dtype=bool)
+    is_distinct_value = codes >= 0
+    results[is_distinct_value] = distinct_results[codes[is_distinct_value]]
+    if not is_distinct_value.all():
+        # missing values are not factorized
+        results[~is_distinct_value] = [
+            func(value) for value in column.to_numpy()[~is_distinct_value]
+        ]
+
+    return pd.Series(results, index=column.index)
+
+
 def parse_value_set(value_set: Iterable) -> list:
     parsed_value_set = [parse(value) if isinstance(value, str) else value for value in value_set]
     return parsed_value_set
 
 
+def get_sqlalchemy_value_set_selectable(
+    column: sqlalchemy.ColumnClause,
+    value_set: Collection[Any],
+    execution_engine: Optional[SqlAlchemyExecutionEngine],
+    metrics: Optional[Dict[str, Any]],
+) -> Optional[sqlalchemy.Select]:
+    """Returns a selectable of a large "value_set" for membership tests against "column".
+
+    The values are typed like "column" (looked up in the "table.column_types" metric), so that the
+    resulting semi-join compares like types.  None means that the values should be inlined.
+    """
+    if execution_engine is None or not metrics or "table.column_types" not in metrics:
+        return None
+
+    column_type: Optional[Any] = None
+    for column_info in metrics["table.column_types"]:
+        if column_info.get("name") == column.name:
+            column_type = column_info.get("type")
+            break
+
+    return execution_engine.get_value_set_selectable(value_set=value_set, column_type=column_type)
+
+
 def get_dialect_like_pattern_expression(  # noqa: C901, PLR0912, PLR0915
     column: sa.Column, dialect: ModuleType, like_pattern: str, positive: bool = True
 ) -> sa.BinaryExpression | None:
@@ -1249,7 +1447,7 @@ def get_sqlalchemy_source_table_and_schema(
         return engine.batch_manager.active_batch_data.selectable
 
 
-def get_unexpected_indices_for_multiple_pandas_named_indices(  # noqa: C901
+def get_unexpected_indices_for_multiple_pandas_named_indices(
     domain_records_df: pd.DataFrame,
     unexpected_index_column_names: List[str],
     expectation_domain_column_list: List[str],
@@ -1273,7 +1471,6 @@ def get_unexpected_indices_for_multiple_pandas_named_indices(  # noqa: C901
         )
 
     domain_records_df_index_names: List[str] = domain_records_df.index.names
-    unexpected_indices: List[tuple[int | str, ...]] = list(domain_records_df.index)
 
     tuple_index: Dict[str, int] = dict()
     for column_name in unexpected_index_column_names:
@@ -1286,30 +1483,22 @@ def get_unexpected_indices_for_multiple_pandas_named_indices(  # noqa: C901
         else:
             tuple_index[column_name] = domain_records_df_index_names.index(column_name, 0)
 
-    unexpected_index_list: UnexpectedIndexList = []
-
-    if exclude_unexpected_values and len(unexpected_indices) != 0:
-        primary_key_dict_list: dict[str, List[Any]] = {
-            idx_col: [] for idx_col in unexpected_index_column_names
-        }
-        for index in unexpected_indices:
-            for column_name in unexpected_index_column_names:
-                primary_key_dict_list[column_name].append(index[tuple_index[column_name]])
+    index_values_by_column_name: Dict[str, List[Any]] = {
+        column_name: domain_records_df.index.get_level_values(tuple_index[column_name]).tolist()
+        for column_name in unexpected_index_column_names
+    }
 
-        unexpected_index_list.append(primary_key_dict_list)
+    if exclude_unexpected_values:
+        return [index_values_by_column_name] if len(domain_records_df) != 0 else []
 
-    else:
-        for index in unexpected_indices:
-            primary_key_dict: Dict[str, Any] = dict()
-            for domain_column_name in expectation_domain_column_list:
-                primary_key_dict[domain_column_name] = domain_records_df.at[
-                    index, domain_column_name
-                ]
-                for column_name in unexpected_index_column_names:
-                    primary_key_dict[column_name] = index[tuple_index[column_name]]
-            unexpected_index_list.append(primary_key_dict)
-
-    return unexpected_index_list
+    return _build_unexpected_index_records(
+        values_by_column_name={
+            **_get_pandas_column_values(
+                domain_records_df=domain_records_df, column_names=expectation_domain_column_list
+            ),
+            **index_values_by_column_name,
+        }
+    )
 
 
 def get_unexpected_indices_for_single_pandas_named_index(
@@ -1332,8 +1521,6 @@ def get_unexpected_indices_for_single_pandas_named_index(
     """  # noqa: E501
     if not expectation_domain_column_list:
         return []
-    unexpected_index_values_by_named_index: List[int | str] = list(domain_records_df.index)
-    unexpected_index_list: UnexpectedIndexList = []
     if not (
         len(unexpected_index_column_names) == 1
         and unexpected_index_column_names[0] == domain_records_df.index.name
@@ -1343,25 +1530,39 @@ def get_unexpected_indices_for_single_pandas_named_index(
             failed_metrics=["unexpected_index_list"],
         )
 
-    if exclude_unexpected_values and len(unexpected_index_values_by_named_index) != 0:
-        primary_key_dict_list: dict[str, List[Any]] = {unexpected_index_column_names[0]: []}
-        for index in unexpected_index_values_by_named_index:
-            primary_key_dict_list[unexpected_index_column_names[0]].append(index)
-        unexpected_index_list.append(primary_key_dict_list)
+    index_values_by_column_name: Dict[str, List[Any]] = {
+        unexpected_index_column_names[0]: domain_records_df.index.tolist()
+    }
 
-    else:
-        for index in unexpected_index_values_by_named_index:
-            primary_key_dict: Dict[str, Any] = dict()
-            for domain_column in expectation_domain_column_list:
-                primary_key_dict[domain_column] = domain_records_df.at[index, domain_column]
-            column_name: str = unexpected_index_column_names[0]
-            primary_key_dict[column_name] = index
-            unexpected_index_list.append(primary_key_dict)
+    if exclude_unexpected_values:
+        return [index_values_by_column_name] if len(domain_records_df) != 0 else []
+
+    return _build_unexpected_index_records(
+        values_by_column_name={
+            **_get_pandas_column_values(
+                domain_records_df=domain_records_df, column_names=expectation_domain_column_list
+            ),
+            **index_values_by_column_name,
+        }
+    )
+
+
+def _get_pandas_column_values(
+    domain_records_df: pd.DataFrame, column_names: List[str]
+) -> Dict[str, List[Any]]:
+    """Returns the values of each of "column_names" in "domain_records_df", in row order."""
+    return {column_name: domain_records_df[column_name].tolist() for column_name in column_names}
 
-    return unexpected_index_list
 
+def _build_unexpected_index_records(
+    values_by_column_name: Dict[str, List[Any]],
+) -> List[Dict[str, Any]]:
+    """Transposes equal-length lists of column values into one dictionary per unexpected row."""
+    column_names: List[str] = list(values_by_column_name.keys())
+    return [dict(zip(column_names, row)) for row in zip(*values_by_column_name.values())]
 
-def compute_unexpected_pandas_indices(  # noqa: C901
+
+def compute_unexpected_pandas_indices(
     domain_records_df: pd.DataFrame,
     expectation_domain_column_list: List[str],
     result_format: Dict[str, Any],
@@ -1412,46 +1613,36 @@ def compute_unexpected_pandas_indices(  # noqa: C901
     elif result_format.get("unexpected_index_column_names"):
         unexpected_index_column_names = result_format["unexpected_index_column_names"]
         unexpected_index_list = []
-        unexpected_indices: List[int | str] = list(domain_records_df.index)
 
-        if (
-            exclude_unexpected_values
-            and len(unexpected_indices) != 0
-            and len(unexpected_index_column_names) != 0
-        ):
-            primary_key_dict_list: dict[str, List[Any]] = {
-                idx_col: [] for idx_col in unexpected_index_column_names
-            }
-            for index in unexpected_indices:
-                for column_name in unexpected_index_column_names:
-                    column_name = get_dbms_compatible_column_names(  # noqa: PLW2901
+        if len(domain_records_df) != 0:
+            # Column names are resolved once, and values are extracted column by column.
+            index_values_by_column_name: Dict[str, List[Any]] = _get_pandas_column_values(
+                domain_records_df=domain_records_df,
+                column_names=[
+                    get_dbms_compatible_column_names(
                         column_names=column_name,
                         batch_columns_list=metrics["table.columns"],
                         error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',  # noqa: E501
                     )
-                    primary_key_dict_list[column_name].append(
-                        domain_records_df.at[index, column_name]
-                    )
-            unexpected_index_list.append(primary_key_dict_list)
+                    for column_name in unexpected_index_column_names
+                ],
+            )
 
-        else:
-            for index in unexpected_indices:
-                primary_key_dict: Dict[str, Any] = dict()
+            if exclude_unexpected_values and len(unexpected_index_column_names) != 0:
+                unexpected_index_list.append(index_values_by_column_name)
+            else:
                 assert (
                     expectation_domain_column_list
                 ), "`expectation_domain_column_list` was not provided"
-                for domain_column_name in expectation_domain_column_list:
-                    primary_key_dict[domain_column_name] = domain_records_df.at[
-                        index, domain_column_name
-                    ]
-                    for column_name in unexpected_index_column_names:
-                        column_name = get_dbms_compatible_column_names(  # noqa: PLW2901
-                            column_names=column_name,
-                            batch_columns_list=metrics["table.columns"],
-                            error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',  # noqa: E501
-                        )
-                        primary_key_dict[column_name] = domain_records_df.at[index, column_name]
-                unexpected_index_list.append(primary_key_dict)
+                unexpected_index_list = _build_unexpected_index_records(
+                    values_by_column_name={
+                        **_get_pandas_column_values(
+                            domain_records_df=domain_records_df,
+                            column_names=expectation_domain_column_list,
+                        ),
+                        **index_values_by_column_name,
+                    }
+                )
 
     else:
         unexpected_index_list = list(domain_records_df.index)
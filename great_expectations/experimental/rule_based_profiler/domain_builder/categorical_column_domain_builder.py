@@ -73,6 +73,7 @@ class CategoricalColumnDomainBuilder(ColumnDomainBuilder):
         cardinality_limit_mode: Optional[Union[str, CardinalityLimitMode, dict]] = None,
         max_unique_values: Optional[Union[str, int]] = None,
         max_proportion_unique: Optional[Union[str, float]] = None,
+        approximate_cardinality: Union[str, bool] = False,
         data_context: Optional[AbstractDataContext] = None,
     ) -> None:
         """Create column domains where cardinality is within the specified limit.
@@ -86,6 +87,8 @@ class CategoricalColumnDomainBuilder(ColumnDomainBuilder):
         limit.
         Note that the limit must be met for each Batch separately.
         If other Batch objects contain additional columns, these will not be considered.
+        With approximate_cardinality, columns whose estimated cardinality clearly exceeds the limit
+        are discarded before exact cardinality is computed for the remaining columns.
 
         Args:
             include_column_names: Explicitly specified desired columns (if None, it is computed based on active Batch).
@@ -109,6 +112,8 @@ class CategoricalColumnDomainBuilder(ColumnDomainBuilder):
                 cardinality limit to use when filtering columns.
             max_proportion_unique: proportion of unique values for a
                 custom cardinality limit to use when filtering columns.
+            approximate_cardinality: if True, estimate cardinality (HyperLogLog or native approximate
+                distinct counts), one Batch at a time, to rule out high-cardinality columns early.
             data_context: AbstractDataContext associated with this DomainBuilder
         """  # noqa: E501
         if exclude_column_names is None:
@@ -155,6 +160,7 @@ class CategoricalColumnDomainBuilder(ColumnDomainBuilder):
         self._cardinality_limit_mode = cardinality_limit_mode
         self._max_unique_values = max_unique_values
         self._max_proportion_unique = max_proportion_unique
+        self._approximate_cardinality = approximate_cardinality
 
         self._cardinality_checker: Optional[CardinalityChecker] = None
 
@@ -196,6 +202,10 @@ class CategoricalColumnDomainBuilder(ColumnDomainBuilder):
     def max_proportion_unique(self) -> Optional[Union[str, float]]:
         return self._max_proportion_unique
 
+    @property
+    def approximate_cardinality(self) -> Union[str, bool]:
+        return self._approximate_cardinality
+
     @property
     def cardinality_checker(self) -> Optional[CardinalityChecker]:
         return self._cardinality_checker
@@ -301,18 +311,35 @@ class CategoricalColumnDomainBuilder(ColumnDomainBuilder):
             if column_name not in allowed_column_names_passthrough
         ]
 
-        metrics_for_cardinality_check: Dict[str, List[MetricConfiguration]] = (
-            self._generate_metric_configurations_to_check_cardinality(
-                column_names=effective_column_names, batch_ids=batch_ids
-            )
-        )
-
         if validator is None:
             raise ProfilerExecutionError(
                 message=f"Error: Failed to obtain Validator {self.__class__.__name__}"
                 " (Validator is required for cardinality checks)."
             )
 
+        # Obtain approximate_cardinality from "rule state" (i.e., variables and parameters); from instance variable otherwise.  # noqa: E501
+        approximate_cardinality: bool = get_parameter_value_and_validate_return_type(
+            domain=None,
+            parameter_reference=self.approximate_cardinality,
+            expected_return_type=bool,
+            variables=variables,
+            parameters=None,
+        )
+
+        if approximate_cardinality:
+            effective_column_names = self._column_names_not_clearly_exceeding_cardinality_limit(
+                validator=validator,
+                column_names=effective_column_names,
+                batch_ids=batch_ids,
+                runtime_configuration=runtime_configuration,
+            )
+
+        metrics_for_cardinality_check: Dict[str, List[MetricConfiguration]] = (
+            self._generate_metric_configurations_to_check_cardinality(
+                column_names=effective_column_names, batch_ids=batch_ids
+            )
+        )
+
         candidate_column_names: List[str] = self._column_names_meeting_cardinality_limit(
             validator=validator,
             metrics_for_cardinality_check=metrics_for_cardinality_check,
@@ -369,6 +396,99 @@ class CategoricalColumnDomainBuilder(ColumnDomainBuilder):
 
         return metric_configurations
 
+    def _column_names_not_clearly_exceeding_cardinality_limit(
+        self,
+        validator: Validator,
+        column_names: List[str],
+        batch_ids: Optional[List[str]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> List[str]:
+        """Estimate cardinality and return column names whose estimate does not clearly exceed limit.
+
+        Batches are processed one at a time, so that columns ruled out by one Batch are not
+        estimated for the remaining Batches.
+
+        Args:
+            validator: Validator used to estimate column cardinality.
+            column_names: List of column_names to estimate cardinality for.
+            batch_ids: List of batch_ids used to create metric configurations.
+            runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+
+        Returns:
+            List of column names that still need an exact cardinality check.
+        """  # noqa: E501
+        estimate_proportion_unique: bool = isinstance(
+            self.cardinality_checker.cardinality_limit_mode,  # type: ignore[union-attr] # could be None
+            RelativeCardinalityLimit,
+        )
+
+        candidate_column_names: List[str] = column_names
+
+        batch_id: str
+        column_name: str
+        for batch_id in batch_ids or []:
+            if not candidate_column_names:
+                break
+
+            metrics_for_cardinality_estimate: Dict[str, List[MetricConfiguration]] = {
+                column_name: [
+                    MetricConfiguration(
+                        metric_name=metric_name,
+                        metric_domain_kwargs={
+                            "column": column_name,
+                            "batch_id": batch_id,
+                        },
+                        metric_value_kwargs=None,
+                    )
+                    for metric_name in (
+                        [
+                            "column.distinct_values.count.approx",
+                            "column_values.nonnull.count",
+                        ]
+                        if estimate_proportion_unique
+                        else ["column.distinct_values.count.approx"]
+                    )
+                ]
+                for column_name in candidate_column_names
+            }
+
+            resolved_metrics_by_column_name: Dict[str, Dict[Tuple[str, str, str], MetricValue]] = (
+                get_resolved_metrics_by_key(
+                    validator=validator,
+                    metric_configurations_by_key=metrics_for_cardinality_estimate,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+            candidate_column_names = [
+                column_name
+                for column_name in candidate_column_names
+                if not self.cardinality_checker.cardinality_clearly_exceeds_limit(  # type: ignore[union-attr] # could be None
+                    metric_value=self._get_estimated_cardinality(
+                        metric_configurations=metrics_for_cardinality_estimate[column_name],
+                        resolved_metrics=resolved_metrics_by_column_name[column_name],
+                    )
+                )
+            ]
+
+        return candidate_column_names
+
+    @staticmethod
+    def _get_estimated_cardinality(
+        metric_configurations: List[MetricConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> Union[int, float]:
+        """Return estimated number of unique values, or their proportion of non-null values."""
+        estimated_unique_values: int = resolved_metrics[metric_configurations[0].id]  # type: ignore[assignment] # Expecting int (subset of "MetricValue").
+        if len(metric_configurations) == 1:
+            return estimated_unique_values
+
+        nonnull_count: int = resolved_metrics[metric_configurations[1].id]  # type: ignore[assignment] # Expecting int (subset of "MetricValue").
+        if not nonnull_count:
+            return 0.0
+
+        return min(estimated_unique_values / nonnull_count, 1.0)
+
     def _column_names_meeting_cardinality_limit(
         self,
         validator: Validator,
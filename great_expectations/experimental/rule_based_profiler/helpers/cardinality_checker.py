@@ -12,6 +12,10 @@ from great_expectations.experimental.rule_based_profiler.exceptions import (
 from great_expectations.types import SerializableDictDot
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
+# Margin by which an estimated cardinality must exceed the limit before the estimate alone rules a
+# column out; it comfortably covers the relative error of HyperLogLog-based estimates.
+APPROXIMATE_CARDINALITY_MARGIN = 0.1
+
 
 @dataclass(frozen=True)
 class CardinalityLimit(abc.ABC, SerializableDictDot):
@@ -161,6 +165,37 @@ class CardinalityChecker:
             f'Unknown "cardinality_limit_mode" mode "{self._cardinality_limit_mode}" encountered.'
         )
 
+    def cardinality_clearly_exceeds_limit(
+        self,
+        metric_value: Union[int, float],  # noqa: PYI041
+    ) -> bool:
+        """Determine if an estimated cardinality exceeds the configured limit beyond its error.
+
+        Columns whose estimate does not clearly exceed the limit need an exact check.
+
+        Args:
+            metric_value: int if estimated number of unique values, float if estimated proportion
+                of unique values.
+
+        Returns:
+            Boolean of whether the estimate exceeds the configured limit by more than
+            APPROXIMATE_CARDINALITY_MARGIN
+        """
+        self._validate_metric_value(metric_value=metric_value)
+        if isinstance(self._cardinality_limit_mode, AbsoluteCardinalityLimit):
+            return metric_value > self._cardinality_limit_mode.max_unique_values * (
+                1.0 + APPROXIMATE_CARDINALITY_MARGIN
+            )
+
+        if isinstance(self._cardinality_limit_mode, RelativeCardinalityLimit):
+            return float(metric_value) > self._cardinality_limit_mode.max_proportion_unique * (
+                1.0 + APPROXIMATE_CARDINALITY_MARGIN
+            )
+
+        raise ValueError(  # noqa: TRY003
+            f'Unknown "cardinality_limit_mode" mode "{self._cardinality_limit_mode}" encountered.'
+        )
+
     @staticmethod
     def _validate_metric_value(metric_value: Union[int, float]) -> None:  # noqa: PYI041
         if not isinstance(metric_value, (int, float)):
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import copy
 import datetime
 import hashlib
 import itertools
+import json
 import logging
 import re
+import threading
 import uuid
 import warnings
 from numbers import Number
@@ -15,10 +19,13 @@ from typing import (
     Callable,
     Dict,
     Final,
+    Hashable,
     Iterable,
+    Iterator,
     List,
     Optional,
     Protocol,
+    Set,
     Tuple,
     Union,
 )
@@ -34,6 +41,7 @@ from great_expectations.core.batch import (
     BatchRequest,
     BatchRequestBase,
     RuntimeBatchRequest,
+    get_batch_request_as_dict,
     materialize_batch_request,
 )
 from great_expectations.core.domain import (
@@ -97,6 +105,189 @@ RECOGNIZED_QUANTILE_STATISTIC_INTERPOLATION_METHODS: set = {
 
 NP_RANDOM_GENERATOR: Final = np.random.default_rng()
 
+# Upper bound on the number of elements of each block of bootstrap resamples held in memory at once.
+BOOTSTRAP_RESAMPLES_BLOCK_MAX_ELEMENTS: Final[int] = 2**22
+
+
+class _ExecutionEngineLeaseConflict(ProfilerExecutionError):
+    """Raised instead of waiting for an execution engine, when waiting would deadlock concurrently running rules."""  # noqa: E501
+
+
+class _ExecutionEngineLeases:
+    """
+    Gives each rule of a concurrent profiler run exclusive use of every execution engine it touches, until the rule
+    finishes.  An execution engine keeps the active batch (and, for some dialects, a single database connection) as
+    shared mutable state, so rules that use the same engine run one at a time, while rules that use different engines
+    overlap.  A rule whose wait for an engine would close a cycle of rules waiting for each other's engines fails with
+    "_ExecutionEngineLeaseConflict" instead (releasing its engines, so that the other rules can proceed).
+    """  # noqa: E501
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        # Keyed by "id()" of execution engines, which are cached by their datasources.
+        self._holders: Dict[int, object] = {}
+        self._waiting_for: Dict[object, int] = {}
+
+    def acquire(self, owner: object, execution_engine: Any) -> None:
+        engine_key: int = id(execution_engine)
+        with self._condition:
+            while self._holders.get(engine_key, owner) is not owner:
+                if self._would_deadlock(owner=owner, engine_key=engine_key):
+                    raise _ExecutionEngineLeaseConflict(
+                        message=f"""{__name__}: rules running concurrently are waiting for each other's execution \
+engines.
+"""  # noqa: E501
+                    )
+
+                self._waiting_for[owner] = engine_key
+                self._condition.wait()
+
+            self._waiting_for.pop(owner, None)
+            self._holders[engine_key] = owner
+
+    def release_all(self, owner: object) -> None:
+        with self._condition:
+            self._holders = {
+                engine_key: holder
+                for engine_key, holder in self._holders.items()
+                if holder is not owner
+            }
+            self._condition.notify_all()
+
+    def _would_deadlock(self, owner: object, engine_key: int) -> bool:
+        # Follow the chain of rules that hold the requested engine while waiting for another one.
+        holder: Optional[object] = self._holders.get(engine_key)
+        visited: Set[int] = set()
+        while holder is not None and id(holder) not in visited:
+            if holder is owner:
+                return True
+
+            visited.add(id(holder))
+            waited_engine_key: Optional[int] = self._waiting_for.get(holder)
+            if waited_engine_key is None:
+                return False
+
+            holder = self._holders.get(waited_engine_key)
+
+        return False
+
+
+class _ValidatorCache:
+    """Validators and last batches shared by every "Builder" within a "validator_cache_scope()"."""
+
+    def __init__(self, execution_engine_leases: Optional[_ExecutionEngineLeases] = None) -> None:
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._values: Dict[Hashable, Any] = {}
+        self._execution_engine_leases = execution_engine_leases
+
+    def get_or_create(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        with self._lock:
+            key_lock: threading.Lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Concurrent requests for the same key wait for a single creation, rather than repeating it.
+        with key_lock:
+            if key not in self._values:
+                self._values[key] = create()
+
+            return self._values[key]
+
+    def with_execution_engine_leases(
+        self, execution_engine_leases: _ExecutionEngineLeases
+    ) -> _ValidatorCache:
+        """Return a cache sharing the validators and batches of this one, holding its own execution engine leases."""  # noqa: E501
+        validator_cache: _ValidatorCache = copy.copy(self)
+        validator_cache._execution_engine_leases = execution_engine_leases
+        return validator_cache
+
+    @property
+    def uses_execution_engine_leases(self) -> bool:
+        return self._execution_engine_leases is not None
+
+    def acquire_execution_engine(self, execution_engine: Any) -> None:
+        if self._execution_engine_leases is not None and execution_engine is not None:
+            self._execution_engine_leases.acquire(owner=self, execution_engine=execution_engine)
+
+    def release_execution_engines(self) -> None:
+        if self._execution_engine_leases is not None:
+            self._execution_engine_leases.release_all(owner=self)
+
+
+_validator_cache: contextvars.ContextVar[Optional[_ValidatorCache]] = contextvars.ContextVar(
+    "rule_based_profiler_validator_cache", default=None
+)
+
+
+@contextlib.contextmanager
+def validator_cache_scope(
+    validator_cache: Optional[_ValidatorCache] = None,
+) -> Iterator[None]:
+    """
+    Within this scope, "get_validator()" and "get_batch_ids()" load the batches of each distinct batch request (or
+    "batch_list") only once, and share the resulting "Validator" (and its metrics cache) among all callers.
+
+    Scopes are reentrant: a nested scope reuses the cache of the enclosing one.  If "validator_cache" is given, it is
+    used instead of a new cache; if it has execution engine leases, the scope holds exclusive use of each execution
+    engine it loads batches with until it is exited.
+    """  # noqa: E501
+    if _validator_cache.get() is not None:
+        yield
+        return
+
+    if validator_cache is None:
+        validator_cache = _ValidatorCache()
+
+    token: contextvars.Token = _validator_cache.set(validator_cache)
+    try:
+        yield
+    finally:
+        _validator_cache.reset(token)
+        validator_cache.release_execution_engines()
+
+
+def _get_execution_engine(
+    data_context: Optional[AbstractDataContext],
+    batch_list: Optional[List[Batch]],
+    batch_request: Optional[Union[BatchRequestBase, dict]],
+) -> Optional[Any]:
+    """Return the execution engine that batches are (to be) loaded with, if it can be determined."""
+    batch: Batch
+    for batch in batch_list or []:
+        if batch is not None and batch.data is not None:
+            return batch.data.execution_engine
+
+    if data_context is None or batch_request is None:
+        return None
+
+    datasource_name: Optional[str] = get_batch_request_as_dict(batch_request=batch_request).get(
+        "datasource_name"
+    )
+    try:
+        return data_context.get_datasource(datasource_name).get_execution_engine()  # type: ignore[arg-type]
+    except Exception:
+        # Loading the batches reports the unknown datasource.
+        return None
+
+
+def _get_batch_source_cache_key(
+    purpose: str,
+    data_context: Optional[AbstractDataContext],
+    batch_list: Optional[List[Batch]],
+    batch_request: Optional[Union[BatchRequestBase, dict]],
+) -> Hashable:
+    """
+    Batches supplied in-memory (as "batch_list" or runtime "batch_data") are identified by object identity, since their
+    contents may differ even if their identifiers do not.
+    """  # noqa: E501
+    batch_list_key: Tuple[int, ...] = tuple(id(batch) for batch in batch_list or [])
+    batch_request_key: str = json.dumps(
+        get_batch_request_as_dict(batch_request=batch_request),
+        sort_keys=True,
+        default=lambda value: f"{type(value).__name__}@{id(value)}",
+    )
+
+    return purpose, id(data_context), batch_list_key, batch_request_key
+
 
 def get_validator(  # noqa: PLR0913
     purpose: str,
@@ -137,20 +328,42 @@ def get_validator(  # noqa: PLR0913
 """  # noqa: E501
             )
 
-    validator = get_validator_with_expectation_suite(
-        data_context=data_context,
-        batch_list=batch_list,
-        batch_request=batch_request,
-        expectation_suite=None,
-        expectation_suite_name=expectation_suite_name,
-        component_name=f"rule_based_profiler-{expectation_suite_name}",
-        persist=False,
-    )
+    def create_validator() -> Validator:
+        validator: Validator = get_validator_with_expectation_suite(
+            data_context=data_context,
+            batch_list=batch_list,
+            batch_request=batch_request,
+            expectation_suite=None,
+            expectation_suite_name=expectation_suite_name,
+            component_name=f"rule_based_profiler-{expectation_suite_name}",
+            persist=False,
+        )
 
-    # Always disabled for RBP and DataAssistants due to volume of metric calculations
-    validator.show_progress_bars = False
+        # Always disabled for RBP and DataAssistants due to volume of metric calculations
+        validator.show_progress_bars = False
 
-    return validator
+        return validator
+
+    validator_cache: Optional[_ValidatorCache] = _validator_cache.get()
+    if validator_cache is None:
+        return create_validator()
+
+    if validator_cache.uses_execution_engine_leases:
+        validator_cache.acquire_execution_engine(
+            _get_execution_engine(
+                data_context=data_context, batch_list=batch_list, batch_request=batch_request
+            )
+        )
+
+    return validator_cache.get_or_create(
+        key=_get_batch_source_cache_key(
+            purpose="validator",
+            data_context=data_context,
+            batch_list=batch_list,
+            batch_request=batch_request,
+        ),
+        create=create_validator,
+    )
 
 
 def get_batch_ids(  # noqa: PLR0913
@@ -174,7 +387,28 @@ def get_batch_ids(  # noqa: PLR0913
             parameters=parameters,
         )
 
-        batch_list = [data_context.get_last_batch(batch_request=batch_request)]
+        validator_cache: Optional[_ValidatorCache] = _validator_cache.get()
+        if validator_cache is None:
+            batch_list = [data_context.get_last_batch(batch_request=batch_request)]
+        else:
+            if validator_cache.uses_execution_engine_leases:
+                validator_cache.acquire_execution_engine(
+                    _get_execution_engine(
+                        data_context=data_context, batch_list=None, batch_request=batch_request
+                    )
+                )
+
+            batch_list = [
+                validator_cache.get_or_create(
+                    key=_get_batch_source_cache_key(
+                        purpose="last_batch",
+                        data_context=data_context,
+                        batch_list=None,
+                        batch_request=batch_request,
+                    ),
+                    create=lambda: data_context.get_last_batch(batch_request=batch_request),
+                )
+            ]
 
     batch_ids: List[str] = [batch.id for batch in batch_list]
 
@@ -376,20 +610,16 @@ def get_resolved_metrics_by_key(
     )
 
     # Step 2: Gather "MetricConfiguration" ID values for each key (one element per batch_id in every list).  # noqa: E501
+    # Computing an ID hashes the metric's domain and value kwargs, so each is computed only once.
     metric_configuration_ids_by_key: Dict[str, List[Tuple[str, str, str]]] = {
         key: [metric_configuration.id for metric_configuration in metric_configurations_for_key]
         for key, metric_configurations_for_key in metric_configurations_by_key.items()
     }
 
     metric_configuration_ids: List[Tuple[str, str, str]]
-    # Step 3: Obtain flattened list of "MetricConfiguration" ID values across all key values/combinations.  # noqa: E501
-    metric_configuration_ids_all_keys: List[Tuple[str, str, str]] = list(
-        itertools.chain(
-            *[
-                metric_configuration_ids
-                for metric_configuration_ids in metric_configuration_ids_by_key.values()
-            ]
-        )
+    # Step 3: Obtain set of "MetricConfiguration" ID values across all key values/combinations.
+    metric_configuration_ids_all_keys: Set[Tuple[str, str, str]] = set(
+        itertools.chain.from_iterable(metric_configuration_ids_by_key.values())
     )
 
     # Step 4: Retain only those metric computation results that both, correspond to "MetricConfiguration" objects of  # noqa: E501
@@ -402,25 +632,20 @@ def get_resolved_metrics_by_key(
         if metric_configuration_id in metric_configuration_ids_all_keys
     }
 
-    # Step 5: Gather "MetricConfiguration" ID values for effective collection of resolved metrics.
-    metric_configuration_ids_resolved_metrics: List[Tuple[str, str, str]] = list(
-        resolved_metrics.keys()
-    )
-
-    # Step 6: Produce "key" list, corresponding to effective "MetricConfiguration" ID values.
+    # Step 5: Produce "key" list, corresponding to effective "MetricConfiguration" ID values.
     candidate_keys: List[str] = [
         key
         for key, metric_configuration_ids in metric_configuration_ids_by_key.items()
         if all(
-            metric_configuration_id in metric_configuration_ids_resolved_metrics
+            metric_configuration_id in resolved_metrics
             for metric_configuration_id in metric_configuration_ids
         )
     ]
 
     resolved_metrics_by_key: Dict[str, Dict[Tuple[str, str, str], MetricValue]] = {
         key: {
-            metric_configuration.id: resolved_metrics[metric_configuration.id]
-            for metric_configuration in metric_configurations_by_key[key]
+            metric_configuration_id: resolved_metrics[metric_configuration_id]
+            for metric_configuration_id in metric_configuration_ids_by_key[key]
         }
         for key in candidate_keys
     }
@@ -799,20 +1024,25 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
         method=quantile_statistic_interpolation_method,
     )
 
-    bootstraps: np.ndarray
+    random_generator: np.random.Generator
     if random_seed:
-        random_state: np.random.Generator = np.random.Generator(np.random.PCG64(random_seed))
-        bootstraps = random_state.choice(metric_values, size=(n_resamples, metric_values.size))
+        random_generator = np.random.Generator(np.random.PCG64(random_seed))
     else:
-        bootstraps = NP_RANDOM_GENERATOR.choice(
-            metric_values, size=(n_resamples, metric_values.size)
-        )
+        random_generator = NP_RANDOM_GENERATOR
+
+    bootstrap_lower_quantiles: np.ndarray
+    bootstrap_upper_quantiles: np.ndarray
+    bootstrap_lower_quantiles, bootstrap_upper_quantiles = _compute_bootstrap_quantiles(
+        metric_values=metric_values,
+        quantile_pcts=[lower_quantile_pct, upper_quantile_pct],
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        random_generator=random_generator,
+    )
 
     lower_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime] = (
         _determine_quantile_bias_corrected_point_estimate(
-            bootstraps=bootstraps,
-            quantile_pct=lower_quantile_pct,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+            bootstrap_quantiles=bootstrap_lower_quantiles,
             quantile_bias_correction=quantile_bias_correction,
             quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
             sample_quantile=sample_lower_quantile,
@@ -820,9 +1050,7 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
     )
     upper_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime] = (
         _determine_quantile_bias_corrected_point_estimate(
-            bootstraps=bootstraps,
-            quantile_pct=upper_quantile_pct,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+            bootstrap_quantiles=bootstrap_upper_quantiles,
             quantile_bias_correction=quantile_bias_correction,
             quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
             sample_quantile=sample_upper_quantile,
@@ -885,20 +1113,52 @@ def build_numeric_range_estimation_result(
     )
 
 
-def _determine_quantile_bias_corrected_point_estimate(  # noqa: PLR0913
-    bootstraps: np.ndarray,
-    quantile_pct: float,
+def _compute_bootstrap_quantiles(
+    metric_values: np.ndarray,
+    quantile_pcts: List[float],
+    n_resamples: int,
     quantile_statistic_interpolation_method: str,
+    random_generator: np.random.Generator,
+) -> np.ndarray:
+    """
+    Draws "n_resamples" bootstrap resamples of "metric_values" and computes the requested quantiles of each of them.
+
+    Resamples are drawn and reduced in blocks of at most "BOOTSTRAP_RESAMPLES_BLOCK_MAX_ELEMENTS" elements, so that
+    memory use does not grow with "n_resamples".  Blocks are drawn consecutively from "random_generator", which yields
+    the same resamples as drawing the full "(n_resamples, metric_values.size)" matrix at once.
+
+    Returns:
+        "np.ndarray" of shape "(len(quantile_pcts), n_resamples)", holding quantiles of every resample.
+    """  # noqa: E501
+    block_num_resamples: int = max(
+        1, BOOTSTRAP_RESAMPLES_BLOCK_MAX_ELEMENTS // max(1, metric_values.size)
+    )
+
+    bootstrap_quantiles_blocks: List[np.ndarray] = []
+    block_start: int
+    for block_start in range(0, n_resamples, block_num_resamples):
+        bootstraps: np.ndarray = random_generator.choice(
+            metric_values,
+            size=(min(block_num_resamples, n_resamples - block_start), metric_values.size),
+        )
+        bootstrap_quantiles_blocks.append(
+            numpy.numpy_quantile(
+                bootstraps,
+                q=quantile_pcts,  # type: ignore[arg-type] # all quantiles are computed in one pass
+                axis=1,
+                method=quantile_statistic_interpolation_method,
+            )
+        )
+
+    return np.concatenate(bootstrap_quantiles_blocks, axis=1)
+
+
+def _determine_quantile_bias_corrected_point_estimate(
+    bootstrap_quantiles: np.ndarray,
     quantile_bias_correction: bool,
     quantile_bias_std_error_ratio_threshold: float,
     sample_quantile: np.ndarray,
 ) -> np.float64:
-    bootstrap_quantiles: Union[np.ndarray, np.float64] = numpy.numpy_quantile(
-        bootstraps,
-        q=quantile_pct,
-        axis=1,
-        method=quantile_statistic_interpolation_method,
-    )
     bootstrap_quantile_point_estimate: np.ndarray = np.mean(bootstrap_quantiles)
     bootstrap_quantile_standard_error: np.ndarray = np.std(bootstrap_quantiles)
     bootstrap_quantile_bias: float = bootstrap_quantile_point_estimate - sample_quantile
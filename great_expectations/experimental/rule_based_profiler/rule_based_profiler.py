@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
 import copy
 import datetime
 import json
@@ -53,7 +55,11 @@ from great_expectations.experimental.rule_based_profiler.helpers.configuration_r
     reconcile_rule_variables,
 )
 from great_expectations.experimental.rule_based_profiler.helpers.util import (
+    _ExecutionEngineLeaseConflict,
+    _ExecutionEngineLeases,
+    _ValidatorCache,
     convert_variables_to_dict,
+    validator_cache_scope,
 )
 from great_expectations.experimental.rule_based_profiler.parameter_builder import (
     ParameterBuilder,
@@ -248,6 +254,7 @@ class BaseRuleBasedProfiler(ConfigPeer):
         variables_directives_list: Optional[List[RuntimeEnvironmentVariablesDirectives]] = None,
         domain_type_directives_list: Optional[List[RuntimeEnvironmentDomainTypeDirectives]] = None,
         comment: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> RuleBasedProfilerResult:
         """Run the Rule-Based Profiler.
 
@@ -261,6 +268,8 @@ class BaseRuleBasedProfiler(ConfigPeer):
             variables_directives_list: Additional override runtime variables directives (modify `BaseRuleBasedProfiler`).
             domain_type_directives_list: Additional override runtime domain directives (modify `BaseRuleBasedProfiler`).
             comment: A citation for the Expectation Suite returned as part of the `RuleBasedProfilerResult`.
+            max_workers: If greater than 1, up to this many rules are run concurrently in a thread pool; results keep the order of the rules.
+                Rules that use the same execution engine (i.e., the same datasource) still run one at a time, so this only shortens runs whose rules use different datasources.
 
         Returns:
             A `RuleBasedProfilerResult` instance that contains the profiling output.
@@ -304,39 +313,33 @@ class BaseRuleBasedProfiler(ConfigPeer):
 
         pbar_method: Callable = determine_progress_bar_method_by_environment()
 
-        rule_state: RuleState
-        rule: Rule
-        for rule in pbar_method(
-            effective_rules,
-            desc="Generating Expectations:",
-            disable=disable,
-            position=0,
-            leave=True,
-            bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
-        ):
-            try:
-                rule_state = rule.run(
-                    variables=effective_variables,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    runtime_configuration=runtime_configuration,
-                    reconciliation_directives=reconciliation_directives,
-                    rule_state=RuleState(),
-                )
-                self.rule_states.append(rule_state)
-            except Exception as err:
-                if self._catch_exceptions:
-                    rule_state = RuleState(rule=rule, catch_exceptions=True)
-                    exception_traceback: str = traceback.format_exc()
-                    exception_message: str = str(err)
-                    exception_info = ExceptionInfo(
-                        exception_traceback=exception_traceback,
-                        exception_message=exception_message,
-                    )
-                    rule_state.exception_traceback = exception_info
-                    self.rule_states.append(rule_state)
-                else:
-                    raise err  # noqa: TRY201
+        rule_kwargs: dict = {
+            "variables": effective_variables,
+            "batch_list": batch_list,
+            "batch_request": batch_request,
+            "runtime_configuration": runtime_configuration,
+            "reconciliation_directives": reconciliation_directives,
+        }
+        pbar_kwargs: dict = {
+            "desc": "Generating Expectations:",
+            "disable": disable,
+            "position": 0,
+            "leave": True,
+            "bar_format": "{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
+        }
+
+        if max_workers is not None and max_workers > 1 and len(effective_rules) > 1:
+            self._run_rules_concurrently(
+                rules=effective_rules,
+                max_workers=max_workers,
+                rule_kwargs=rule_kwargs,
+                pbar_kwargs=pbar_kwargs,
+            )
+        else:
+            # All rules share the batches (and metrics) loaded for each distinct batch request.
+            with validator_cache_scope():
+                for rule in pbar_method(effective_rules, **pbar_kwargs):
+                    self.rule_states.append(self._run_rule(rule=rule, rule_kwargs=rule_kwargs))
 
         return RuleBasedProfilerResult(
             fully_qualified_parameter_names_by_domain=self.get_fully_qualified_parameter_names_by_domain(),
@@ -371,6 +374,92 @@ class BaseRuleBasedProfiler(ConfigPeer):
             },
         )
 
+    def _run_rules_concurrently(
+        self,
+        rules: List[Rule],
+        max_workers: int,
+        rule_kwargs: dict,
+        pbar_kwargs: dict,
+    ) -> None:
+        """
+        Runs rules in a thread pool, so that rules using different execution engines (i.e., different datasources)
+        overlap while waiting on their computations.  Rule states are appended in the order of the rules, regardless of
+        the order in which rules complete.
+
+        Execution engines are not thread-safe: every validator of a datasource uses its one cached execution engine,
+        whose batch manager (active batch) and, for some dialects, single database connection are shared.  Hence, each
+        rule holds exclusive use of the execution engines it loads batches with until it finishes, and rules that use
+        the same execution engine run one at a time; in particular, rules that all profile one SQL datasource do not
+        run any faster than sequentially.  As in a sequential run, all rules share the batches (and metrics) loaded for
+        each distinct batch request.  Rules that would deadlock waiting for each other's execution engines are rerun one
+        at a time after the others finish.
+        """  # noqa: E501
+        validator_cache = _ValidatorCache()
+        execution_engine_leases = _ExecutionEngineLeases()
+        rule: Rule
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: List[concurrent.futures.Future] = [
+                # A fresh context keeps each rule out of any enclosing "validator_cache_scope()".
+                executor.submit(
+                    contextvars.Context().run,
+                    self._run_rule_in_validator_cache_scope,
+                    rule=rule,
+                    rule_kwargs=rule_kwargs,
+                    validator_cache=validator_cache.with_execution_engine_leases(
+                        execution_engine_leases=execution_engine_leases
+                    ),
+                )
+                for rule in rules
+            ]
+            pbar_method: Callable = determine_progress_bar_method_by_environment()
+            rule_states: List[Optional[RuleState]] = []
+            future: concurrent.futures.Future
+            for future in pbar_method(futures, **pbar_kwargs):
+                try:
+                    rule_states.append(future.result())
+                except _ExecutionEngineLeaseConflict:
+                    rule_states.append(None)
+
+        concurrent_rule_state: Optional[RuleState]
+        with validator_cache_scope(validator_cache=validator_cache):
+            for rule, concurrent_rule_state in zip(rules, rule_states):
+                self.rule_states.append(
+                    self._run_rule(rule=rule, rule_kwargs=rule_kwargs)
+                    if concurrent_rule_state is None
+                    else concurrent_rule_state
+                )
+
+    def _run_rule_in_validator_cache_scope(
+        self,
+        rule: Rule,
+        rule_kwargs: dict,
+        validator_cache: _ValidatorCache,
+    ) -> RuleState:
+        with validator_cache_scope(validator_cache=validator_cache):
+            return self._run_rule(rule=rule, rule_kwargs=rule_kwargs)
+
+    def _run_rule(self, rule: Rule, rule_kwargs: dict) -> RuleState:
+        rule_state: RuleState
+        try:
+            rule_state = rule.run(rule_state=RuleState(), **rule_kwargs)
+        except _ExecutionEngineLeaseConflict:
+            # The rule is rerun, rather than failed.
+            raise
+        except Exception as err:
+            if self._catch_exceptions:
+                rule_state = RuleState(rule=rule, catch_exceptions=True)
+                exception_traceback: str = traceback.format_exc()
+                exception_message: str = str(err)
+                exception_info = ExceptionInfo(
+                    exception_traceback=exception_traceback,
+                    exception_message=exception_message,
+                )
+                rule_state.exception_traceback = exception_info
+            else:
+                raise err  # noqa: TRY201
+
+        return rule_state
+
     def get_expectation_configurations(self) -> List[ExpectationConfiguration]:
         """
         Returns:
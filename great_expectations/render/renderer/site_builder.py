@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
+import itertools
+import json
 import logging
+import multiprocessing
 import os
 import pathlib
 import traceback
 import urllib
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
+from great_expectations import __version__ as ge_version
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.util import nested_update
@@ -16,6 +22,7 @@ from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
     SiteSectionIdentifier,
 )
+from great_expectations.data_context.store.in_memory_store_backend import InMemoryStoreBackend
 from great_expectations.data_context.store.json_site_store import JsonSiteStore
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
@@ -24,12 +31,14 @@ from great_expectations.data_context.types.resource_identifiers import (
 )
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.render.util import resource_key_passes_run_name_filter
+from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 if TYPE_CHECKING:
     from great_expectations.core.expectation_validation_result import (
         ExpectationValidationResult,
     )
     from great_expectations.data_context import AbstractDataContext
+    from great_expectations.data_context.types.base import DataContextConfig
 
 logger = logging.getLogger(__name__)
 
@@ -288,7 +297,12 @@ class SiteBuilder:
     def clean_site(self) -> None:
         self.target_store.clean_site()
 
-    def build(self, resource_identifiers=None, build_index: bool = True):
+    def build(
+        self,
+        resource_identifiers=None,
+        build_index: bool = True,
+        force_rebuild: bool = False,
+    ):
         """
 
         :param resource_identifiers: a list of resource identifiers
@@ -302,12 +316,18 @@ class SiteBuilder:
 
         :param build_index: a flag if False, skips building the index page
 
+        :param force_rebuild: a flag if True, re-renders every page, even those
+                            whose source has not changed since it was last
+                            rendered
+
         :return:
         """
 
         # copy static assets
         for site_section_builder in self.site_section_builders.values():
-            site_section_builder.build(resource_identifiers=resource_identifiers)
+            site_section_builder.build(
+                resource_identifiers=resource_identifiers, force_rebuild=force_rebuild
+            )
 
         # GX Cloud supports JSON Site Data Docs
         # Skip static assets, indexing
@@ -316,7 +336,9 @@ class SiteBuilder:
 
         self.target_store.copy_static_assets()
 
-        _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+        _, index_links_dict = self.site_index_builder.build(
+            build_index=build_index, resource_identifiers=resource_identifiers
+        )
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -340,6 +362,9 @@ class SiteBuilder:
 
 
 class DefaultSiteSectionBuilder:
+    # Bump when a change to rendering should invalidate every previously rendered page
+    PAGE_TEMPLATE_VERSION = 1
+
     def __init__(  # noqa: PLR0913
         self,
         name,
@@ -357,6 +382,7 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        max_workers=None,
         **kwargs,
     ) -> None:
         self.name = name
@@ -371,6 +397,34 @@ class DefaultSiteSectionBuilder:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
         self.ge_cloud_mode = cloud_mode
+        # If greater than 1, pages are rendered by a pool of this many worker processes.  Workers
+        # recreate the Data Context from its in-memory config, so they need a file-backed context
+        # whose source store persists outside of this process; otherwise pages are rendered here.
+        self.max_workers = max_workers
+        # Arguments needed to recreate this section builder in a worker process
+        self._worker_config = {
+            "name": name,
+            "source_store_name": source_store_name,
+            "custom_styles_directory": custom_styles_directory,
+            "custom_views_directory": custom_views_directory,
+            "show_how_to_buttons": show_how_to_buttons,
+            "renderer": renderer,
+            "view": view,
+            "data_context_id": data_context_id,
+        }
+        # Mixed into every page hash, so that pages are re-rendered after an upgrade or a change
+        # to how this section is rendered, including edits to custom styles and views
+        self._page_hash_salt = json.dumps(
+            [
+                ge_version,
+                self.PAGE_TEMPLATE_VERSION,
+                self._worker_config,
+                _hash_directory_contents(custom_styles_directory),
+                _hash_directory_contents(custom_views_directory),
+            ],
+            sort_keys=True,
+            default=str,
+        )
         if renderer is None:
             raise exceptions.InvalidConfigError(  # noqa: TRY003
                 "SiteSectionBuilder requires a renderer configuration " "with a class_name key."
@@ -410,13 +464,50 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:  # noqa: C901, PLR0912
-        source_store_keys = self.source_store.list_keys()
-        if self.name == "validations" and self.validation_results_limit:
+    def build(self, resource_identifiers=None, force_rebuild: bool = False) -> None:
+        """Render and write the page of every resource in this section.
+
+        Pages whose source is unchanged since it was last rendered are skipped, unless
+        `force_rebuild` is set.
+        """
+        resource_keys = self._get_resource_keys_to_build(resource_identifiers)
+
+        worker_count = min(self.max_workers or 1, len(resource_keys))
+        if worker_count > 1 and not self.cloud_mode:
+            if self._can_render_pages_in_worker_processes():
+                self._build_pages_in_worker_processes(resource_keys, worker_count, force_rebuild)
+                return
+            logger.warning(
+                "Rendering data docs pages in parallel requires a file-backed Data Context and "
+                "source store; rendering them one at a time instead."
+            )
+
+        for resource_key in resource_keys:
+            known_page_hash = self._get_known_page_hash(resource_key, force_rebuild)
+            page_hash = self._build_page(resource_key, known_page_hash)
+            self._record_page_hash(resource_key, known_page_hash, page_hash)
+
+    def _get_resource_keys_to_build(self, resource_identifiers=None) -> list:
+        limit_validation_results = self.name == "validations" and self.validation_results_limit
+        if resource_identifiers and not limit_validation_results and not self.cloud_mode:
+            # Only the requested resources are rendered, so the source store need not be listed.
+            # Keys are round-tripped through tuples to match the ones list_keys would return.
+            source_store_keys = [
+                type(resource_identifier).from_tuple(resource_identifier.to_tuple())
+                for resource_identifier in resource_identifiers
+                if isinstance(resource_identifier, self.source_store.key_class)
+                and self.source_store.has_key(resource_identifier)
+            ]
+        else:
+            source_store_keys = self.source_store.list_keys()
+        if limit_validation_results:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
+        if resource_identifiers:
+            resource_identifiers = set(resource_identifiers)
 
+        resource_keys = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -429,68 +520,280 @@ class DefaultSiteSectionBuilder:
             if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
                 if not resource_key_passes_run_name_filter(resource_key, self.run_name_filter):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(**resource)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
-                )
-                continue
+            resource_keys.append(resource_key)
 
-            if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.name
-                logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = resource_key.expectation_suite_identifier.name
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
-                    )
+        return resource_keys
+
+    def _build_page(self, resource_key, known_page_hash: Optional[str] = None) -> Optional[str]:
+        """Render and write the page of a resource, unless its source hashes to `known_page_hash`.
+
+        Returns:
+            The hash of the page's source, or None if no page was written for it.
+        """
+        resource = self._get_resource(resource_key)
+        if resource is None:
+            return None
 
-            try:
+        try:
+            if self.cloud_mode:
                 rendered_content = self.renderer_class.render(resource)
+                self.target_store.set(
+                    GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
+                    rendered_content,
+                    source_type=resource_key.resource_type,
+                    source_id=resource_key.id,
+                )
+                return None
 
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
-                    )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
+            page_hash = self._hash_resource(resource)
+            if page_hash == known_page_hash:
+                logger.debug(f"        Skipping unchanged page for {resource_key!s}")
+                return page_hash
+            self._write_page(resource_key, self._render_page(resource_key, resource))
+        except Exception as e:
+            logger.error(self._format_render_exception(e))  # noqa: TRY400
+            return None
+
+        return page_hash
+
+    def _can_render_pages_in_worker_processes(self) -> bool:
+        # Worker processes cannot see the contents of an in-memory store
+        return bool(self.data_context.root_directory) and not isinstance(
+            self.source_store.store_backend, InMemoryStoreBackend
+        )
+
+    def _build_pages_in_worker_processes(
+        self,
+        resource_keys: list,
+        worker_count: int,
+        force_rebuild: bool,
+    ) -> None:
+        """Render pages in worker processes, writing each one as it is returned.
+
+        Only a few pages per worker are in flight at any time, so memory stays bounded however
+        many pages the section has.
+
+        Workers are always started with the "spawn" method, whatever the platform default is.
+        They get all of their state from the initializer arguments, so none of this process's
+        threads, connections, or locks are inherited as they would be with "fork".  As with any
+        spawned process, a script that builds Data Docs with workers must guard its entry point
+        with 'if __name__ == "__main__":'.
+        """
+        pending_keys = iter(resource_keys)
+        max_pages_in_flight = 2 * worker_count
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=worker_count,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_page_render_worker,
+            initargs=(
+                type(self),
+                str(self.data_context.root_directory),
+                self.data_context.config,
+                self.data_context.runtime_environment,
+                self._worker_config,
+            ),
+        ) as executor:
+            known_page_hashes: Dict[Any, Optional[str]] = {}
+
+            def submit(resource_key) -> concurrent.futures.Future:
+                known_page_hashes[resource_key] = self._get_known_page_hash(
+                    resource_key, force_rebuild
+                )
+                return executor.submit(
+                    _render_page_in_worker, resource_key, known_page_hashes[resource_key]
+                )
+
+            in_flight = {
+                submit(resource_key)
+                for resource_key in itertools.islice(pending_keys, max_pages_in_flight)
+            }
+            while in_flight:
+                done, in_flight = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    resource_key, viewable_content, error_message, page_hash = future.result()
+                    if error_message:
+                        logger.error(error_message)
+                    elif viewable_content is not None:
+                        try:
+                            self._write_page(resource_key, viewable_content)
+                        except Exception as e:
+                            logger.error(self._format_render_exception(e))  # noqa: TRY400
+                            page_hash = None
+                    self._record_page_hash(
+                        resource_key, known_page_hashes.pop(resource_key), page_hash
                     )
-            except Exception as e:
-                exception_message = """\
+                for resource_key in itertools.islice(pending_keys, len(done)):
+                    in_flight.add(submit(resource_key))
+
+    def _get_known_page_hash(self, resource_key, force_rebuild: bool) -> Optional[str]:
+        """Return the hash of the source that the existing page of a resource was rendered from."""
+        if self.cloud_mode or force_rebuild:
+            return None
+        known_page_hash = self.target_store.get_page_hash(resource_key)
+        if known_page_hash is None:
+            return None
+        if not self.target_store.store_backends[type(resource_key)].has_key(
+            resource_key.to_tuple()
+        ):
+            return None
+        return known_page_hash
+
+    def _record_page_hash(
+        self, resource_key, known_page_hash: Optional[str], page_hash: Optional[str]
+    ) -> None:
+        """Persist the hash of a page's source; only pages that were just built are touched."""
+        if self.cloud_mode or page_hash == known_page_hash:
+            return
+        try:
+            if page_hash is None:
+                self.target_store.remove_page_hash(resource_key)
+            else:
+                self.target_store.set_page_hash(resource_key, page_hash)
+        except Exception as e:
+            logger.warning(f"Could not record the data docs page hash of {resource_key!s}: {e!s}")
+
+    def _hash_resource(self, resource) -> str:
+        if hasattr(resource, "to_json_dict"):
+            resource = resource.to_json_dict()
+        serialized_resource = json.dumps(resource, sort_keys=True, default=str)
+        return hashlib.sha256(
+            (self._page_hash_salt + serialized_resource).encode("utf-8")
+        ).hexdigest()
+
+    def _get_resource(self, resource_key):
+        try:
+            resource = self.source_store.get(resource_key)
+            if isinstance(resource_key, ExpectationSuiteIdentifier):
+                resource = ExpectationSuite(**resource)
+        except exceptions.InvalidKeyError:
+            logger.warning(f"Object with Key: {resource_key!s} could not be retrieved. Skipping...")
+            return None
+
+        return resource
+
+    def _render_page(self, resource_key, resource) -> str:
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.name
+            logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = resource_key.expectation_suite_identifier.name
+            if self.name == "profiling":
+                logger.debug(
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
+                )
+            else:
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
+                )
+
+        rendered_content = self.renderer_class.render(resource)
+        return self.view_class.render(
+            rendered_content,
+            data_context_id=self.data_context_id,
+            show_how_to_buttons=self.show_how_to_buttons,
+        )
+
+    def _write_page(self, resource_key, viewable_content: str) -> None:
+        # Verify type
+        self.target_store.set(
+            SiteSectionIdentifier(
+                site_section_name=self.name,
+                resource_identifier=resource_key,
+            ),
+            viewable_content,
+        )
+
+    @staticmethod
+    def _format_render_exception(e: Exception) -> str:
+        exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """  # noqa: E501
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)  # noqa: TRY400
+        exception_traceback = traceback.format_exc()
+        exception_message += (
+            f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+        )
+        return exception_message
+
+
+def _hash_directory_contents(directory: Optional[str]) -> Optional[str]:
+    """Return a hash of the names and contents of the files in a directory, if it exists."""
+    if not directory or not os.path.isdir(directory):  # noqa: PTH112
+        return None
+    directory_hash = hashlib.sha256()
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file_name in sorted(files):
+            file_path = os.path.join(root, file_name)  # noqa: PTH118
+            directory_hash.update(os.path.relpath(file_path, directory).encode("utf-8"))
+            with open(file_path, "rb") as f:
+                directory_hash.update(hashlib.sha256(f.read()).digest())
+    return directory_hash.hexdigest()
+
+
+# The section builder used by a page rendering worker process; see _init_page_render_worker
+_page_render_worker_section_builder: Optional[DefaultSiteSectionBuilder] = None
+
+
+def _init_page_render_worker(
+    section_builder_class: type,
+    context_root_dir: str,
+    project_config: DataContextConfig,
+    runtime_environment: Optional[dict],
+    section_builder_config: dict,
+) -> None:
+    """Recreate a section builder, backed by its own Data Context, in a worker process.
+
+    The Data Context is built from the parent's in-memory project config rather than from the
+    great_expectations.yml on disk, so that unsaved store and site configuration is honored.
+    """
+    global _page_render_worker_section_builder  # noqa: PLW0603
+    # Imported here to avoid a circular import
+    from great_expectations.data_context import get_context
+
+    _page_render_worker_section_builder = section_builder_class(
+        data_context=get_context(
+            project_config=project_config,
+            context_root_dir=context_root_dir,
+            runtime_environment=runtime_environment,
+        ),
+        target_store=None,
+        **section_builder_config,
+    )
+
+
+def _render_page_in_worker(
+    resource_key, known_page_hash: Optional[str]
+) -> Tuple[Any, Optional[str], Optional[str], Optional[str]]:
+    """Render the page for a resource in a worker process, unless its source is unchanged.
+
+    Returns:
+        A tuple of the resource key, the rendered page (None if it was skipped or failed), the
+        message describing a rendering error, if any, and the hash of the page's source.
+    """
+    section_builder = _page_render_worker_section_builder
+    if section_builder is None:
+        raise RuntimeError(  # noqa: TRY003
+            "_render_page_in_worker must run in a process set up by _init_page_render_worker"
+        )
+    resource = section_builder._get_resource(resource_key)
+    if resource is None:
+        return resource_key, None, None, None
+    try:
+        page_hash = section_builder._hash_resource(resource)
+        if page_hash == known_page_hash:
+            return resource_key, None, None, page_hash
+        viewable_content = section_builder._render_page(resource_key, resource)
+    except Exception as e:
+        return resource_key, None, section_builder._format_render_exception(e), None
+
+    return resource_key, viewable_content, None, page_hash
 
 
 class DefaultSiteIndexBuilder:
@@ -708,37 +1011,57 @@ class DefaultSiteIndexBuilder:
 
     # TODO: deprecate dual batch api support
     def build(
-        self, skip_and_clean_missing=True, build_index: bool = True
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        resource_identifiers=None,
     ) -> Tuple[Any, Optional[OrderedDict]]:
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param resource_identifiers: the resources whose pages were just (re)built. If specified and the site has
+        an index manifest, only these resources are added to the index instead of re-listing every store
         :return: tuple(index_page_url, index_links_dict)
         """  # noqa: E501
 
         # Loop over sections in the HtmlStore
         logger.debug("DefaultSiteIndexBuilder.build")
+        manifest = self._load_index_manifest()
         if not build_index:
             logger.debug("Skipping index rendering")
+            if manifest is not None:
+                if resource_identifiers:
+                    self._update_index_manifest(manifest, resource_identifiers)
+                    self._save_index_manifest(manifest)
+                else:
+                    # Pages may have been added for any key; the next index build will reconcile
+                    self.target_store.remove_index_manifest()
             return None, None
 
+        if manifest is None or not resource_identifiers:
+            manifest = self._reconcile_index_manifest(skip_and_clean_missing)
+        else:
+            self._update_index_manifest(manifest, resource_identifiers)
+
         index_links_dict = OrderedDict()
         index_links_dict["site_name"] = self.site_name
 
         if self.show_how_to_buttons:
             index_links_dict["cta_object"] = self.get_calls_to_action()
 
-        self._add_expectations_to_index_links(index_links_dict, skip_and_clean_missing)
-        validation_and_profiling_result_site_keys = (
-            self._build_validation_and_profiling_result_site_keys(skip_and_clean_missing)
+        self._add_expectations_to_index_links(
+            index_links_dict, manifest.sorted_expectation_suite_keys()
         )
+        validation_and_profiling_result_site_keys = list(manifest.validation_result_info)
         self._add_profiling_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, manifest
         )
         self._add_validations_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, manifest
         )
+        if manifest.changed:
+            self._save_index_manifest(manifest)
 
         viewable_content = ""
         try:
@@ -762,14 +1085,76 @@ diagnose and repair the underlying issue.  Detailed information follows:
 
         return self.target_store.write_index_page(viewable_content), index_links_dict
 
-    def _add_expectations_to_index_links(
-        self, index_links_dict: OrderedDict, skip_and_clean_missing: bool
-    ) -> None:
+    def _load_index_manifest(self) -> Optional[_SiteIndexManifest]:
+        try:
+            serialized_manifest = self.target_store.get_index_manifest()
+            if serialized_manifest is None:
+                return None
+            return _SiteIndexManifest.from_json(serialized_manifest)
+        except Exception as e:
+            logger.info(f"Ignoring unreadable data docs index manifest: {e!s}")
+            return None
+
+    def _save_index_manifest(self, manifest: _SiteIndexManifest) -> None:
+        self.target_store.set_index_manifest(manifest.to_json())
+        manifest.changed = False
+
+    def _reconcile_index_manifest(self, skip_and_clean_missing: bool) -> _SiteIndexManifest:
+        """Build a manifest of every page in the site.
+
+        The link info of every result is read again, so a full build also picks up results that
+        were rewritten without their pages being rebuilt incrementally.
+        """
+        manifest = _SiteIndexManifest(
+            expectation_suite_keys=set(
+                self._build_expectation_suite_site_keys(skip_and_clean_missing)
+            ),
+            validation_result_info=dict.fromkeys(
+                self._build_validation_and_profiling_result_site_keys(skip_and_clean_missing)
+            ),
+        )
+        manifest.changed = True
+        return manifest
+
+    def _update_index_manifest(self, manifest: _SiteIndexManifest, resource_identifiers) -> None:
+        """Add the pages rendered for `resource_identifiers` to the manifest."""
+        for resource_identifier in resource_identifiers:
+            if not isinstance(
+                resource_identifier, (ExpectationSuiteIdentifier, ValidationResultIdentifier)
+            ):
+                continue
+            # Match the keys listed from the site, e.g. for results without a run name
+            site_key = type(resource_identifier).from_tuple(resource_identifier.to_tuple())
+
+            if isinstance(site_key, ValidationResultIdentifier):
+                # The result may have been rewritten, so its link info is refreshed
+                if site_key in manifest.validation_result_info:
+                    del manifest.validation_result_info[site_key]
+                    manifest.changed = True
+            elif site_key in manifest.expectation_suite_keys:
+                continue
+
+            if not self.target_store.store_backends[type(site_key)].has_key(site_key.to_tuple()):
+                # No page was rendered for this resource (e.g. it is excluded by a run_name_filter)
+                continue
+
+            if isinstance(site_key, ValidationResultIdentifier):
+                manifest.validation_result_info[site_key] = None
+            else:
+                manifest.expectation_suite_keys.add(site_key)
+            manifest.changed = True
+
+    def _build_expectation_suite_site_keys(
+        self, skip_and_clean_missing: bool
+    ) -> List[ExpectationSuiteIdentifier]:
+        expectation_suite_site_keys: List[ExpectationSuiteIdentifier] = []
         expectations = self.site_section_builders_config.get("expectations", "None")
         if expectations and expectations not in FALSEY_YAML_STRINGS:
-            expectation_suite_source_keys = self.data_context.stores[
-                self.site_section_builders_config["expectations"].get("source_store_name")
-            ].list_keys()
+            expectation_suite_source_keys = set(
+                self.data_context.stores[
+                    self.site_section_builders_config["expectations"].get("source_store_name")
+                ].list_keys()
+            )
             expectation_suite_site_keys = [
                 ExpectationSuiteIdentifier.from_tuple(expectation_suite_tuple)
                 for expectation_suite_tuple in self.target_store.store_backends[
@@ -783,16 +1168,24 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         self.target_store.store_backends[ExpectationSuiteIdentifier].remove_key(
                             expectation_suite_site_key
                         )
+                        self.target_store.remove_page_hash(expectation_suite_site_key)
                     else:
                         cleaned_keys.append(expectation_suite_site_key)
                 expectation_suite_site_keys = cleaned_keys
 
-            for expectation_suite_key in expectation_suite_site_keys:
-                self.add_resource_info_to_index_links_dict(
-                    index_links_dict=index_links_dict,
-                    expectation_suite_name=expectation_suite_key.name,
-                    section_name="expectations",
-                )
+        return expectation_suite_site_keys
+
+    def _add_expectations_to_index_links(
+        self,
+        index_links_dict: OrderedDict,
+        expectation_suite_site_keys: List[ExpectationSuiteIdentifier],
+    ) -> None:
+        for expectation_suite_key in expectation_suite_site_keys:
+            self.add_resource_info_to_index_links_dict(
+                index_links_dict=index_links_dict,
+                expectation_suite_name=expectation_suite_key.name,
+                section_name="expectations",
+            )
 
     def _build_validation_and_profiling_result_site_keys(
         self, skip_and_clean_missing: bool
@@ -829,16 +1222,43 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         self.target_store.store_backends[ValidationResultIdentifier].remove_key(
                             validation_result_site_key
                         )
+                        self.target_store.remove_page_hash(validation_result_site_key)
                     else:
                         cleaned_keys.append(validation_result_site_key)
                 validation_and_profiling_result_site_keys = cleaned_keys
 
         return validation_and_profiling_result_site_keys
 
+    def _get_validation_result_link_info(
+        self,
+        validation_result_key: ValidationResultIdentifier,
+        section_name: str,
+        manifest: _SiteIndexManifest,
+    ) -> dict:
+        """Return the details the index page shows for a result, reading the result only once."""
+        link_info = manifest.validation_result_info.get(validation_result_key)
+        if link_info is None:
+            validation = self.data_context.get_validation_result(
+                batch_identifier=validation_result_key.batch_identifier,
+                expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
+                run_id=validation_result_key.run_id,
+                validation_results_store_name=self.source_stores.get(section_name),
+            )
+            link_info = {
+                "validation_success": validation.success,
+                "asset_name": _resolve_asset_name(validation),
+                "batch_kwargs": validation.meta.get("batch_kwargs", {}),
+                "batch_spec": validation.meta.get("batch_spec", {}),
+            }
+            manifest.validation_result_info[validation_result_key] = link_info
+            manifest.changed = True
+        return link_info
+
     def _add_profiling_to_index_links(
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        manifest: _SiteIndexManifest,
     ) -> None:
         profiling = self.site_section_builders_config.get("profiling", "None")
         if profiling and profiling not in FALSEY_YAML_STRINGS:
@@ -854,16 +1274,10 @@ diagnose and repair the underlying issue.  Detailed information follows:
             ]
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
-                        run_id=profiling_result_key.run_id,
-                        validation_results_store_name=self.source_stores.get("profiling"),
+                    link_info = self._get_validation_result_link_info(
+                        profiling_result_key, "profiling", manifest
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
@@ -872,9 +1286,9 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         run_id=profiling_result_key.run_id,
                         run_time=profiling_result_key.run_id.run_time,
                         run_name=profiling_result_key.run_id.run_name,
-                        asset_name=_resolve_asset_name(validation),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
+                        asset_name=link_info["asset_name"],
+                        batch_kwargs=link_info["batch_kwargs"],
+                        batch_spec=link_info["batch_spec"],
                     )
                 except Exception:
                     error_msg = f"Profiling result not found: {profiling_result_key.to_tuple()!s:s} - skipping"  # noqa: E501
@@ -884,6 +1298,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        manifest: _SiteIndexManifest,
     ) -> None:
         validations = self.site_section_builders_config.get("validations", "None")
         if validations and validations not in FALSEY_YAML_STRINGS:
@@ -908,35 +1323,83 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 ]
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
-                        run_id=validation_result_key.run_id,
-                        validation_results_store_name=self.source_stores.get("validations"),
+                    link_info = self._get_validation_result_link_info(
+                        validation_result_key, "validations", manifest
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
                         section_name="validations",
                         batch_identifier=validation_result_key.batch_identifier,
                         run_id=validation_result_key.run_id,
-                        validation_success=validation_success,
+                        validation_success=link_info["validation_success"],
                         run_time=validation_result_key.run_id.run_time,
                         run_name=validation_result_key.run_id.run_name,
-                        asset_name=_resolve_asset_name(validation),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
+                        asset_name=link_info["asset_name"],
+                        batch_kwargs=link_info["batch_kwargs"],
+                        batch_spec=link_info["batch_spec"],
                     )
                 except Exception:
                     error_msg = f"Validation result not found: {validation_result_key.to_tuple()!s:s} - skipping"  # noqa: E501
                     logger.warning(error_msg)
 
 
+class _SiteIndexManifest:
+    """The pages a data docs index links to, and the details it shows for each result.
+
+    The manifest is persisted next to the index page so that incremental builds only have to add the
+    pages that were just rendered, instead of listing every store and re-reading every result.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        expectation_suite_keys: Set[ExpectationSuiteIdentifier],
+        validation_result_info: Dict[ValidationResultIdentifier, Optional[dict]],
+    ) -> None:
+        self.expectation_suite_keys = expectation_suite_keys
+        # None marks results whose details have not been read yet
+        self.validation_result_info = validation_result_info
+        self.changed = False
+
+    def sorted_expectation_suite_keys(self) -> List[ExpectationSuiteIdentifier]:
+        return sorted(self.expectation_suite_keys, key=lambda key: key.to_tuple())
+
+    def to_json(self) -> str:
+        return json.dumps(
+            convert_to_json_serializable(
+                {
+                    "version": self.VERSION,
+                    "expectation_suites": [
+                        key.to_tuple() for key in self.sorted_expectation_suite_keys()
+                    ],
+                    "validation_results": [
+                        {"key": key.to_tuple(), "info": info}
+                        for key, info in self.validation_result_info.items()
+                    ],
+                }
+            )
+        )
+
+    @classmethod
+    def from_json(cls, serialized_manifest: str) -> Optional[_SiteIndexManifest]:
+        manifest_dict = json.loads(serialized_manifest)
+        if manifest_dict.get("version") != cls.VERSION:
+            return None
+        return cls(
+            expectation_suite_keys={
+                ExpectationSuiteIdentifier.from_tuple(tuple(key))
+                for key in manifest_dict["expectation_suites"]
+            },
+            validation_result_info={
+                ValidationResultIdentifier.from_tuple(tuple(entry["key"])): entry["info"]
+                for entry in manifest_dict["validation_results"]
+            },
+        )
+
+
 def _resolve_asset_name(validation_results: ExpectationValidationResult) -> str | None:
     """
     Resolve the asset name from the validation results meta data.
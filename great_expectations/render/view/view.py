@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import datetime
 import json
+import logging
 import re
+import threading
 from collections import OrderedDict
 from string import Template as pTemplate
-from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Mapping
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterable, Mapping, Optional, Tuple
 from uuid import uuid4
 
 import mistune
 from jinja2 import (
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     PackageLoader,
     select_autoescape,
@@ -34,6 +37,35 @@ from great_expectations.render import (
 if TYPE_CHECKING:
     from jinja2 import BaseLoader
     from jinja2 import Template as jTemplate
+    from jinja2.bccache import Bucket
+
+logger = logging.getLogger(__name__)
+
+
+class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+    """A bytecode cache that falls back to compiling templates when its directory is unusable."""
+
+    @override
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except (OSError, EOFError, ValueError) as e:
+            logger.debug(f"Could not load cached Jinja bytecode: {e!s}")
+
+    @override
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            logger.debug(f"Could not cache Jinja bytecode: {e!s}")
+
+
+def _get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    try:
+        return _BestEffortBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Jinja bytecode caching is disabled: {e!s}")
+        return None
 
 
 class PrettyPrintTemplate:
@@ -61,10 +93,29 @@ class DefaultJinjaView:
 
     _template: ClassVar[str]
 
+    # Jinja environments shared by every view of the same class and loader configuration, so that
+    # each template is only loaded and compiled once per process
+    _environments: ClassVar[Dict[Tuple[type, Optional[str], Optional[str]], Environment]] = {}
+    _environments_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, custom_styles_directory=None, custom_views_directory=None) -> None:
         self.custom_styles_directory = custom_styles_directory
         self.custom_views_directory = custom_views_directory
 
+        environment_key = (type(self), custom_styles_directory, custom_views_directory)
+        with DefaultJinjaView._environments_lock:
+            env = DefaultJinjaView._environments.get(environment_key)
+            if env is None:
+                env = self._create_environment()
+                DefaultJinjaView._environments[environment_key] = env
+        self.env = env
+
+    def _create_environment(self) -> Environment:
+        """Create the Jinja environment shared by views configured like this one.
+
+        Views only hold their loader configuration, so the filters are bound to the view that
+        creates the environment.
+        """
         templates_loader = PackageLoader("great_expectations", "render/view/templates")
         styles_loader = PackageLoader("great_expectations", "render/view/static/styles")
 
@@ -74,27 +125,31 @@ class DefaultJinjaView:
         if self.custom_views_directory:
             loaders.append(FileSystemLoader(self.custom_views_directory))
 
-        self.env = Environment(
+        env = Environment(
             loader=ChoiceLoader(loaders),
             autoescape=select_autoescape(["html", "xml"]),
             extensions=["jinja2.ext.do"],
+            bytecode_cache=_get_bytecode_cache(),
         )
 
-        self.env.filters["render_string_template"] = self.render_string_template
-        self.env.filters["render_styling_from_string_template"] = (
+        env.filters["render_string_template"] = self.render_string_template
+        env.filters["render_styling_from_string_template"] = (
             self.render_styling_from_string_template
         )
-        self.env.filters["render_styling"] = self.render_styling
-        self.env.filters["render_content_block"] = self.render_content_block
-        self.env.filters["render_markdown"] = self.render_markdown
-        self.env.filters["get_html_escaped_json_string_from_dict"] = (
+        env.filters["render_styling"] = self.render_styling
+        env.filters["render_content_block"] = self.render_content_block
+        env.filters["render_markdown"] = self.render_markdown
+        env.filters["get_html_escaped_json_string_from_dict"] = (
             self.get_html_escaped_json_string_from_dict
         )
-        self.env.filters["generate_html_element_uuid"] = self.generate_html_element_uuid
-        self.env.filters["attributes_dict_to_html_string"] = self.attributes_dict_to_html_string
-        self.env.filters["render_bootstrap_table_data"] = self.render_bootstrap_table_data
-        self.env.globals["ge_version"] = ge_version
-        self.env.filters["add_data_context_id_to_url"] = self.add_data_context_id_to_url
+        env.filters["generate_html_element_uuid"] = self.generate_html_element_uuid
+        env.filters["attributes_dict_to_html_string"] = self.attributes_dict_to_html_string
+        env.filters["render_bootstrap_table_data"] = self.render_bootstrap_table_data
+        env.globals["ge_version"] = ge_version
+        env.filters["add_data_context_id_to_url"] = self.add_data_context_id_to_url
+        env.globals["now"] = lambda: datetime.datetime.now(datetime.timezone.utc)
+
+        return env
 
     def render(self, document, template=None, **kwargs):
         self._validate_document(document)
@@ -108,10 +163,7 @@ class DefaultJinjaView:
         return t.render(document, **kwargs)
 
     def _get_template(self, template_str: str) -> jTemplate:
-        template = self.env.get_template(template_str)
-        template.globals["now"] = lambda: datetime.datetime.now(datetime.timezone.utc)
-
-        return template
+        return self.env.get_template(template_str)
 
     @contextfilter  # type: ignore[misc] # untyped 3rd party decorator
     def add_data_context_id_to_url(
@@ -46,6 +46,11 @@ from great_expectations.data_context.data_context.context_factory import set_con
 from great_expectations.data_context.data_context.ephemeral_data_context import (
     EphemeralDataContext,
 )
+from great_expectations.data_context.store.checkpoint_store import CheckpointStore
+from great_expectations.data_context.store.expectations_store import ExpectationsStore
+from great_expectations.data_context.store.validation_definition_store import (
+    ValidationDefinitionStore,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
@@ -1545,3 +1550,44 @@ def test_checkpoint_expectation_parameters(
         batch_parameters={"dataframe": pd.DataFrame({col: [1, 2]})},
     )
     assert results.success
+
+
+@pytest.mark.unit
+def test_checkpoint_run_fetches_each_resource_once(
+    empty_data_context: AbstractDataContext, mocker: MockerFixture
+) -> None:
+    col = "col"
+    name = "checkpoint_testing"
+    asset = empty_data_context.data_sources.add_pandas(name).add_dataframe_asset(name)
+    suite = empty_data_context.suites.add(
+        ExpectationSuite(
+            name="test_suite",
+            expectations=[gxe.ExpectColumnValuesToBeInSet(column=col, value_set=[1, 2])],
+        )
+    )
+    validation_definitions = [
+        empty_data_context.validation_definitions.add(
+            ValidationDefinition(
+                name=f"{name}_{i}",
+                suite=suite,
+                data=asset.add_batch_definition_whole_dataframe(f"{name}_{i}"),
+            )
+        )
+        for i in range(3)
+    ]
+    checkpoint = empty_data_context.checkpoints.add(
+        Checkpoint(name=name, validation_definitions=validation_definitions)
+    )
+
+    expectations_store_get = mocker.spy(ExpectationsStore, "get")
+    validation_definition_store_get = mocker.spy(ValidationDefinitionStore, "get")
+    checkpoint_store_get = mocker.spy(CheckpointStore, "get")
+
+    results = checkpoint.run(batch_parameters={"dataframe": pd.DataFrame({col: [1, 2]})})
+
+    assert results.success
+    # The shared suite is only fetched once; unchanged definitions and the checkpoint itself
+    # are compared against their persisted payloads without being deserialized
+    assert expectations_store_get.call_count == 1
+    assert validation_definition_store_get.call_count == 0
+    assert checkpoint_store_get.call_count == 0
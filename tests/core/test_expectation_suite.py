@@ -22,6 +22,7 @@ from great_expectations.analytics.events import (
 from great_expectations.core.expectation_suite import (
     ExpectationSuite,
 )
+from great_expectations.core.freshness_diagnostics import freshness_cache
 from great_expectations.core.serdes import _IdentifierBundle
 from great_expectations.data_context import AbstractDataContext
 from great_expectations.data_context.data_context.context_factory import set_context
@@ -1258,3 +1259,22 @@ def test_is_fresh_ignores_expectation_ordering(in_memory_runtime_context):
         diagnostics = suite.is_fresh()
 
     assert diagnostics.success is True
+
+
+@pytest.mark.unit
+def test_is_fresh_is_memoized_within_freshness_cache(in_memory_runtime_context):
+    context = in_memory_runtime_context
+
+    suite = context.suites.add(ExpectationSuite(name="my_suite"))
+
+    store_get = context.expectations_store.get
+    with mock.patch.object(ExpectationsStore, "get", wraps=store_get) as mock_get:
+        with freshness_cache():
+            assert suite.is_fresh().success is True
+            assert suite.is_fresh().success is True
+            assert mock_get.call_count == 1
+
+            # Modifying the suite changes its content hash, so freshness is checked again
+            suite.expectations = [gxe.ExpectColumnMeanToBeBetween(column="a")]
+            assert suite.is_fresh().success is False
+            assert mock_get.call_count == 2
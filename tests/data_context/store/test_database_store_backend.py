@@ -215,3 +215,46 @@ def test_database_store_backend_id_initialization(caplog, sa, test_backends):
         expectations_store_with_database_backend.store_backend_id
         == "00000000-0000-0000-0000-000000aaaaaa"
     )
+
+
+@pytest.mark.parametrize("native_upsert", [True, False])
+def test_database_store_backend_set_updates_full_key(sa, native_upsert):
+    # Use sqlite so we don't require postgres for this test.
+    store_backend = DatabaseStoreBackend(
+        credentials={"drivername": "sqlite"},
+        table_name="test_database_store_backend_set_updates_full_key",
+        key_columns=["k1", "k2"],
+    )
+    if not native_upsert:
+        store_backend._upsert_dialect = None
+
+    store_backend.set(("a", "1"), "a1")
+    store_backend.set(("a", "2"), "a2")
+    store_backend.set(("b", "1"), "b1")
+    assert sorted(store_backend.get_all()) == ["a1", "a2", "b1"]
+    assert sorted(store_backend.list_keys(prefix=("a",))) == [("a", "1"), ("a", "2")]
+
+    # Updates only touch the row with the full matching key
+    store_backend.set(("a", "1"), "updated")
+    assert store_backend.get(("a", "1")) == "updated"
+    assert store_backend.get(("a", "2")) == "a2"
+    assert sorted(store_backend.get_all()) == ["a2", "b1", "updated"]
+
+
+def test_database_store_backend_set_without_update(caplog, sa):
+    store_backend = DatabaseStoreBackend(
+        credentials={"drivername": "sqlite"},
+        table_name="test_database_store_backend_set_without_update",
+        key_columns=["k1"],
+    )
+    store_backend.set(("1",), "hello")
+
+    caplog.set_level(logging.INFO, "great_expectations")
+    store_backend.set(("1",), "hello", allow_update=False)
+    assert "already exists with the same value" in caplog.text
+    assert store_backend.get(("1",)) == "hello"
+
+    with pytest.raises(StoreBackendError) as exc:
+        store_backend.set(("1",), "world", allow_update=False)
+
+    assert "Integrity error" in str(exc.value)
@@ -418,6 +418,81 @@ def test_TupleFilesystemStoreBackend_get_all(tmp_path_factory):
     assert sorted(all_values) == [value_a, value_b]
 
 
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_with_key_index(tmp_path_factory, mocker: MockerFixture):
+    project_path = str(tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_with_key_index"))
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="store",
+        filepath_suffix=".json",
+        use_key_index=True,
+    )
+    assert my_store.config["use_key_index"] is True
+
+    my_store.set(("a", "1"), "a1")
+    my_store.set(("a", "2"), "a2")
+    my_store.set(("b", "1"), "b1")
+    my_store.move(("b", "1"), ("c", "1"))
+    my_store.remove_key(("a", "2"))
+
+    walk_keys = mocker.spy(my_store, "_walk_keys")
+
+    assert sorted(my_store.list_keys()) == [("a", "1"), ("c", "1")]
+    assert my_store.list_keys(prefix=("a",)) == [("a", "1")]
+    assert my_store.list_keys(prefix=("b",)) == []
+    # The first listing builds the index; later writes keep it up to date without a rescan
+    my_store.set(("b", "2"), "b2")
+    assert sorted(my_store.list_keys()) == [("a", "1"), ("b", "2"), ("c", "1")]
+    assert walk_keys.call_count == 1
+    assert sorted(my_store.get_all()) == ["a1", "b1", "b2"]
+
+    # The index is shared with other instances of the same store
+    other_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="store",
+        filepath_suffix=".json",
+        use_key_index=True,
+    )
+    assert sorted(other_store.list_keys()) == [("a", "1"), ("b", "2"), ("c", "1")]
+
+
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_key_index_rebuilds_when_stale(tmp_path_factory):
+    project_path = str(tmp_path_factory.mktemp("test_key_index_rebuilds_when_stale"))
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="store",
+        filepath_template="my_file_{0}",
+        use_key_index=True,
+    )
+    my_store.set(("AAA",), "aaa")
+    my_store.set(("BBB",), "bbb")
+
+    def list_keys() -> list:
+        return sorted(
+            key for key in my_store.list_keys() if key != StoreBackend.STORE_BACKEND_ID_KEY
+        )
+
+    assert list_keys() == [("AAA",), ("BBB",)]
+
+    # Files changed behind the backend's back are only picked up once the index is rebuilt
+    os.remove(os.path.join(project_path, "store", "my_file_BBB"))  # noqa: PTH107, PTH118
+    with open(os.path.join(project_path, "store", "my_file_CCC"), "w") as f:  # noqa: PTH118
+        f.write("ccc")
+    assert list_keys() == [("AAA",), ("BBB",)]
+
+    # Failing to read an indexed key invalidates the index, which is rebuilt on the next listing
+    with pytest.raises(InvalidKeyError):
+        my_store.get(("BBB",))
+    assert list_keys() == [("AAA",), ("CCC",)]
+
+    os.remove(os.path.join(project_path, "store", "my_file_CCC"))  # noqa: PTH107, PTH118
+    assert my_store.rebuild_key_index()
+    assert list_keys() == [("AAA",)]
+
+
 @pytest.mark.filesystem
 def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     tmp_path_factory,
@@ -593,6 +668,44 @@ def test_TupleS3StoreBackend_get_all(aws_credentials):
     assert sorted(result) == [val_a, val_b]
 
 
+@mock_s3
+@pytest.mark.aws_deps
+@pytest.mark.parametrize("get_all_max_workers,expected_executor_calls", [(4, 1), (1, 0)])
+def test_TupleS3StoreBackend_get_all_uses_bounded_worker_pool(
+    aws_credentials,
+    mocker: MockerFixture,
+    get_all_max_workers: int,
+    expected_executor_calls: int,
+):
+    bucket = "leakybucket"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}",
+        bucket=bucket,
+        get_all_max_workers=get_all_max_workers,
+    )
+    assert my_store.config["get_all_max_workers"] == get_all_max_workers
+
+    values = [f"value_{i}" for i in range(20)]
+    for value in values:
+        my_store.set((value,), value, content_type="text/html; charset=utf-8")
+
+    from great_expectations.data_context.store import tuple_store_backend
+
+    executor = mocker.spy(tuple_store_backend, "ThreadPoolExecutor")
+
+    result = my_store.get_all()
+
+    assert sorted(result) == sorted(values)
+    assert executor.call_count == expected_executor_calls
+    if expected_executor_calls:
+        executor.assert_called_once_with(max_workers=get_all_max_workers)
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_tuple_s3_store_backend_slash_conditions(aws_credentials):  # noqa: PLR0915
@@ -1238,6 +1351,25 @@ def test_TupleAzureBlobStoreBackend_get_all(mocker: MockerFixture):
         assert sorted(result) == [val_a, val_b]
 
 
+@pytest.mark.unit
+def test_TupleAzureBlobStoreBackend_config_round_trip():
+    my_store = TupleAzureBlobStoreBackend(
+        container="dummy-container",
+        account_url="this_is_a_test_account_url",
+        prefix="this_is_a_test_prefix",
+        get_all_max_workers=3,
+    )
+
+    assert my_store.config["container"] == "dummy-container"
+    assert my_store.config["get_all_max_workers"] == 3
+    config = {
+        key: value
+        for key, value in my_store.config.items()
+        if key not in ("module_name", "class_name")
+    }
+    assert TupleAzureBlobStoreBackend(**config).config == my_store.config
+
+
 @mock_s3
 @pytest.mark.slow  # 14.36s
 @pytest.mark.aws_deps
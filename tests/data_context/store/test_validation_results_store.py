@@ -12,6 +12,7 @@ from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.exceptions import StoreConfigurationError
 from great_expectations.util import gen_directory_tree_str
 from tests import test_utils
 
@@ -263,6 +264,88 @@ def test_ValidationResultsStore_with_TupleFileSystemStoreBackend(tmp_path_factor
     assert my_store.store_backend_id == my_store_duplicate.store_backend_id
 
 
+@pytest.mark.filesystem
+def test_ValidationResultsStore_with_gzip_serialization_format(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_ValidationResultsStore_with_gzip_serialization"))
+    store_backend = {
+        "module_name": "great_expectations.data_context.store",
+        "class_name": "TupleFilesystemStoreBackend",
+        "base_directory": "my_store/",
+    }
+    json_store = ValidationResultsStore(
+        store_backend=dict(store_backend), runtime_environment={"root_directory": path}
+    )
+    gzip_store = ValidationResultsStore(
+        store_backend=dict(store_backend),
+        runtime_environment={"root_directory": path},
+        serialization_format="gzip",
+    )
+    assert gzip_store.config["serialization_format"] == "gzip"
+
+    ns_1 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-100",
+        batch_identifier="batch_id",
+    )
+    ns_2 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-200",
+        batch_identifier="batch_id",
+    )
+    result_1 = ExpectationSuiteValidationResult(
+        success=True, results=[], suite_name="asset.quarantine"
+    )
+    result_2 = ExpectationSuiteValidationResult(
+        success=False, results=[], suite_name="asset.quarantine"
+    )
+    json_store.set(ns_1, result_1)
+    gzip_store.set(ns_2, result_2)
+
+    assert gzip_store.store_backend.get(ns_2.to_tuple()).startswith(
+        ValidationResultsStore.GZIP_PAYLOAD_PREFIX
+    )
+    # Either store reads results written in either format
+    for store in (json_store, gzip_store):
+        assert store.get(ns_1) == result_1
+        assert store.get(ns_2) == result_2
+        assert sorted(r.success for r in store.get_all()) == [False, True]
+
+
+@pytest.mark.filesystem
+def test_ValidationResultsStore_with_gzip_serialization_format_and_own_suffix(tmp_path):
+    gzip_store = ValidationResultsStore(
+        store_backend={
+            "module_name": "great_expectations.data_context.store",
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "my_store/",
+            "filepath_suffix": ".json.gz.b64",
+        },
+        runtime_environment={"root_directory": str(tmp_path)},
+        serialization_format="gzip",
+    )
+    ns = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-100",
+        batch_identifier="batch_id",
+    )
+    result = ExpectationSuiteValidationResult(
+        success=True, results=[], suite_name="asset.quarantine"
+    )
+    gzip_store.set(ns, result)
+
+    assert [path.name for path in (tmp_path / "my_store").rglob("batch_id*")] == [
+        "batch_id.json.gz.b64"
+    ]
+    assert gzip_store.list_keys() == [ns]
+    assert gzip_store.get(ns) == result
+
+
+@pytest.mark.unit
+def test_ValidationResultsStore_rejects_unknown_serialization_format():
+    with pytest.raises(StoreConfigurationError):
+        ValidationResultsStore(serialization_format="pickle")
+
+
 @pytest.mark.filterwarnings(
     "ignore:String run_ids are deprecated*:DeprecationWarning:great_expectations.data_context.types.resource_identifiers"  # noqa: E501
 )
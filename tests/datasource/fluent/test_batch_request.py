@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Final
 
 import pytest
@@ -212,3 +213,17 @@ def test_batch_request_config_partitioner_json_round_trip_serialization(
 
     batch_request_json = batch_request.json()
     assert BatchRequest.parse_raw(batch_request_json) == batch_request
+
+
+@pytest.mark.unit
+def test_batch_request_dict_is_thread_safe() -> None:
+    batch_request = BatchRequest(
+        datasource_name="test-datasource", data_asset_name="test-asset", batch_slice="[1:3]"
+    )
+    expected = batch_request.dict()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: batch_request.dict(), range(2000)))
+
+    assert all(result == expected for result in results)
+    assert "batch_slice" not in BatchRequest.__fields__
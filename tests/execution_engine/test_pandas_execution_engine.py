@@ -1,4 +1,6 @@
+import gc
 import os
+import weakref
 from typing import Dict, Tuple
 from unittest import mock
 
@@ -360,6 +362,62 @@ def test_get_compute_domain_with_unmeetable_row_condition():
     assert accessor_kwargs == {"column": "a"}, "Accessor kwargs have been modified"
 
 
+@pytest.mark.unit
+def test_column_null_statistics_are_computed_once_per_batch(mocker):
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, None, 3, None], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    get_domain_records = mocker.spy(engine, "get_domain_records")
+
+    assert engine.get_column_null_counts(domain_kwargs={"column": "a"}).to_dict() == {
+        "a": 2,
+        "b": 1,
+    }
+    assert engine.get_column_null_counts(domain_kwargs={"column": "b"}).to_dict() == {
+        "a": 2,
+        "b": 1,
+    }
+    assert engine.get_column_null_mask(domain_kwargs={"column": "a"}).tolist() == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert engine.get_column_null_mask(domain_kwargs={"column": "a"}).tolist() == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert get_domain_records.call_count == 2
+
+    # Statistics follow the row_condition and any Batch reloaded under the same batch_id
+    assert engine.get_column_null_mask(
+        domain_kwargs={"column": "a", "row_condition": "b > 2", "condition_parser": "pandas"}
+    ).tolist() == [True, False]
+    engine.load_batch_data(batch_data=df.fillna(0), batch_id="1234")
+    assert engine.get_column_null_counts(domain_kwargs={"column": "a"}).to_dict() == {
+        "a": 0,
+        "b": 0,
+    }
+
+
+@pytest.mark.unit
+def test_column_null_statistics_are_released_with_their_batch():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, None, 3, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    assert engine.get_column_null_counts(domain_kwargs={"column": "a"}).to_dict() == {"a": 2}
+
+    # The engine keeps no reference to the DataFrame of a Batch that has been replaced
+    df_ref = weakref.ref(df)
+    del df
+    engine.load_batch_data(batch_data=pd.DataFrame({"a": [1]}), batch_id="1234")
+    gc.collect()
+    assert df_ref() is None
+    assert engine.get_column_null_counts(domain_kwargs={"column": "a"}).to_dict() == {"a": 0}
+
+
 # Just checking that the Pandas Execution Engine can perform these in sequence
 @pytest.mark.unit
 def test_resolve_metric_bundle():
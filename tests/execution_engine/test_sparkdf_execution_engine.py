@@ -13,6 +13,7 @@ from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSp
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
 from great_expectations.execution_engine import SparkDFExecutionEngine
+from great_expectations.execution_engine.execution_engine import MetricComputationConfiguration
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -1089,6 +1090,64 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(
         assert False, str(e)
 
 
+def test_resolve_metric_bundle_computes_batches_in_a_single_job(caplog, spark_session):
+    pd_df = pd.DataFrame(
+        {"day": ["mon", "mon", "tue", "wed", "wed", "wed"], "x": [1, 3, 5, 2, 4, 9]}
+    )
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session, df=pd_df, batch_id="all"
+    )
+    df: pyspark.DataFrame = engine.dataframe
+    days = ["mon", "tue", "wed", "thu"]
+    for day in days:
+        engine.load_batch_data(batch_id=day, batch_data=df.filter(F.col("day") == day))
+
+    def build_metric_fn_bundle(batch_ids):
+        return [
+            MetricComputationConfiguration(
+                metric_configuration=MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs={"batch_id": batch_id, "column": "x"},
+                    metric_value_kwargs=None,
+                ),
+                metric_fn=metric_fn,
+                metric_provider_kwargs={},
+                compute_domain_kwargs={"batch_id": batch_id},
+                accessor_domain_kwargs={"column": "x"},
+            )
+            for batch_id in batch_ids
+            for metric_name, metric_fn in [
+                ("column.max", F.max(F.col("x"))),
+                ("column_values.nonnull.count", F.count(F.col("x"))),
+            ]
+        ]
+
+    separately_resolved_metrics = {}
+    for day in days:
+        separately_resolved_metrics.update(
+            engine.resolve_metric_bundle(metric_fn_bundle=build_metric_fn_bundle([day]))
+        )
+
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    metric_fn_bundle = build_metric_fn_bundle(days)
+    results = engine.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
+
+    assert results == separately_resolved_metrics
+    assert [
+        results[metric_computation_configuration.metric_configuration.id]
+        for metric_computation_configuration in metric_fn_bundle
+    ] == [3, 2, 5, 1, 9, 3, None, 0]
+
+    # The three non-empty Batches are computed together; the empty one falls back
+    assert any(
+        record.message == "SparkDFExecutionEngine computed metrics for 3 Batches in a single job"
+        for record in caplog.records
+    )
+    assert (
+        sum("computed 2 metrics on domain_id" in record.message for record in caplog.records) == 1
+    )
+
+
 # Making sure dataframe property is functional
 def test_dataframe_property_given_loaded_batch(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
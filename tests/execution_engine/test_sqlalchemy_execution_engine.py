@@ -10,10 +10,12 @@ from great_expectations.compatibility.sqlalchemy import Connection
 from great_expectations.compatibility.sqlalchemy_compatibility_wrappers import (
     add_dataframe_to_db,
 )
+from great_expectations.core.batch import Batch, LegacyBatchDefinition
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
     SqlAlchemyDatasourceBatchSpec,
 )
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypes,
@@ -21,6 +23,9 @@ from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -1011,6 +1016,198 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(sa)
         assert False, str(e)
 
 
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_computes_table_partitions_in_a_single_query(caplog, sa):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"day": ["mon", "mon", "tue", "wed", "wed", "wed"], "x": [1, 3, 5, 2, 4, 9]}),
+        sa,
+    )
+
+    batches = []
+    for day in ["mon", "tue", "wed", "thu"]:
+        batch_spec = SqlAlchemyDatasourceBatchSpec(
+            table_name="test",
+            partitioner_method="partition_on_column_value",
+            partitioner_kwargs={"column_name": "day"},
+            batch_identifiers={"day": day},
+            create_temp_table=False,
+        )
+        batch_data, _ = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
+        batches.append(
+            Batch(
+                data=batch_data,
+                batch_spec=batch_spec,
+                batch_definition=LegacyBatchDefinition(
+                    datasource_name="my_datasource",
+                    data_connector_name="my_data_connector",
+                    data_asset_name="test",
+                    batch_identifiers=IDDict({"day": day}),
+                ),
+            )
+        )
+    execution_engine.batch_manager.load_batch_list(batch_list=batches)
+
+    metric_fn_bundle = []
+    for batch in batches:
+        for metric_name, metric_fn in [
+            ("column.max", sa.func.max(sa.column("x"))),
+            ("column_values.nonnull.count", sa.func.count(sa.column("x"))),
+        ]:
+            metric_fn_bundle.append(
+                MetricComputationConfiguration(
+                    metric_configuration=MetricConfiguration(
+                        metric_name=metric_name,
+                        metric_domain_kwargs={"batch_id": batch.id, "column": "x"},
+                        metric_value_kwargs=None,
+                    ),
+                    metric_fn=metric_fn,
+                    metric_provider_kwargs={},
+                    compute_domain_kwargs={"batch_id": batch.id},
+                    accessor_domain_kwargs={"column": "x"},
+                )
+            )
+
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = execution_engine.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
+
+    assert [
+        results[metric_computation_configuration.metric_configuration.id]
+        for metric_computation_configuration in metric_fn_bundle
+    ] == [3, 2, 5, 1, 9, 3, None, 0]
+
+    # The three non-empty partitions are computed together; the empty one falls back
+    assert any(
+        record.message
+        == 'SqlAlchemyExecutionEngine computed metrics for 3 partitions of table "test" in a single query'  # noqa: E501
+        for record in caplog.records
+    )
+    assert (
+        sum("computed 2 metrics on domain_id" in record.message for record in caplog.records) == 1
+    )
+
+
+@pytest.mark.sqlite
+def test_value_set_tables_are_recreated_on_a_new_connection(sa):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2]}), sa)
+    engine._value_set_join_threshold = 2
+    value_set = [1, 2, 3]
+
+    def get_values(selectable):
+        return sorted(row[0] for row in engine.execute_query(selectable).fetchall())
+
+    selectable = engine.get_value_set_selectable(value_set=value_set, column_type=sa.Integer())
+    assert get_values(selectable) == value_set
+    assert engine.get_value_set_selectable(value_set=value_set, column_type=sa.Integer()).compare(
+        selectable
+    )
+
+    # The temporary tables are dropped with the connection that created them
+    engine._connection.close()
+    engine._connection = None
+
+    selectable = engine.get_value_set_selectable(value_set=value_set, column_type=sa.Integer())
+    assert get_values(selectable) == value_set
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "dialect_name", [GXSqlDialect.POSTGRESQL, GXSqlDialect.REDSHIFT, GXSqlDialect.SNOWFLAKE]
+)
+def test_value_set_tables_keep_their_connection_on_pooled_connection_dialects(
+    mocker, sa, tmp_path, dialect_name
+):
+    # Like those of these dialects, the temporary tables of a file-based SQLite database are only
+    # visible to the connection that created them; without pooling, every query gets a new one.
+    engine = SqlAlchemyExecutionEngine(
+        engine=sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}", poolclass=sa.pool.NullPool)
+    )
+    engine._value_set_join_threshold = 2
+    mocker.patch.object(engine.engine.dialect, "name", dialect_name.value)
+    value_set = [1, 2, 3]
+
+    def get_values(selectable):
+        return sorted(row[0] for row in engine.execute_query(selectable).fetchall())
+
+    selectable = engine.get_value_set_selectable(value_set=value_set, column_type=sa.Integer())
+    assert get_values(selectable) == value_set
+
+    # A failed query does not leave the kept connection unusable
+    with pytest.raises(sa.exc.OperationalError):
+        engine.execute_query(sa.text("SELECT * FROM missing_table"))
+    assert get_values(selectable) == value_set
+
+    # Queries return to pooled connections once the value set tables are gone
+    engine.close()
+    assert engine._connection is None
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize("dialect_name", [GXSqlDialect.MYSQL, GXSqlDialect.BIGQUERY])
+def test_value_sets_are_inlined_for_other_dialects(mocker, sa, dialect_name):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2]}), sa)
+    engine._value_set_join_threshold = 2
+    mocker.patch.object(engine.engine.dialect, "name", dialect_name.value)
+
+    assert engine.get_value_set_selectable(value_set=[1, 2, 3], column_type=sa.Integer()) is None
+
+
+@pytest.mark.sqlite
+def test_column_metadata_is_reflected_once_per_table(mocker, sa):
+    from great_expectations.expectations.metrics import util as metrics_util
+
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}), sa)
+    reflect = mocker.spy(metrics_util, "_reflect_sqlalchemy_column_metadata")
+
+    def get_column_names():
+        columns = metrics_util.get_sqlalchemy_column_metadata(
+            execution_engine=engine, table_selectable="test"
+        )
+        return [column["name"] for column in columns]
+
+    assert get_column_names() == ["a", "b"]
+    assert get_column_names() == ["a", "b"]
+    assert reflect.call_count == 1
+
+    # The schema changes, and the cached columns are invalidated
+    add_dataframe_to_db(
+        df=pd.DataFrame({"c": [1]}),
+        name="test",
+        con=engine.engine,
+        if_exists="replace",
+        index=False,
+    )
+    engine.invalidate_schema_cache(table_name="test")
+    assert get_column_names() == ["c"]
+    assert reflect.call_count == 2
+
+    # Expired columns are reflected again
+    mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine.time.monotonic",
+        return_value=float("inf"),
+    )
+    assert get_column_names() == ["c"]
+    assert reflect.call_count == 3
+
+
+@pytest.mark.sqlite
+def test_expired_column_metadata_is_pruned(mocker, sa):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2]}), sa)
+    monotonic = mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine.time.monotonic",
+        return_value=0.0,
+    )
+    columns = [{"name": "a"}]
+
+    engine.cache_column_metadata(table_selectable="gx_temp_1", columns=columns)
+    monotonic.return_value = engine._schema_cache_ttl_seconds / 2
+    engine.cache_column_metadata(table_selectable="gx_temp_2", columns=columns)
+
+    # Only the expired entry is dropped, even though it is never looked up again
+    monotonic.return_value = engine._schema_cache_ttl_seconds
+    engine.cache_column_metadata(table_selectable="test", columns=columns)
+    assert set(engine._schema_cache) == {(None, "gx_temp_2"), (None, "test")}
+
+
 @pytest.mark.sqlite
 def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
@@ -1081,6 +1278,7 @@ def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     )
     desired_metric.metric_dependencies = {
         "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
     }
     # noinspection PyUnusedLocal
     results = execution_engine.resolve_metrics(
@@ -19,6 +19,7 @@ from great_expectations.expectations.metrics import (
 )
 from great_expectations.expectations.metrics.map_metric_provider.column_map_condition_auxilliary_methods import (  # noqa: E501
     _spark_column_map_condition_values,
+    _sqlalchemy_column_map_condition_value_counts,
     _sqlalchemy_column_map_condition_values,
 )
 from great_expectations.validator.metric_configuration import MetricConfiguration
@@ -207,6 +208,57 @@ def test_sqlalchemy_column_map_condition_values(
     assert res == expected_result
 
 
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "result_format, expected_result",
+    [
+        ("SUMMARY", [(0.8, 2)]),
+        ("COMPLETE", [(0.8, 2), (1.0, 1), (1.1, 1), (2.5, 1)]),
+    ],
+)
+def test_sqlalchemy_column_map_condition_value_counts(
+    sql_execution_engine_with_mini_taxi_table_name, result_format, expected_result
+):
+    execution_engine = sql_execution_engine_with_mini_taxi_table_name
+    metric_domain_kwargs = {"column": "trip_distance"}
+    metric_value_kwargs = {
+        "min_value": 0,
+        "max_value": 0.5,
+        "strict_min": False,
+        "strict_max": False,
+        "result_format": {
+            "result_format": result_format,
+            "partial_unexpected_count": 1,
+            "include_unexpected_rows": False,
+        },
+    }
+
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.between.condition",
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+    )
+    table_columns_metric, table_column_metrics_results = get_table_columns_metric(
+        execution_engine=execution_engine
+    )
+    desired_metric.metric_dependencies = {"table.columns": table_columns_metric}
+
+    results = execution_engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    metrics = {
+        "unexpected_condition": results[desired_metric.id],
+        "table.columns": table_column_metrics_results[table_columns_metric.id],
+    }
+    res = _sqlalchemy_column_map_condition_value_counts(
+        cls=MapMetricProvider(),
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+    )
+    # Only the most frequent unexpected values are fetched for partial result formats
+    assert sorted(tuple(row) for row in res) == expected_result
+
+
 @pytest.mark.spark
 @pytest.mark.parametrize(
     "execution_engine_fixture_name, metric_domain_kwargs, expected_result",
@@ -0,0 +1,94 @@
+import datetime
+from typing import Any, List, Optional
+
+import pandas as pd
+import pytest
+
+from great_expectations.expectations.metrics import ColumnValuesBetween
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values,min_value,max_value,expected_result",
+    [
+        pytest.param(["a", "c", "e"], "b", "d", [False, True, False], id="string"),
+        pytest.param(
+            [
+                datetime.datetime(2024, month, 1, tzinfo=datetime.timezone.utc)
+                for month in (1, 6, 12)
+            ],
+            datetime.datetime(2024, 2, 1, tzinfo=datetime.timezone.utc),
+            None,
+            [False, True, True],
+            id="datetime",
+        ),
+        pytest.param(
+            [datetime.date(2024, month, 1) for month in (1, 6, 12)],
+            None,
+            datetime.date(2024, 6, 1),
+            [True, True, False],
+            id="date",
+        ),
+        pytest.param([1, 2.5, 10], 2, 10, [False, True, True], id="numeric"),
+    ],
+)
+def test_pandas_object_vectorized(
+    values: List[Any], min_value: Any, max_value: Any, expected_result: List[bool]
+):
+    column = pd.Series(values, dtype=object, index=range(10, 10 + len(values)))
+
+    result = ColumnValuesBetween._pandas_object_vectorized(
+        column, min_value, max_value, strict_min=False, strict_max=False
+    )
+
+    assert result is not None
+    assert result.tolist() == expected_result
+    assert result.index.tolist() == column.index.tolist()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values,min_value,max_value",
+    [
+        pytest.param(["a", 1], 0, 2, id="mixed_values"),
+        pytest.param(["a", 1], "a", "b", id="mixed_values_string_bounds"),
+        pytest.param(["a", None], "a", "b", id="missing_values"),
+        pytest.param([], "a", "b", id="empty"),
+    ],
+)
+def test_pandas_object_vectorized_falls_back_to_row_by_row(
+    values: List[Any], min_value: Any, max_value: Optional[Any]
+):
+    column = pd.Series(values, dtype=object)
+
+    assert (
+        ColumnValuesBetween._pandas_object_vectorized(
+            column, min_value, max_value, strict_min=False, strict_max=False
+        )
+        is None
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values,min_value,max_value",
+    [
+        pytest.param(["a", "b"], 0, 2, id="string_values"),
+        pytest.param([1, 2], "a", "b", id="string_bounds"),
+        pytest.param(
+            [datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)],
+            datetime.date(2024, 1, 1),
+            None,
+            id="datetime_date_bounds",
+        ),
+    ],
+)
+def test_pandas_object_vectorized_raises_on_mismatched_types(
+    values: List[Any], min_value: Any, max_value: Any
+):
+    column = pd.Series(values, dtype=object)
+
+    with pytest.raises(TypeError):
+        ColumnValuesBetween._pandas_object_vectorized(
+            column, min_value, max_value, strict_min=False, strict_max=False
+        )
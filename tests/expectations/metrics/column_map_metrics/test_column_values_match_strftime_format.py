@@ -0,0 +1,65 @@
+import warnings
+from typing import List
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+    SummarizationMetricNameSuffixes,
+)
+from great_expectations.self_check.util import build_pandas_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+
+def _get_unexpected_count(values: List[str], strftime_format: str) -> int:
+    engine = build_pandas_engine(pd.DataFrame({"a": values}))
+
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+
+    condition_metric = MetricConfiguration(
+        metric_name=f"column_values.match_strftime_format.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"strftime_format": strftime_format},
+    )
+    condition_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    metrics.update(engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics))
+
+    unexpected_count_metric = MetricConfiguration(
+        metric_name=f"column_values.match_strftime_format.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"strftime_format": strftime_format},
+    )
+    unexpected_count_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
+    return results[unexpected_count_metric.id]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values,strftime_format,expected_unexpected_count",
+    [
+        pytest.param(["2020-01-01", "2020-13-01"], "%Y-%m-%d", 1, id="invalid_date"),
+        pytest.param(["now", "today", "2020-01-01"], "%Y-%m-%d", 2, id="pandas_literals"),
+        pytest.param(
+            ["2020-01-01 00:00:00+0100", "2020-01-01 00:00:00+0200", "2020-01-01"],
+            "%Y-%m-%d %H:%M:%S%z",
+            1,
+            id="mixed_offsets",
+        ),
+        pytest.param(["00:00:00.123456", "00:00:00.1234567"], "%H:%M:%S.%f", 1, id="nanoseconds"),
+    ],
+)
+def test_pandas_matches_strptime(
+    values: List[str], strftime_format: str, expected_unexpected_count: int
+):
+    with warnings.catch_warnings():
+        # e.g., pandas warns about parsing mixed "%z" offsets without "utc=True".
+        warnings.simplefilter("error", category=FutureWarning)
+        assert _get_unexpected_count(values, strftime_format) == expected_unexpected_count
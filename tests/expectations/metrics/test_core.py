@@ -2,6 +2,7 @@ import copy
 import datetime
 import logging
 from decimal import Decimal
+from types import SimpleNamespace
 from typing import Dict, Tuple, Union
 
 import numpy as np
@@ -23,10 +24,12 @@ from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics import column_histogram
 from great_expectations.expectations.metrics.util import (
     get_dbms_compatible_column_names,
 )
@@ -40,6 +43,7 @@ from great_expectations.util import isclose
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from tests.expectations.test_util import get_table_columns_metric
+from tests.test_utils import get_sqlite_temp_table_names
 
 
 @pytest.mark.unit
@@ -934,6 +938,80 @@ def test_column_histogram_metric_sa(sa):
     assert results == {desired_metric.id: [10]}
 
 
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "bins,expected_histogram",
+    [
+        pytest.param([2.0, 4.0, 6.0], [2, 3], id="finite_edges_exclude_out_of_range_values"),
+        pytest.param([-np.inf, 2.0, 4.0, np.inf], [3, 2, 5], id="infinite_edges"),
+        pytest.param([0.0, 3.0, 3.0, 9.0], [3, 0, 6], id="duplicate_edges"),
+        pytest.param([10.0, 20.0, 30.0], [0, 0], id="no_values_in_range"),
+        pytest.param(
+            np.linspace(-1.5, 8.5, 3001).tolist(),
+            np.histogram([-1, 0, 1, 2, 3, 4, 5, 6, 7, 8], np.linspace(-1.5, 8.5, 3001))[0].tolist(),
+            id="more_edges_than_case_nesting_allows_to_search",
+        ),
+    ],
+)
+def test_column_histogram_metric_sa_bin_edges(sa, bins, expected_histogram):
+    engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [-1, 0, 1, 2, 3, 4, 5, 6, 7, 8, None]}),
+        sa,
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.histogram",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "bins": bins,
+        },
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    assert results == {desired_metric.id: expected_histogram}
+
+
+@pytest.mark.unit
+def test_column_histogram_bin_index_case_nesting_is_bounded(sa):
+    def get_case_depth(element) -> int:
+        child_depth = max((get_case_depth(child) for child in element.get_children()), default=0)
+        return child_depth + isinstance(element, sa.sql.elements.Case)
+
+    bin_index = column_histogram._get_sqlalchemy_bin_index(
+        column=sa.column("a"),
+        interior_edges=[float(edge) for edge in range(3000)],
+        dialect_name=GXSqlDialect.MSSQL,
+    )
+
+    assert get_case_depth(bin_index) == column_histogram.MAX_BIN_INDEX_CASE_DEPTH
+
+
+@pytest.mark.unit
+def test_column_histogram_bin_index_uses_width_bucket_on_postgresql(sa):
+    from sqlalchemy.dialects import postgresql
+
+    bin_index = column_histogram._get_sqlalchemy_bin_index(
+        column=sa.column("a"),
+        interior_edges=[1.0, 2.5, 4.0],
+        dialect_name=GXSqlDialect.POSTGRESQL,
+    )
+
+    assert (
+        str(bin_index.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        == "width_bucket(CAST(a AS FLOAT), CAST(ARRAY[1.0, 2.5, 4.0] AS FLOAT[]))"
+    )
+
+
 @pytest.mark.spark
 def test_column_histogram_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -1823,6 +1901,79 @@ def test_map_value_set_sa(sa):
     assert results == {desired_metric.id: 0}
 
 
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "condition_metric_name,value_set,expected_unexpected_count",
+    [
+        pytest.param("column_values.in_set", list(range(1, 11)), 0, id="in_set"),
+        pytest.param("column_values.in_set", list(range(2, 12)), 1, id="in_set_partial"),
+        pytest.param("column_values.not_in_set", list(range(3, 13)), 2, id="not_in_set"),
+    ],
+)
+def test_map_large_value_set_sa_uses_temp_table(
+    sa, condition_metric_name, value_set, expected_unexpected_count
+):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 3, 3, None]}), sa)
+    engine._value_set_join_threshold = 5
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    table_column_types = MetricConfiguration(
+        metric_name="table.column_types",
+        metric_domain_kwargs={},
+        metric_value_kwargs={
+            "include_nested": True,
+        },
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(table_column_types,), metrics=metrics)
+    metrics.update(results)
+
+    temp_table_names_before = get_sqlite_temp_table_names(engine)
+
+    condition_metric = MetricConfiguration(
+        metric_name=f"{condition_metric_name}.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": value_set},
+    )
+    condition_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+        "table.column_types": table_column_types,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
+    metrics.update(results)
+
+    aggregate_partial = MetricConfiguration(
+        metric_name=f"{condition_metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": value_set},
+    )
+    aggregate_partial.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_partial,), metrics=metrics)
+    metrics.update(results)
+
+    unexpected_count_metric = MetricConfiguration(
+        metric_name=f"{condition_metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": value_set},
+    )
+    unexpected_count_metric.metric_dependencies = {
+        "metric_partial_fn": aggregate_partial,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
+    assert results == {unexpected_count_metric.id: expected_unexpected_count}
+
+    # The value set was loaded into a single temporary table rather than inlined as literals
+    assert len(get_sqlite_temp_table_names(engine) - temp_table_names_before) == 1
+
+
 @pytest.mark.sqlite
 def test_map_of_type_sa(sa):
     eng = sa.create_engine("sqlite://")
@@ -4572,6 +4723,75 @@ def test_distinct_metric_pd():
     assert metrics[column_distinct_values_count_threshold_metric.id] is True
 
 
+@pytest.mark.big
+def test_approximate_distinct_count_metric_pd():
+    engine = build_pandas_engine(pd.DataFrame({"a": [1, 2, 1, 2, 3, 3, None]}))
+    large_engine = build_pandas_engine(
+        pd.DataFrame({"b": [f"value_{i % 20000}" for i in range(50000)]})
+    )
+
+    for execution_engine, column_name, expected_count in [
+        (engine, "a", 3),
+        (large_engine, "b", 20000),
+    ]:
+        metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        table_columns_metric, results = get_table_columns_metric(execution_engine=execution_engine)
+        metrics.update(results)
+
+        column_distinct_values_count_approx_metric = MetricConfiguration(
+            metric_name="column.distinct_values.count.approx",
+            metric_domain_kwargs={"column": column_name},
+            metric_value_kwargs=None,
+        )
+        column_distinct_values_count_approx_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+
+        results = execution_engine.resolve_metrics(
+            metrics_to_resolve=(column_distinct_values_count_approx_metric,), metrics=metrics
+        )
+        assert results[column_distinct_values_count_approx_metric.id] == pytest.approx(
+            expected_count, rel=0.03
+        )
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize("dialect_name", ["sqlite", "duckdb"])
+def test_approximate_distinct_count_metric_sa(sa, mocker, dialect_name):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 1, 2, 3, 3, None]}), sa)
+    # Dialects without a native approximate distinct count, including ones GX does not know of,
+    # compute the exact count.
+    mocker.patch.object(engine.engine.dialect, "name", dialect_name)
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    aggregate_fn_metric = MetricConfiguration(
+        metric_name=f"column.distinct_values.count.approx.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,), metrics=metrics)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.distinct_values.count.approx",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    desired_metric.metric_dependencies = {
+        "metric_partial_fn": aggregate_fn_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=results)
+
+    assert results == {desired_metric.id: 3}
+
+
 @pytest.mark.big
 def test_batch_aggregate_metrics_pd():
     import datetime
@@ -5914,6 +6134,98 @@ def test_map_compound_columns_unique_sa(sa):  # noqa: PLR0915
     assert metrics[unexpected_values_metric.id] == [{"a": 1, "c": 2}, {"a": 1, "c": 2}]
 
 
+@pytest.mark.sqlite
+def test_map_compound_columns_unique_sa_unexpected_count_skips_null_keys(sa):
+    engine = build_sa_execution_engine(
+        pd.DataFrame(data={"a": [0, 0, 1, 1, None, None], "b": [1, 1, 2, 3, 4, 4]}),
+        sa,
+    )
+
+    table_columns_metric: MetricConfiguration
+    metrics: dict
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+
+    prerequisite_function_metric = MetricConfiguration(
+        metric_name=f"compound_columns.count.{MetricPartialFunctionTypeSuffixes.MAP.value}",
+        metric_domain_kwargs={"column_list": ["a", "b"]},
+        metric_value_kwargs=None,
+    )
+    prerequisite_function_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(prerequisite_function_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
+    condition_metric = MetricConfiguration(
+        metric_name=f"compound_columns.unique.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+        metric_domain_kwargs={"column_list": ["a", "b"]},
+        metric_value_kwargs=None,
+    )
+    condition_metric.metric_dependencies = {
+        f"compound_columns.count.{MetricPartialFunctionTypeSuffixes.MAP.value}": prerequisite_function_metric,  # noqa: E501
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
+    metrics.update(results)
+
+    unexpected_count_metric = MetricConfiguration(
+        metric_name=f"compound_columns.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+        metric_domain_kwargs={"column_list": ["a", "b"]},
+        metric_value_kwargs=None,
+    )
+    unexpected_rows_metric = MetricConfiguration(
+        metric_name=f"compound_columns.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}",
+        metric_domain_kwargs={"column_list": ["a", "b"]},
+        metric_value_kwargs={"result_format": {"result_format": "COMPLETE"}},
+    )
+    for metric in (unexpected_count_metric, unexpected_rows_metric):
+        metric.metric_dependencies = {
+            "unexpected_condition": condition_metric,
+            "table.columns": table_columns_metric,
+        }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_metric, unexpected_rows_metric), metrics=metrics
+    )
+
+    # The duplicated (None, 4) key is ignored by both the aggregated count and the unexpected rows.
+    assert results[unexpected_count_metric.id] == 2
+    assert len(results[unexpected_rows_metric.id]) == 2
+
+
+@pytest.mark.sqlite
+def test_map_compound_columns_count_sa_mysql_skips_null_keys(sa):
+    engine = build_sa_execution_engine(
+        pd.DataFrame(data={"a": [0, 0, 1, 1, None, None], "b": [1, 1, 2, 3, 4, 4]}),
+        sa,
+    )
+    # The MySQL "map" counts rows with a window function, which SQLite supports as well.
+    engine.dialect_module = SimpleNamespace(name="mysql")
+
+    table_columns_metric: MetricConfiguration
+    metrics: dict
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+
+    map_metric = MetricConfiguration(
+        metric_name=f"compound_columns.count.{MetricPartialFunctionTypeSuffixes.MAP.value}",
+        metric_domain_kwargs={"column_list": ["a", "b"]},
+        metric_value_kwargs=None,
+    )
+    map_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(map_metric,), metrics=metrics)
+
+    compound_columns_count_query, _, _ = results[map_metric.id]
+    rows = engine.execute_query(
+        sa.select(compound_columns_count_query).order_by(sa.column("b"))
+    ).fetchall()
+
+    # The duplicated (None, 4) key is not counted, just as it is not by the aggregated count.
+    assert [row._num_rows for row in rows] == [2, 2, 1, 1, None, None]
+
+
 @pytest.mark.spark
 def test_map_compound_columns_unique_spark(spark_session):  # noqa: PLR0915
     engine: SparkDFExecutionEngine = build_spark_engine(
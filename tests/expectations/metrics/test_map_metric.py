@@ -30,6 +30,7 @@ from great_expectations.expectations.expectation_configuration import (
 from great_expectations.expectations.metrics import (
     ColumnMax,
     ColumnValuesNonNull,
+    ColumnValuesUnique,
     CompoundColumnsUnique,
 )
 from great_expectations.expectations.metrics.map_metric_provider import (
@@ -232,6 +233,36 @@ def test_get_table_metric_provider_metric_dependencies(empty_sqlite_db):
     )
 
 
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "metric_provider,metric_name,metric_domain_kwargs",
+    [
+        pytest.param(ColumnValuesUnique, "column_values.unique", {"column": "a"}, id="column"),
+        pytest.param(
+            CompoundColumnsUnique,
+            "compound_columns.unique",
+            {"column_list": ["a", "b"]},
+            id="compound_columns",
+        ),
+    ],
+)
+def test_get_unexpected_count_value_provider_metric_dependencies(
+    empty_sqlite_db, metric_provider, metric_name, metric_domain_kwargs
+):
+    metric = MetricConfiguration(
+        metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=None,
+    )
+    dependencies = metric_provider().get_evaluation_dependencies(
+        metric, execution_engine=SqlAlchemyExecutionEngine(engine=empty_sqlite_db)
+    )
+
+    # The unexpected rows are counted without evaluating the row-wise condition
+    assert "unexpected_condition" not in dependencies
+    assert dependencies["table.columns"].id[0] == "table.columns"
+
+
 @pytest.mark.spark
 def test_get_aggregate_count_aware_metric_dependencies(basic_spark_df_execution_engine):
     mp = ColumnValuesNonNull()
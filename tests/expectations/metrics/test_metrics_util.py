@@ -16,9 +16,14 @@ from great_expectations.exceptions import MetricResolutionError
 from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 from great_expectations.expectations.metrics.util import (
     CaseInsensitiveString,
+    combine_regex_list,
+    compute_unexpected_pandas_indices,
     get_dbms_compatible_metric_domain_kwargs,
     get_unexpected_indices_for_multiple_pandas_named_indices,
     get_unexpected_indices_for_single_pandas_named_index,
+    json_loads,
+    map_pandas_distinct_values,
+    match_pandas_regex_list,
     sql_statement_with_post_compile_to_string,
 )
 from tests.test_utils import (
@@ -239,6 +244,140 @@ def test_get_unexpected_indices_for_single_pandas_named_index_without_column_val
     assert unexpected_index_list == unexpected_index_list_one_index_column_without_column_values
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "exclude_unexpected_values,expected_fixture_name",
+    [
+        (False, "unexpected_index_list_one_index_column"),
+        (True, "unexpected_index_list_one_index_column_without_column_values"),
+    ],
+)
+def test_compute_unexpected_pandas_indices_named_unexpected_index_columns(
+    pandas_animals_dataframe_for_unexpected_rows_and_index,
+    exclude_unexpected_values: bool,
+    expected_fixture_name: str,
+    request,
+):
+    dataframe: pd.DataFrame = pandas_animals_dataframe_for_unexpected_rows_and_index
+
+    unexpected_index_list = compute_unexpected_pandas_indices(
+        domain_records_df=dataframe,
+        expectation_domain_column_list=["animals"],
+        result_format={
+            "unexpected_index_column_names": ["pk_1"],
+            "exclude_unexpected_values": exclude_unexpected_values,
+        },
+        execution_engine=None,  # type: ignore[arg-type] # not used for named columns
+        metrics={"table.columns": list(dataframe.columns)},
+    )
+    assert unexpected_index_list == request.getfixturevalue(expected_fixture_name)
+
+    assert (
+        compute_unexpected_pandas_indices(
+            domain_records_df=dataframe.iloc[:0],
+            expectation_domain_column_list=["animals"],
+            result_format={
+                "unexpected_index_column_names": ["pk_1"],
+                "exclude_unexpected_values": exclude_unexpected_values,
+            },
+            execution_engine=None,  # type: ignore[arg-type] # not used for named columns
+            metrics={"table.columns": list(dataframe.columns)},
+        )
+        == []
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "regex_list,capturing,expected_regex",
+    [
+        pytest.param(["^a"], False, "^a", id="single"),
+        pytest.param(["^a", "b$"], False, "(?:^a)|(?:b$)", id="non_capturing"),
+        pytest.param(["^a", "b$"], True, "(^a)|(b$)", id="capturing"),
+        pytest.param(["(a)\\1", "b"], False, None, id="backreference"),
+        pytest.param(["a", "(?i)b"], False, None, id="global_flag"),
+        pytest.param(["(?P<x>a)", "(?P<x>b)"], False, None, id="duplicate_named_group"),
+        pytest.param(["(?<x>a)", "(?<x>b)"], True, None, id="duplicate_java_named_group"),
+        pytest.param(
+            ["(?P<x>a)", "(?P<y>b)"], False, "(?:(?P<x>a))|(?:(?P<y>b))", id="distinct_named_groups"
+        ),
+    ],
+)
+def test_combine_regex_list(regex_list: List[str], capturing: bool, expected_regex: str | None):
+    assert combine_regex_list(regex_list=regex_list, capturing=capturing) == expected_regex
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "regex_list,match_on,expected_matches",
+    [
+        pytest.param(["^a", "c$"], "any", [True, True, False, True], id="any"),
+        pytest.param(["^a", "c$"], "all", [True, False, False, True], id="all"),
+        pytest.param(["(.)\\1", "^b"], "any", [False, True, True, True], id="any_backreference"),
+        pytest.param(["(?i)A", "b"], "any", [True, True, True, True], id="any_global_flag"),
+        pytest.param(
+            ["(?P<x>^a)", "(?P<x>d$)"], "any", [True, False, True, True], id="any_duplicate_group"
+        ),
+    ],
+)
+def test_match_pandas_regex_list(
+    regex_list: List[str], match_on: str, expected_matches: List[bool]
+):
+    import pandas as pd
+
+    column = pd.Series(["abc", "bbc", "bcd", "aac"], index=[3, 1, 4, 5])
+
+    matches = match_pandas_regex_list(column=column, regex_list=regex_list, match_on=match_on)
+
+    assert matches.tolist() == expected_matches
+    assert matches.index.tolist() == column.index.tolist()
+
+
+@pytest.mark.unit
+def test_map_pandas_distinct_values():
+    import numpy as np
+    import pandas as pd
+
+    column = pd.Series(["1", "x", "1", None, "x", np.nan], index=[5, 4, 3, 2, 1, 0])
+    calls: List[object] = []
+
+    def is_digit(value) -> bool:
+        calls.append(value)
+        return isinstance(value, str) and value.isdigit()
+
+    matches = map_pandas_distinct_values(column=column, func=is_digit)
+
+    assert matches.tolist() == [True, False, True, False, False, False]
+    assert matches.index.tolist() == column.index.tolist()
+    # Each distinct value is checked once; missing values are checked row by row
+    assert len(calls) == 4
+
+    unhashable_column = pd.Series([["1"], ["x"]])
+    assert map_pandas_distinct_values(
+        column=unhashable_column, func=lambda value: value == ["1"]
+    ).tolist() == [True, False]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "document,expected_value",
+    [
+        pytest.param('{"a": [1, 2.5, "b"]}', {"a": [1, 2.5, "b"]}, id="object"),
+        pytest.param("[NaN]", None, id="nan"),
+        pytest.param(str(2**70), 2**70, id="big_integer"),
+    ],
+)
+def test_json_loads(document: str, expected_value):
+    value = json_loads(document)
+    if expected_value is None:
+        assert value[0] != value[0]
+    else:
+        assert value == expected_value
+
+    with pytest.raises(ValueError):
+        json_loads(document[:-1] + "!")
+
+
 @pytest.mark.unit
 def test_get_unexpected_indices_for_multiple_pandas_named_indices(
     pandas_animals_dataframe_for_unexpected_rows_and_index,
@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+import great_expectations as gx
+from great_expectations.experimental.rule_based_profiler.domain_builder import (
+    CategoricalColumnDomainBuilder,
+)
+
+
+@pytest.mark.filesystem
+def test_approximate_cardinality_rules_out_columns_before_exact_check(mocker):
+    context = gx.get_context(mode="ephemeral")
+    asset = context.data_sources.add_pandas("my_datasource").add_dataframe_asset("my_asset")
+    num_rows = 200
+    batch_request = asset.build_batch_request(
+        options={
+            "dataframe": pd.DataFrame(
+                {
+                    "few_values": [i % 3 for i in range(num_rows)],
+                    "limit_values": [i % 10 for i in range(num_rows)],
+                    "within_margin_values": [i % 11 for i in range(num_rows)],
+                    "many_values": list(range(num_rows)),
+                }
+            )
+        }
+    )
+    domain_builder = CategoricalColumnDomainBuilder(
+        exclude_column_name_suffixes=[],
+        max_unique_values=10,
+        approximate_cardinality=True,
+        data_context=context,
+    )
+    exact_check = mocker.spy(domain_builder, "_column_names_meeting_cardinality_limit")
+
+    domains = domain_builder.get_domains(rule_name="my_rule", batch_request=batch_request)
+
+    # Only the estimate that clearly exceeds the limit is ruled out without an exact count; the
+    # one within the margin of error of the estimate is left to the exact check.
+    assert set(exact_check.call_args.kwargs["metrics_for_cardinality_check"]) == {
+        "few_values",
+        "limit_values",
+        "within_margin_values",
+    }
+    assert [domain.domain_kwargs["column"] for domain in domains] == [
+        "few_values",
+        "limit_values",
+    ]
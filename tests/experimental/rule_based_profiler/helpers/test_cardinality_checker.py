@@ -0,0 +1,25 @@
+import pytest
+
+from great_expectations.experimental.rule_based_profiler.helpers.cardinality_checker import (
+    CardinalityChecker,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "limit_kwargs,metric_value,expected_result",
+    [
+        pytest.param({"max_unique_values": 10}, 10, False, id="absolute_at_limit"),
+        pytest.param({"max_unique_values": 10}, 11, False, id="absolute_within_margin"),
+        pytest.param({"max_unique_values": 10}, 12, True, id="absolute_beyond_margin"),
+        pytest.param({"max_proportion_unique": 0.5}, 0.55, False, id="relative_within_margin"),
+        pytest.param({"max_proportion_unique": 0.5}, 0.56, True, id="relative_beyond_margin"),
+    ],
+)
+def test_cardinality_clearly_exceeds_limit(limit_kwargs, metric_value, expected_result):
+    cardinality_checker = CardinalityChecker(**limit_kwargs)
+
+    assert (
+        cardinality_checker.cardinality_clearly_exceeds_limit(metric_value=metric_value)
+        is expected_result
+    )
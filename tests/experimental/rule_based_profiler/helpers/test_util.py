@@ -0,0 +1,211 @@
+import threading
+import time
+
+import pytest
+
+from great_expectations.experimental.rule_based_profiler.helpers import util
+from great_expectations.experimental.rule_based_profiler.helpers.util import (
+    get_batch_ids,
+    get_validator,
+    validator_cache_scope,
+)
+
+BATCH_REQUEST = {"datasource_name": "my_datasource", "data_asset_name": "my_asset", "options": {}}
+OTHER_BATCH_REQUEST = {
+    "datasource_name": "my_datasource",
+    "data_asset_name": "my_other_asset",
+    "options": {},
+}
+
+
+@pytest.fixture
+def get_validator_with_expectation_suite(mocker):
+    return mocker.patch.object(
+        util,
+        "get_validator_with_expectation_suite",
+        side_effect=lambda **kwargs: mocker.MagicMock(),
+    )
+
+
+@pytest.fixture
+def data_context(mocker):
+    context = mocker.MagicMock()
+    context.get_last_batch.side_effect = lambda batch_request: mocker.MagicMock(
+        id=f"{batch_request.data_asset_name}_batch"
+    )
+    return context
+
+
+@pytest.mark.unit
+def test_validator_cache_scope_shares_validator_for_batch_request(
+    get_validator_with_expectation_suite, data_context
+):
+    with validator_cache_scope():
+        validator = get_validator(
+            purpose="domain_builder", data_context=data_context, batch_request=BATCH_REQUEST
+        )
+        assert (
+            get_validator(
+                purpose="parameter_builder",
+                data_context=data_context,
+                batch_request=dict(BATCH_REQUEST),
+            )
+            is validator
+        )
+        assert get_batch_ids(data_context=data_context, batch_request=BATCH_REQUEST) == [
+            "my_asset_batch"
+        ]
+        assert get_batch_ids(data_context=data_context, batch_request=BATCH_REQUEST) == [
+            "my_asset_batch"
+        ]
+
+    assert get_validator_with_expectation_suite.call_count == 1
+    assert data_context.get_last_batch.call_count == 1
+
+
+@pytest.mark.unit
+def test_validator_cache_scope_misses_for_other_batch_request_or_purpose(
+    get_validator_with_expectation_suite, data_context
+):
+    with validator_cache_scope():
+        validator = get_validator(
+            purpose="domain_builder", data_context=data_context, batch_request=BATCH_REQUEST
+        )
+        other_validator = get_validator(
+            purpose="domain_builder", data_context=data_context, batch_request=OTHER_BATCH_REQUEST
+        )
+        # Loading the last batch is cached separately from building a validator
+        get_batch_ids(data_context=data_context, batch_request=BATCH_REQUEST)
+
+    assert other_validator is not validator
+    assert get_validator_with_expectation_suite.call_count == 2
+    assert data_context.get_last_batch.call_count == 1
+
+
+@pytest.mark.unit
+def test_nested_validator_cache_scope_reuses_outer_cache(
+    get_validator_with_expectation_suite, data_context
+):
+    with validator_cache_scope():
+        validator = get_validator(
+            purpose="domain_builder", data_context=data_context, batch_request=BATCH_REQUEST
+        )
+        with validator_cache_scope():
+            assert (
+                get_validator(
+                    purpose="domain_builder",
+                    data_context=data_context,
+                    batch_request=BATCH_REQUEST,
+                )
+                is validator
+            )
+
+        # Leaving the nested scope does not discard the outer cache
+        assert (
+            get_validator(
+                purpose="domain_builder", data_context=data_context, batch_request=BATCH_REQUEST
+            )
+            is validator
+        )
+
+    assert get_validator_with_expectation_suite.call_count == 1
+
+
+@pytest.mark.unit
+def test_validators_are_not_cached_outside_validator_cache_scope(
+    get_validator_with_expectation_suite, data_context
+):
+    with validator_cache_scope():
+        get_validator(
+            purpose="domain_builder", data_context=data_context, batch_request=BATCH_REQUEST
+        )
+
+    validator = get_validator(
+        purpose="domain_builder", data_context=data_context, batch_request=BATCH_REQUEST
+    )
+    assert (
+        get_validator(
+            purpose="domain_builder", data_context=data_context, batch_request=BATCH_REQUEST
+        )
+        is not validator
+    )
+    get_batch_ids(data_context=data_context, batch_request=BATCH_REQUEST)
+    get_batch_ids(data_context=data_context, batch_request=BATCH_REQUEST)
+
+    assert get_validator_with_expectation_suite.call_count == 3
+    assert data_context.get_last_batch.call_count == 2
+
+
+@pytest.mark.unit
+def test_validator_cache_with_execution_engine_leases_shares_validators(
+    get_validator_with_expectation_suite, data_context
+):
+    validator_cache = util._ValidatorCache()
+    leases = util._ExecutionEngineLeases()
+    validators = []
+    for _ in range(2):
+        with validator_cache_scope(
+            validator_cache=validator_cache.with_execution_engine_leases(
+                execution_engine_leases=leases
+            )
+        ):
+            validators.append(
+                get_validator(
+                    purpose="domain_builder", data_context=data_context, batch_request=BATCH_REQUEST
+                )
+            )
+
+    assert validators[0] is validators[1]
+    assert get_validator_with_expectation_suite.call_count == 1
+    # Leaving each scope released its execution engine for the next one.
+    assert leases._holders == {}
+
+
+@pytest.mark.unit
+def test_execution_engine_leases_give_one_owner_at_a_time_use_of_an_engine():
+    leases = util._ExecutionEngineLeases()
+    execution_engine = object()
+    first_owner, second_owner = object(), object()
+    second_owner_acquired = threading.Event()
+
+    leases.acquire(owner=first_owner, execution_engine=execution_engine)
+    # Reacquiring an engine already held is a no-op.
+    leases.acquire(owner=first_owner, execution_engine=execution_engine)
+
+    def acquire_for_second_owner():
+        leases.acquire(owner=second_owner, execution_engine=execution_engine)
+        second_owner_acquired.set()
+
+    thread = threading.Thread(target=acquire_for_second_owner)
+    thread.start()
+    assert not second_owner_acquired.wait(timeout=0.1)
+
+    leases.release_all(owner=first_owner)
+    assert second_owner_acquired.wait(timeout=5)
+    thread.join()
+
+
+@pytest.mark.unit
+def test_execution_engine_leases_refuse_to_deadlock():
+    leases = util._ExecutionEngineLeases()
+    first_engine, second_engine = object(), object()
+    first_owner, second_owner = object(), object()
+
+    leases.acquire(owner=first_owner, execution_engine=first_engine)
+    leases.acquire(owner=second_owner, execution_engine=second_engine)
+
+    thread = threading.Thread(
+        target=leases.acquire,
+        kwargs={"owner": first_owner, "execution_engine": second_engine},
+    )
+    thread.start()
+    # Wait until the first owner is waiting for the second engine.
+    while first_owner not in leases._waiting_for:
+        time.sleep(0.01)
+
+    with pytest.raises(util._ExecutionEngineLeaseConflict):
+        leases.acquire(owner=second_owner, execution_engine=first_engine)
+
+    leases.release_all(owner=second_owner)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
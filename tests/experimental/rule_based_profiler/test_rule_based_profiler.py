@@ -0,0 +1,177 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+import great_expectations as gx
+from great_expectations.experimental.rule_based_profiler.helpers.util import (
+    _ExecutionEngineLeaseConflict,
+)
+from great_expectations.experimental.rule_based_profiler.rule.rule_state import RuleState
+from great_expectations.experimental.rule_based_profiler.rule_based_profiler import (
+    RuleBasedProfiler,
+)
+
+
+def _build_column_max_rule(column_name: str) -> dict:
+    return {
+        "domain_builder": {
+            "class_name": "ColumnDomainBuilder",
+            "module_name": "great_expectations.experimental.rule_based_profiler.domain_builder",
+            "include_column_names": [column_name],
+        },
+        "parameter_builders": [
+            {
+                "class_name": "MetricMultiBatchParameterBuilder",
+                "module_name": "great_expectations.experimental.rule_based_profiler.parameter_builder",  # noqa: E501
+                "name": "column_max",
+                "metric_name": "column.max",
+                "metric_domain_kwargs": "$domain.domain_kwargs",
+                "enforce_numeric_metric": True,
+                "replace_nan_with_zero": True,
+            },
+        ],
+        "expectation_configuration_builders": [
+            {
+                "class_name": "DefaultExpectationConfigurationBuilder",
+                "module_name": "great_expectations.experimental.rule_based_profiler.expectation_configuration_builder",  # noqa: E501
+                "expectation_type": "expect_column_max_to_be_between",
+                "column": "$domain.domain_kwargs.column",
+                "min_value": "$parameter.column_max.value[-1]",
+                "max_value": "$parameter.column_max.value[-1]",
+            },
+        ],
+    }
+
+
+def _build_rules(mocker, outcomes: list) -> list:
+    """Mock rules that finish in reverse order, each returning its state or raising its error."""
+    rules = []
+    for idx, outcome in enumerate(outcomes):
+        rule = mocker.Mock()
+        rule.name = f"rule_{idx}"
+        delay = 0.05 * (len(outcomes) - idx)
+
+        def run(rule=rule, delay=delay, outcome=outcome, **kwargs):
+            time.sleep(delay)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return RuleState(rule=rule)
+
+        rule.run.side_effect = run
+        rules.append(rule)
+
+    return rules
+
+
+def _run_rules_concurrently(profiler: RuleBasedProfiler, rules: list) -> None:
+    profiler._run_rules_concurrently(
+        rules=rules, max_workers=len(rules), rule_kwargs={}, pbar_kwargs={"disable": True}
+    )
+
+
+@pytest.mark.unit
+def test_run_rules_concurrently_keeps_rule_order(mocker):
+    profiler = RuleBasedProfiler(name="my_profiler", config_version=1.0)
+    rules = _build_rules(mocker, outcomes=[None, None, None])
+
+    _run_rules_concurrently(profiler, rules)
+
+    assert [rule_state.rule for rule_state in profiler.rule_states] == rules
+
+
+@pytest.mark.unit
+def test_run_rules_concurrently_captures_exceptions(mocker):
+    profiler = RuleBasedProfiler(name="my_profiler", config_version=1.0, catch_exceptions=True)
+    rules = _build_rules(mocker, outcomes=[None, ValueError("my error"), None])
+
+    _run_rules_concurrently(profiler, rules)
+
+    assert [rule_state.rule for rule_state in profiler.rule_states] == rules
+    assert [rule_state.exception_traceback is not None for rule_state in profiler.rule_states] == [
+        False,
+        True,
+        False,
+    ]
+    assert profiler.rule_states[1].exception_traceback.exception_message == "my error"
+
+
+@pytest.mark.unit
+def test_run_rules_concurrently_raises_without_catch_exceptions(mocker):
+    profiler = RuleBasedProfiler(name="my_profiler", config_version=1.0)
+    rules = _build_rules(mocker, outcomes=[None, ValueError("my error")])
+
+    with pytest.raises(ValueError, match="my error"):
+        _run_rules_concurrently(profiler, rules)
+
+
+@pytest.mark.unit
+def test_run_rules_concurrently_reruns_rules_with_execution_engine_lease_conflicts(mocker):
+    profiler = RuleBasedProfiler(name="my_profiler", config_version=1.0, catch_exceptions=True)
+    rules = _build_rules(mocker, outcomes=[None, None])
+    rules[0].run.side_effect = [
+        _ExecutionEngineLeaseConflict(message="my conflict"),
+        RuleState(rule=rules[0]),
+    ]
+
+    _run_rules_concurrently(profiler, rules)
+
+    assert [rule_state.rule for rule_state in profiler.rule_states] == rules
+    assert all(rule_state.exception_traceback is None for rule_state in profiler.rule_states)
+    assert rules[0].run.call_count == 2
+    assert rules[1].run.call_count == 1
+
+
+@pytest.mark.filesystem
+def test_concurrent_run_matches_sequential_run(mocker):
+    context = gx.get_context(mode="ephemeral")
+    asset = context.data_sources.add_pandas("my_datasource").add_dataframe_asset("my_asset")
+    batch_request = asset.build_batch_request(
+        options={"dataframe": pd.DataFrame({"a": [1, 2, 3], "b": [10.0, 30.0, 20.0]})}
+    )
+    rules = {
+        "rule_a": _build_column_max_rule("a"),
+        "rule_b": _build_column_max_rule("b"),
+        "rule_a_again": _build_column_max_rule("a"),
+    }
+
+    def run_profiler(max_workers: int) -> list:
+        profiler = RuleBasedProfiler(
+            name="my_profiler", config_version=1.0, rules=rules, data_context=context
+        )
+        return profiler.run(
+            batch_request=batch_request, max_workers=max_workers
+        ).expectation_configurations
+
+    execution_engine = context.data_sources.get("my_datasource").get_execution_engine()
+    load_batch_list = execution_engine.batch_manager.load_batch_list
+    active_threads = []
+
+    def assert_exclusive_load_batch_list(*args, **kwargs):
+        # Rules sharing an execution engine never use it at the same time.
+        active_threads.append(threading.get_ident())
+        try:
+            assert len(active_threads) == 1
+            time.sleep(0.01)
+            return load_batch_list(*args, **kwargs)
+        finally:
+            active_threads.remove(threading.get_ident())
+
+    load_batch_list_mock = mocker.patch.object(
+        execution_engine.batch_manager,
+        "load_batch_list",
+        side_effect=assert_exclusive_load_batch_list,
+    )
+
+    sequential_expectation_configurations = run_profiler(max_workers=1)
+    sequential_load_batch_list_call_count = load_batch_list_mock.call_count
+    load_batch_list_mock.reset_mock()
+
+    assert run_profiler(max_workers=3) == sequential_expectation_configurations
+    # Concurrent rules share loaded batches, just like sequential ones.
+    assert load_batch_list_mock.call_count == sequential_load_batch_list_call_count
+    assert [
+        expectation_configuration.kwargs["max_value"]
+        for expectation_configuration in sequential_expectation_configurations
+    ] == [3.0, 30.0, 3.0]
@@ -1,18 +1,31 @@
+import decimal
 import os
 import shutil
 from typing import Dict
 
+import numpy as np
 import pytest
 
+from great_expectations.core import ExpectationSuite, ExpectationSuiteValidationResult
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context import get_context
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
-from great_expectations.data_context.store import ExpectationsStore, ValidationResultsStore
+from great_expectations.data_context.store import (
+    ExpectationsStore,
+    HtmlSiteStore,
+    ValidationResultsStore,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
+from great_expectations.render.renderer import site_builder as site_builder_module
 
 # module level markers
 pytestmark = pytest.mark.filesystem
@@ -125,3 +138,244 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     profiling_site_section_builder = site_section_builders["profiling"]
     assert isinstance(validations_site_section_builder.source_store, ExpectationsStore)
     assert profiling_site_section_builder.run_name_filter == {"equals": "custom_profiling_filter"}
+
+
+def test_site_index_builder_updates_index_manifest_incrementally(tmp_path, mocker):
+    context = get_context(mode="file", project_root_dir=str(tmp_path))
+    context.suites.add(ExpectationSuite(name="my_suite"))
+
+    def store_validation_result(run_name: str) -> ValidationResultIdentifier:
+        key = ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(name="my_suite"),
+            run_id=RunIdentifier(run_name=run_name),
+            batch_identifier="my_batch",
+        )
+        context.validation_results_store.set(
+            key,
+            ExpectationSuiteValidationResult(
+                success=True, results=[], suite_name="my_suite", meta={"run_id": key.run_id}
+            ),
+        )
+        return key
+
+    first_key = store_validation_result("first_run")
+    context.build_data_docs()
+
+    second_key = store_validation_result("second_run")
+    get_validation_result = mocker.spy(context, "get_validation_result")
+    list_keys = mocker.spy(context.validation_results_store, "list_keys")
+
+    context.build_data_docs(resource_identifiers=[second_key])
+
+    # Only the new result is read, and the stores are not re-listed
+    assert get_validation_result.call_count == 1
+    assert get_validation_result.call_args.kwargs["run_id"] == second_key.run_id
+    assert list_keys.call_count == 0
+
+    site_builder = context._init_site_builder_for_data_docs_site_creation(
+        site_name="local_site", site_config=context.variables.data_docs_sites["local_site"]
+    )
+    manifest = site_builder.site_index_builder._load_index_manifest()
+    assert manifest.expectation_suite_keys == {ExpectationSuiteIdentifier(name="my_suite")}
+    assert set(manifest.validation_result_info) == {first_key, second_key}
+    assert all(info["validation_success"] for info in manifest.validation_result_info.values())
+
+    # A full build reconciles the manifest with the stores, re-reading every result
+    context.validation_results_store.remove_key(first_key)
+    context.validation_results_store.set(
+        second_key,
+        ExpectationSuiteValidationResult(
+            success=False, results=[], suite_name="my_suite", meta={"run_id": second_key.run_id}
+        ),
+    )
+    context.build_data_docs()
+    manifest = site_builder.site_index_builder._load_index_manifest()
+    assert set(manifest.validation_result_info) == {second_key}
+    assert manifest.validation_result_info[second_key]["validation_success"] is False
+
+
+@pytest.mark.unit
+def test_site_index_manifest_round_trips_non_native_json_values():
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="my_suite"),
+        run_id=RunIdentifier(run_name="my_run"),
+        batch_identifier="my_batch",
+    )
+    manifest = site_builder_module._SiteIndexManifest(
+        expectation_suite_keys={ExpectationSuiteIdentifier(name="my_suite")},
+        validation_result_info={
+            key: {
+                "validation_success": np.bool_(True),
+                "asset_name": "my_asset",
+                "batch_kwargs": {},
+                "batch_spec": {"limit": np.int64(10), "fraction": decimal.Decimal("0.5")},
+            }
+        },
+    )
+
+    loaded_manifest = site_builder_module._SiteIndexManifest.from_json(manifest.to_json())
+
+    assert loaded_manifest.expectation_suite_keys == manifest.expectation_suite_keys
+    assert loaded_manifest.validation_result_info == {
+        key: {
+            "validation_success": True,
+            "asset_name": "my_asset",
+            "batch_kwargs": {},
+            "batch_spec": {"limit": 10, "fraction": 0.5},
+        }
+    }
+
+
+def test_site_section_builder_renders_pages_in_worker_processes(tmp_path):
+    context = get_context(mode="file", project_root_dir=str(tmp_path))
+    suite_names = [f"suite_{i}" for i in range(3)]
+    for suite_name in suite_names:
+        context.suites.add(ExpectationSuite(name=suite_name))
+
+    site_config = context.variables.data_docs_sites["local_site"]
+    site_config["site_section_builders"] = {"expectations": {"max_workers": 2}}
+    site_builder = context._init_site_builder_for_data_docs_site_creation(
+        site_name="local_site", site_config=site_config
+    )
+    section_builder = site_builder.site_section_builders["expectations"]
+    assert section_builder.max_workers == 2
+
+    section_builder.build()
+
+    target_backend = site_builder.target_store.store_backends[ExpectationSuiteIdentifier]
+    for suite_name in suite_names:
+        assert target_backend.has_key(ExpectationSuiteIdentifier(name=suite_name).to_tuple())
+
+
+def test_page_render_worker_uses_in_memory_project_config(tmp_path):
+    context = get_context(mode="file", project_root_dir=str(tmp_path))
+    context.suites.add(ExpectationSuite(name="my_suite"))
+    # Not saved to great_expectations.yml
+    context.config.data_docs_sites["unsaved_site"] = {"class_name": "SiteBuilder"}
+
+    site_builder = context._init_site_builder_for_data_docs_site_creation(
+        site_name="local_site", site_config=context.variables.data_docs_sites["local_site"]
+    )
+    section_builder = site_builder.site_section_builders["expectations"]
+    site_builder_module._init_page_render_worker(
+        type(section_builder),
+        context.root_directory,
+        context.config,
+        context.runtime_environment,
+        section_builder._worker_config,
+    )
+
+    worker_section_builder = site_builder_module._page_render_worker_section_builder
+    assert "unsaved_site" in worker_section_builder.data_context.config.data_docs_sites
+    resource_key, viewable_content, error_message, _ = site_builder_module._render_page_in_worker(
+        ExpectationSuiteIdentifier(name="my_suite"), None
+    )
+    assert resource_key == ExpectationSuiteIdentifier(name="my_suite")
+    assert error_message is None
+    assert "my_suite" in viewable_content
+
+
+def test_page_render_worker_must_be_initialized(mocker):
+    mocker.patch.object(site_builder_module, "_page_render_worker_section_builder", None)
+
+    with pytest.raises(RuntimeError, match="_init_page_render_worker"):
+        site_builder_module._render_page_in_worker(
+            ExpectationSuiteIdentifier(name="my_suite"), None
+        )
+
+
+def test_site_section_builder_renders_pages_in_process_for_ephemeral_context(mocker):
+    context = get_context(mode="ephemeral")
+    for suite_name in ("suite_a", "suite_b"):
+        context.suites.add(ExpectationSuite(name=suite_name))
+
+    section_builder = site_builder_module.DefaultSiteSectionBuilder(
+        name="expectations",
+        data_context=context,
+        target_store=mocker.Mock(get_page_hash=mocker.Mock(return_value=None)),
+        source_store_name=context.expectations_store_name,
+        renderer={"class_name": "ExpectationSuitePageRenderer"},
+        max_workers=2,
+    )
+    process_pool = mocker.patch("concurrent.futures.ProcessPoolExecutor")
+
+    section_builder.build()
+
+    process_pool.assert_not_called()
+    assert section_builder.target_store.set.call_count == 2
+
+
+def test_site_section_builder_skips_pages_with_unchanged_source(tmp_path, mocker):
+    context = get_context(mode="file", project_root_dir=str(tmp_path))
+    unchanged_suite = context.suites.add(ExpectationSuite(name="unchanged_suite"))
+    changed_suite = context.suites.add(ExpectationSuite(name="changed_suite"))
+    context.build_data_docs()
+
+    set_page = mocker.spy(HtmlSiteStore, "set")
+
+    def rendered_suite_names() -> set:
+        suite_names = {
+            call.args[1].resource_identifier.name
+            for call in set_page.call_args_list
+            if isinstance(call.args[1].resource_identifier, ExpectationSuiteIdentifier)
+        }
+        set_page.reset_mock()
+        return suite_names
+
+    changed_suite.meta["notes"] = "changed"
+    changed_suite.save()
+    context.build_data_docs()
+    assert rendered_suite_names() == {"changed_suite"}
+
+    # A page that has gone missing is rendered again
+    site_builder = context._init_site_builder_for_data_docs_site_creation(
+        site_name="local_site", site_config=context.variables.data_docs_sites["local_site"]
+    )
+    site_builder.target_store.store_backends[ExpectationSuiteIdentifier].remove_key(
+        ExpectationSuiteIdentifier(name=unchanged_suite.name).to_tuple()
+    )
+    context.build_data_docs()
+    assert rendered_suite_names() == {"unchanged_suite"}
+
+    context.build_data_docs(force_rebuild=True)
+    assert rendered_suite_names() == {"unchanged_suite", "changed_suite"}
+
+
+def test_site_section_builder_rerenders_pages_after_custom_styles_change(tmp_path, mocker):
+    context = get_context(mode="file", project_root_dir=str(tmp_path))
+    context.suites.add(ExpectationSuite(name="my_suite"))
+    styles_directory = os.path.join(  # noqa: PTH118
+        context.plugins_directory, "custom_data_docs", "styles"
+    )
+    os.makedirs(styles_directory, exist_ok=True)  # noqa: PTH103
+    styles_path = os.path.join(styles_directory, "data_docs_custom_styles.css")  # noqa: PTH118
+    with open(styles_path, "w") as f:
+        f.write("body { color: black; }")
+    context.build_data_docs()
+
+    set_page = mocker.spy(HtmlSiteStore, "set")
+    context.build_data_docs()
+    assert set_page.call_count == 0
+
+    with open(styles_path, "w") as f:
+        f.write("body { color: red; }")
+    context.build_data_docs()
+    assert set_page.call_count == 1
+
+
+def test_site_section_builder_only_touches_hashes_of_built_pages(tmp_path, mocker):
+    context = get_context(mode="file", project_root_dir=str(tmp_path))
+    for suite_name in ("suite_a", "suite_b", "suite_c"):
+        context.suites.add(ExpectationSuite(name=suite_name))
+    context.build_data_docs()
+
+    get_page_hash = mocker.spy(HtmlSiteStore, "get_page_hash")
+    set_page_hash = mocker.spy(HtmlSiteStore, "set_page_hash")
+    suite = context.suites.get("suite_b")
+    suite.meta["notes"] = "changed"
+    suite.save()
+
+    context.build_data_docs(resource_identifiers=[ExpectationSuiteIdentifier(name="suite_b")])
+
+    assert [call.args[1].name for call in get_page_hash.call_args_list] == ["suite_b"]
+    assert [call.args[1].name for call in set_page_hash.call_args_list] == ["suite_b"]
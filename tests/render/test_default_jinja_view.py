@@ -604,3 +604,27 @@ def test_render_text():
         .replace("\t", "")
         .replace("\n", "")
     )
+
+
+def test_views_share_jinja_environment_by_class_and_loader_configuration(tmp_path):
+    component_view = gx.render.view.view.DefaultJinjaComponentView()
+    assert gx.render.view.view.DefaultJinjaComponentView().env is component_view.env
+    assert gx.render.view.view.DefaultJinjaSectionView().env is not component_view.env
+    assert (
+        gx.render.view.view.DefaultJinjaComponentView(custom_views_directory=str(tmp_path)).env
+        is not component_view.env
+    )
+
+    text_component_content = TextContent(
+        **{"content_block_type": "text", "text": ["hello"], "styling": {"classes": ["col-4"]}}
+    ).to_json_dict()
+    document = {
+        "content_block": text_component_content,
+        "section_loop": {"index": 1},
+        "content_block_loop": {"index": 2},
+    }
+    template = component_view.env.get_template("component.j2")
+    assert component_view.render(document) == component_view.render(document)
+    # Rendering neither recompiles the template nor modifies its globals
+    assert component_view.env.get_template("component.j2") is template
+    assert template.globals["now"] is component_view.env.globals["now"]
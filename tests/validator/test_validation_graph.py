@@ -304,7 +304,7 @@ def test_parse_validation_graph(
     ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
         metrics=available_metrics
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    assert len(ready_metrics) == 2 and len(needed_metrics) == 8
 
     # Show that including "nonexistent" metric in dictionary of resolved metrics does not increase ready_metrics count.  # noqa: E501
     available_metrics = {("nonexistent", "nonexistent", "nonexistent"): "NONE"}
@@ -314,7 +314,7 @@ def test_parse_validation_graph(
     ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
         metrics=available_metrics
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    assert len(ready_metrics) == 2 and len(needed_metrics) == 8
 
 
 @pytest.mark.unit
@@ -322,7 +322,7 @@ def test_populate_dependencies(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
 ):
     assert (
-        len(expect_column_value_z_scores_to_be_less_than_expectation_validation_graph.edges) == 33
+        len(expect_column_value_z_scores_to_be_less_than_expectation_validation_graph.edges) == 29
     )
 
 